@@ -1,15 +1,23 @@
-import glob
+import concurrent.futures
+import gc
 import json
 import locale
 import os
-import re
+import sys
+import threading
+import types
 import typing
 import xml.dom.minidom
 from typing import List, Tuple, Dict, Union
 
 import asn1tools
 
+from asn1editor.CompileProcess import CompileProcess
+from asn1editor.ModuleIndex import ModuleIndex
+from asn1editor import TypeDescription
+from asn1editor.SpecCache import SpecCache
 from asn1editor.TypeAugmenter import TypeAugmenter
+from asn1editor.TypeInfoCache import TypeInfoCache
 from asn1editor.ViewControllerFactory import ViewControllerFactory
 from asn1editor.controller.Controller import Controller
 from asn1editor.view.AbstractView import AbstractView
@@ -19,51 +27,48 @@ from asn1editor.view.AbstractViewFactory import AbstractViewFactory
 class ASN1SpecHandler:
     """
     Represents a loaded ASN.1 spec and creates views and controllers for this specification
+
+    Views and controllers are created from codec independent type descriptions, so only the codecs used for encoding and decoding are compiled.
     """
 
-    IMPORTS_REGEX_OUTER = re.compile(r'IMPORTS([\s\S]*);', flags=re.MULTILINE)
-    IMPORTS_REGEX_INNER = re.compile(r'FROM\s*(\S*)', flags=re.MULTILINE)
+    # Identifier of the type descriptions, which can be compiled and precompiled like a codec
+    DESCRIPTION = 'description'
 
-    def __init__(self, file_name: Union[str, List[str]]):
+    def __init__(self, file_name: Union[str, List[str]], spec_cache: typing.Optional[SpecCache] = None, compile_type_only: bool = False):
+        """
+        @param file_name: ASN.1 file name or list of file names. If a single file name is given, the files of imported modules are added.
+        @param spec_cache: Optional cache for compiled specifications
+        @param compile_type_only: If set, creating views and encoding or decoding only compiles the types reachable from the loaded type
+        """
         # This is necessary to enable parsing of stored dates
         try:
             locale.setlocale(locale.LC_TIME, 'C')
         except locale.Error:
             pass
 
-        if isinstance(file_name, str):
-            import_names = []
-            # Preprocess for import statements to automatically resolve other files
-            my_path = os.path.split(os.path.abspath(file_name))[0]
-            with open(file_name, 'r', encoding='utf-8') as f:
-                content = f.read()
-                imports = self.__get_imports(content)
-                for imported_type in imports:
-                    import_names.extend(self.__search_files_for_imported_type(my_path, imported_type))
-                self.__file_names = [os.path.abspath(file_name)] + import_names
-        else:
-            self.__file_names = [os.path.abspath(f) for f in file_name]
+        self.__file_name = file_name
+        self.__file_names = self.__resolve_file_names()
+        self.__file_mtimes = self.__get_mtimes(self.__file_names)
+        # Changed files that were not parsed again successfully yet
+        self.__changed_files: typing.Set[str] = set()
+        self.__parsed: typing.Optional[Dict] = None
+        self.__parsed_files: Dict[str, Dict] = {}
+        self.__closure_modules: Dict[str, typing.Set[str]] = {}
         self.__compiled = {}
+        self.__memory_usage: Dict[str, int] = {}
+        self.__memory_usage_ids: List[Tuple[str, int]] = []
+        self.__spec_cache = spec_cache
+        self.__compile_type_only = compile_type_only
+        self.__load_type: typing.Optional[str] = None
+        self.__used_codecs: List[str] = []
+        # Compilation modifies the shared parse dictionary, so only one codec is compiled at a time
+        self.__compile_lock = threading.RLock()
+        self.__futures_lock = threading.Lock()
+        self.__futures: Dict[str, concurrent.futures.Future] = {}
+        self.__executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.__type_info_cache: typing.Optional[TypeInfoCache] = None
         self._type_name = None
 
-    def __get_imports(self, content: str) -> typing.List[str]:
-        match = re.search(self.IMPORTS_REGEX_OUTER, content)
-        if match is not None:
-            inner = match.group(1)
-            return [i.group(1).lower() for i in re.finditer(self.IMPORTS_REGEX_INNER, inner)]
-        else:
-            return []
-
-    @staticmethod
-    def __search_files_for_imported_type(search_path: str, imported_type: str) -> typing.List[str]:
-        import_names = []
-        dir_files = glob.glob(os.path.join(search_path, '*.asn'))
-        for dir_file in dir_files:
-            dir_file_name = os.path.splitext(os.path.basename(dir_file))[0].lower()
-            if imported_type in dir_file_name or dir_file_name in imported_type:
-                import_names.append(dir_file)
-        return import_names
-
     def get_filenames(self) -> List[str]:
         """
         Returns the file name of the ASN.1 spec loaded and names of dependent ASN.1 spec files
@@ -79,24 +84,388 @@ class ASN1SpecHandler:
     def get_types(self, ) -> List[str]:
         """
         Returns a list of all type names that are defined in the loaded ASN.1 spec
+
+        The spec is compiled for this, use get_type_names for a fast listing.
         """
         types = []
-        compiled = self.get_compiled('oer')
+        description = self.__get_compiled(self.DESCRIPTION, None)
 
-        for module_name, module in compiled.modules.items():
+        for module_name, module in description.items():
             for type_name, compiled_type in module.items():
                 types.append(module_name + '.' + type_name)
         return sorted(types)
 
+    def get_type_names(self) -> List[str]:
+        """
+        Returns a list of all type names that are defined in the loaded ASN.1 spec without compiling it.
+
+        The names are scanned from the module headers and type assignments of the ASN.1 files.
+        """
+        types = []
+        for file_name in self.__file_names:
+            for module in ModuleIndex.get(os.path.dirname(file_name)).get_modules(file_name):
+                types.extend(module.name + '.' + type_name for type_name in module.types)
+        return sorted(set(types))
+
+    def get_parsed(self) -> Dict:
+        """
+        Returns the parsed ASN.1 specification as a dictionary (using asn1tools).
+
+        The files are parsed only once, all codecs are compiled from this dictionary.
+        """
+        if self.__parsed is None:
+            with self.__compile_lock:
+                if self.__parsed is None:
+                    self.__parsed_files = self.__load_cached('parsed_files', lambda: {f: asn1tools.parse_files(f) for f in self.__file_names})
+                    self.__parsed = self.__merge_parsed_files()
+        return self.__parsed
+
+    def get_changed_files(self) -> List[str]:
+        """
+        Returns the ASN.1 files that were modified or removed since the spec was loaded or reloaded
+        """
+        mtimes = self.__get_mtimes(self.__file_names)
+        return [file_name for file_name in self.__file_names if mtimes[file_name] != self.__file_mtimes.get(file_name)]
+
+    def start_reload_process(self) -> typing.Optional[CompileProcess]:
+        """
+        Starts parsing the files that reload parses again in a child process, which keeps the calling thread responsive.
+
+        Pass the result of the finished process to reload.
+
+        @return: The started process or None if no file needs to be parsed
+        """
+        with self.__compile_lock:
+            if self.__parsed is None:
+                return None
+            _, reload_files, _ = self.__get_reload_files()
+        if not reload_files:
+            return None
+        return CompileProcess(sorted(reload_files), None, [], None)
+
+    def reload(self, state: typing.Optional[Dict[str, typing.Any]] = None) -> List[str]:
+        """
+        Reloads the spec after its files were changed.
+
+        Only the changed files and the files of modules that import from them are parsed again. Compiled codecs and type descriptions that depend
+        on the reloaded modules are discarded and compiled again when they are used. If parsing fails, the previously loaded spec is kept and the
+        files are parsed again by the next reload.
+
+        @param state: Result of the process started by start_reload_process. Files that it did not parse are parsed by this function.
+        @return: Names of the reloaded modules
+        """
+        with self.__compile_lock:
+            file_names, reload_files, reload_modules = self.__get_reload_files()
+            if self.__parsed is None:
+                self.__file_names = file_names
+                self.__changed_files.clear()
+                self.__compiled.clear()
+                return []
+
+            parsed = state['parsed_files'] if state is not None else {}
+            parsed_files = {f: (parsed[f] if f in parsed else asn1tools.parse_files(f)) if f in reload_files else self.__parsed_files[f]
+                            for f in file_names}
+            reloaded_modules = {name for f in reload_files for name in parsed_files[f]} | reload_modules
+            self.__changed_files.clear()
+
+            with self.__futures_lock:
+                for future in self.__futures.values():
+                    future.cancel()
+                self.__futures.clear()
+                for compile_id in list(self.__compiled):
+                    _, _, type_name = compile_id.partition(':')
+                    if not type_name or self.__closure_modules.get(type_name, reloaded_modules) & reloaded_modules:
+                        del self.__compiled[compile_id]
+
+            self.__file_names = file_names
+            self.__parsed_files = parsed_files
+            self.__parsed = self.__merge_parsed_files()
+            self.__type_info_cache = None
+
+            return sorted(reloaded_modules)
+
+    def __get_reload_files(self) -> Tuple[List[str], typing.Set[str], typing.Set[str]]:
+        # Remembers the changed files until they are parsed successfully, so later changes of other files do not hide them
+        self.__changed_files.update(self.get_changed_files())
+        file_names = self.__resolve_file_names()
+        self.__file_mtimes = self.__get_mtimes(file_names)
+
+        # Modules that import from changed modules are parsed again, since pre-processing copies information from imported modules
+        changed_files = self.__changed_files | {f for f in file_names if f not in self.__parsed_files}
+        changed_modules = {name for f in changed_files for name in self.__parsed_files.get(f, {})}
+        reload_modules = self.__get_dependent_modules(changed_modules)
+        reload_files = {f for f in file_names if f in changed_files or set(self.__parsed_files.get(f, {})) & reload_modules}
+        return file_names, reload_files, reload_modules
+
+    def __resolve_file_names(self) -> List[str]:
+        if isinstance(self.__file_name, str):
+            # Automatically resolve the files of imported modules
+            return ModuleIndex.get(os.path.dirname(os.path.abspath(self.__file_name))).resolve(self.__file_name)
+        return [os.path.abspath(f) for f in self.__file_name]
+
+    @staticmethod
+    def __get_mtimes(file_names: List[str]) -> Dict[str, typing.Optional[float]]:
+        mtimes = {}
+        for file_name in file_names:
+            try:
+                mtimes[file_name] = os.path.getmtime(file_name)
+            except OSError:
+                mtimes[file_name] = None
+        return mtimes
+
+    def __merge_parsed_files(self) -> Dict:
+        parsed = {}
+        for file_name in self.__file_names:
+            parsed.update(self.__parsed_files[file_name])
+        return parsed
+
+    def __get_dependent_modules(self, module_names: typing.Set[str]) -> typing.Set[str]:
+        dependent_modules = set(module_names)
+        modules = {name: module for parsed in self.__parsed_files.values() for name, module in parsed.items()}
+        changed = True
+        while changed:
+            changed = False
+            for name, module in modules.items():
+                if name not in dependent_modules and dependent_modules & set(module.get('imports', {})):
+                    dependent_modules.add(name)
+                    changed = True
+        return dependent_modules
+
     def get_compiled(self, codec: str) -> asn1tools.compiler.Specification:
         """
         Returns the compiled ASN.1 specification (using asn1tools)
 
+        If a spec cache is set, the compiled specification is loaded from or stored to the cache.
+        If the codec is currently compiled in the background, the function waits for this compilation to finish.
+
         @param codec: ASN.1 coded, see asn1tools.compile_files for a list of valid codecs
         """
-        if codec not in self.__compiled:
-            self.__compiled[codec] = asn1tools.compile_files(self.__file_names, codec)
-        return self.__compiled[codec]
+        return self.__get_compiled(codec, None)
+
+    def precompile(self, codecs: List[str]):
+        """
+        Compiles the given codecs in a background thread.
+
+        Codecs that are already compiled or currently compiling are skipped.
+        If only the loaded type is compiled, the codecs are compiled for this type once it is known.
+
+        @param codecs: ASN.1 codecs to compile or DESCRIPTION to compile the type descriptions
+        """
+        type_name = self.__get_compile_type()
+        if self.__compile_type_only and type_name is None:
+            return
+
+        with self.__futures_lock:
+            for codec in codecs:
+                compile_id = self.__get_compile_id(codec, type_name)
+                if compile_id in self.__compiled or compile_id in self.__futures:
+                    continue
+                if self.__executor is None:
+                    self.__executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='ASN1SpecHandler')
+                self.__futures[compile_id] = self.__executor.submit(self.__compile, codec, type_name)
+
+    def start_compile_process(self, codecs: List[str]) -> typing.Optional[CompileProcess]:
+        """
+        Starts parsing the spec and compiling the given codecs in a child process, which can be cancelled and keeps the calling thread responsive.
+
+        Codecs that are already compiled, currently compiling or stored in the spec cache are skipped. If only the loaded type is compiled, only the
+        spec is parsed in the child process. Pass the result of the finished process to set_state.
+
+        @param codecs: ASN.1 codecs to compile or DESCRIPTION to compile the type descriptions
+        @return: The started process or None if there is nothing to compile
+        """
+        if self.__compile_type_only:
+            codecs = []
+        with self.__futures_lock:
+            codecs = [codec for codec in codecs if codec not in self.__compiled and codec not in self.__futures and not self.__is_cached(codec)]
+
+        parsed = self.__parsed is not None
+        if not codecs and (parsed or self.__is_cached('parsed_files')):
+            return None
+        return CompileProcess(self.__file_names, self.__parsed_files if parsed else None, codecs, self.__spec_cache)
+
+    def get_state(self, codecs: List[str]) -> Dict[str, typing.Any]:
+        """
+        Returns the parsed spec and the given compiled codecs to transfer them to another handler of the same spec, see set_state.
+
+        @param codecs: Codecs to include, they are compiled if necessary
+        """
+        compiled = {codec: self.get_compiled(codec) for codec in codecs}
+        self.get_parsed()
+        return {'parsed_files': self.__parsed_files, 'compiled': compiled}
+
+    def set_state(self, state: Dict[str, typing.Any]):
+        """
+        Takes over the parsed spec and the compiled codecs of another handler of the same spec, see get_state.
+
+        Parts that this handler already parsed or compiled are kept.
+        """
+        with self.__compile_lock:
+            if self.__parsed is None:
+                self.__parsed_files = state['parsed_files']
+                self.__parsed = self.__merge_parsed_files()
+            with self.__futures_lock:
+                for compile_id, compiled in state['compiled'].items():
+                    self.__compiled.setdefault(compile_id, compiled)
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        Returns the estimated memory usage of the parsed spec ('parsed') and of each compiled codec in bytes.
+
+        Objects that are shared between entries are only counted once. The estimation is only repeated if entries were added or removed.
+        """
+        with self.__futures_lock:
+            entries = [('parsed', self.__parsed)] if self.__parsed is not None else []
+            entries += list(self.__compiled.items())
+
+        entry_ids = [(compile_id, id(entry)) for compile_id, entry in entries]
+        if entry_ids != self.__memory_usage_ids:
+            seen = set()
+            self.__memory_usage = {compile_id: self.__estimate_size(entry, seen) for compile_id, entry in entries}
+            self.__memory_usage_ids = entry_ids
+        return self.__memory_usage
+
+    @staticmethod
+    def __estimate_size(entry: typing.Any, seen: typing.Set[int]) -> int:
+        size = 0
+        pending = [entry]
+        while len(pending):
+            obj = pending.pop()
+            if id(obj) in seen or isinstance(obj, (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)):
+                continue
+            seen.add(id(obj))
+            size += sys.getsizeof(obj)
+            pending.extend(gc.get_referents(obj))
+        return size
+
+    def get_used_codecs(self) -> List[str]:
+        """
+        Returns the codecs that were used for encoding or decoding, most recently used first
+        """
+        return self.__used_codecs
+
+    def close(self):
+        """
+        Cancels all pending background compilations
+        """
+        with self.__futures_lock:
+            for future in self.__futures.values():
+                future.cancel()
+            self.__futures.clear()
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=False)
+                self.__executor = None
+
+    def __get_compile_type(self) -> typing.Optional[str]:
+        return self.__load_type if self.__compile_type_only else None
+
+    @staticmethod
+    def __get_compile_id(codec: str, type_name: typing.Optional[str]) -> str:
+        return codec if type_name is None else f'{codec}:{type_name}'
+
+    def __get_compiled(self, codec: str, type_name: typing.Optional[str]) -> typing.Any:
+        compile_id = self.__get_compile_id(codec, type_name)
+        with self.__futures_lock:
+            compiled = self.__compiled.get(compile_id)
+            future = self.__futures.get(compile_id)
+
+        if compiled is None and future is not None:
+            try:
+                compiled = future.result()
+            except concurrent.futures.CancelledError:
+                # The background compilation was cancelled by close or reload
+                pass
+        if compiled is None:
+            compiled = self.__compile(codec, type_name)
+        return compiled
+
+    def __compile(self, codec: str, type_name: typing.Optional[str]) -> typing.Any:
+        compile_id = self.__get_compile_id(codec, type_name)
+        try:
+            with self.__compile_lock:
+                compiled = self.__compiled.get(compile_id)
+                if compile_id not in self.__compiled:
+                    if type_name is None:
+                        compiled = self.__load_cached(compile_id, lambda: self.__compile_dict(self.get_parsed(), codec))
+                    else:
+                        compiled = self.__load_cached(compile_id, lambda: self.__compile_dict(self.__get_type_closure(type_name), codec))
+                    with self.__futures_lock:
+                        self.__compiled[compile_id] = compiled
+            return compiled
+        finally:
+            with self.__futures_lock:
+                self.__futures.pop(compile_id, None)
+
+    def __compile_dict(self, specification: Dict, codec: str) -> typing.Any:
+        if codec == self.DESCRIPTION:
+            return TypeDescription.compile_dict(specification)
+        return asn1tools.compile_dict(specification, codec)
+
+    def __get_type_closure(self, load_type: str) -> Dict:
+        """
+        Returns a copy of the parsed specification that only contains the types reachable from a type.
+        """
+        parsed = self.get_parsed()
+        module_name, _, type_name = load_type.partition('.')
+        if module_name not in parsed or type_name not in parsed[module_name]['types']:
+            raise ValueError(f'Requested type {load_type} not found in ASN.1 spec')
+
+        closure = {name: dict(module, types={}) for name, module in parsed.items()}
+        pending = [(module_name, type_name)]
+        while len(pending):
+            module_name, type_name = pending.pop()
+            if type_name in closure[module_name]['types']:
+                continue
+            type_descriptor = parsed[module_name]['types'][type_name]
+            closure[module_name]['types'][type_name] = type_descriptor
+            for reference in self.__get_references(type_descriptor):
+                pending.extend(self.__resolve_reference(parsed, module_name, reference))
+
+        self.__closure_modules[load_type] = {name for name, module in closure.items() if module['types']}
+        return closure
+
+    @classmethod
+    def __get_references(cls, descriptor: typing.Any) -> typing.Iterator[str]:
+        # Every string in a type descriptor might reference another type, collecting too many is harmless
+        if isinstance(descriptor, str):
+            yield descriptor
+        elif isinstance(descriptor, dict):
+            for key, value in descriptor.items():
+                if key != 'name':
+                    yield from cls.__get_references(value)
+        elif isinstance(descriptor, (list, tuple)):
+            for value in descriptor:
+                yield from cls.__get_references(value)
+
+    @staticmethod
+    def __resolve_reference(parsed: Dict, module_name: str, reference: str) -> List[Tuple[str, str]]:
+        if reference in parsed[module_name]['types']:
+            return [(module_name, reference)]
+        for imported_module_name, imported_names in parsed[module_name]['imports'].items():
+            if reference in imported_names and imported_module_name in parsed and reference in parsed[imported_module_name]['types']:
+                return [(imported_module_name, reference)]
+        # Types in descriptors that were moved to another module during parameterization are not imported
+        return [(name, reference) for name, module in parsed.items() if reference in module['types']]
+
+    def __load_cached(self, cache_id: str, create: typing.Callable[[], typing.Any]) -> typing.Any:
+        if self.__spec_cache is None:
+            return create()
+
+        key = self.__get_cache_key(cache_id)
+        entry = self.__spec_cache.load(key)
+        if entry is None:
+            entry = create()
+            self.__spec_cache.store(key, entry)
+        return entry
+
+    def __is_cached(self, cache_id: str) -> bool:
+        return self.__spec_cache is not None and self.__spec_cache.contains(self.__get_cache_key(cache_id))
+
+    def __get_cache_key(self, cache_id: str) -> str:
+        if cache_id.partition(':')[0] == self.DESCRIPTION:
+            # Type descriptions of another format version must not be loaded
+            cache_id = f'{cache_id}:{TypeDescription.FORMAT_VERSION}'
+        return self.__spec_cache.get_key(self.__file_names, cache_id)
 
     def create_view_controller_for_type(self, load_type: str, view_factory: AbstractViewFactory,
                                         type_augmenter: typing.Optional[TypeAugmenter]) -> Tuple[AbstractView, Controller]:
@@ -104,20 +473,24 @@ class ASN1SpecHandler:
         Creates a view and a controller for a given type name.
         The type name must be a full type name, e.g. 'my_module.my_type', including the module name of the loaded ASN.1 spec.
         If the type name is not found in the loaded ASN.1 spec, a ValueError is raised.
+        The TypeInfo of the elements is shared between all views that are created for the spec with the same type augmenter.
 
         @param load_type: The type name to create a model-view-controller for
         @param view_factory: The view factory to use for creating the view, performs the connection to a view implementation
         @param type_augmenter: The type augmenter to use for creating the view
         @return: A tuple of the root view and the controller
         """
-        compiled = self.get_compiled('oer')
-        for module_name, module in compiled.modules.items():
-            for type_name, compiled_type in module.items():
+        description = self.__get_compiled(self.DESCRIPTION, load_type if self.__compile_type_only else None)
+        for module_name, module in description.items():
+            for type_name, type_description in module.items():
 
                 if module_name + '.' + type_name == load_type:
-                    vc_factory = ViewControllerFactory(view_factory, type_augmenter)
+                    if self.__type_info_cache is None or self.__type_info_cache.type_augmenter is not type_augmenter:
+                        self.__type_info_cache = TypeInfoCache(type_augmenter)
+                    vc_factory = ViewControllerFactory(view_factory, type_augmenter, self.__type_info_cache)
                     self._type_name = type_name
-                    return vc_factory.create(compiled_type)
+                    self.__load_type = load_type
+                    return vc_factory.create(type_description)
 
         raise ValueError(f'Requested type {load_type} not found in ASN.1 spec')
 
@@ -167,12 +540,19 @@ class ASN1SpecHandler:
         """
         Converts a model to a byte sequence according to the loaded specification.
         """
-        compiled = self.get_compiled(codec)
+        self.__use_codec(codec)
+        compiled = self.__get_compiled(codec, self.__get_compile_type())
         return compiled.encode(self._type_name, model[self._type_name], check_constraints=True)
 
     def get_model_from_data(self, data: bytes, codec: str) -> Dict:
         """
         Decodes a byte sequence to a model according to the loaded specification.
         """
-        compiled = self.get_compiled(codec)
+        self.__use_codec(codec)
+        compiled = self.__get_compiled(codec, self.__get_compile_type())
         return {self._type_name: compiled.decode(self._type_name, data)}
+
+    def __use_codec(self, codec: str):
+        if codec in self.__used_codecs:
+            self.__used_codecs.remove(codec)
+        self.__used_codecs.insert(0, codec)
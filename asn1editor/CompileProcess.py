@@ -0,0 +1,123 @@
+import multiprocessing
+import pickle
+import typing
+from typing import Dict, List
+
+from asn1editor.SpecCache import SpecCache
+
+
+class CompileProcess:
+    """
+    Parses an ASN.1 specification and compiles codecs in a child process.
+
+    The calling thread stays responsive, it only has to call poll regularly to read the progress reported by the child process. The compilation is
+    aborted by killing the child process. Only the pickled result is transferred back, it is loaded when get_result is called.
+    """
+
+    PROGRESS = 'progress'
+    RESULT = 'result'
+    ERROR = 'error'
+
+    def __init__(self, file_names: List[str], parsed_files: typing.Optional[Dict[str, Dict]], codecs: List[str], spec_cache: typing.Optional[SpecCache]):
+        """
+        @param file_names: ASN.1 files of the specification
+        @param parsed_files: Already parsed files, which are passed to the child process instead of parsing them again
+        @param codecs: ASN.1 codecs or ASN1SpecHandler.DESCRIPTION to compile
+        @param spec_cache: Optional cache, which is also used by the child process
+        """
+        self.message = 'Starting'
+        self.progress = 0
+        self.max_progress = len(codecs) + 1
+        self.__result: typing.Optional[bytes] = None
+        self.__error: typing.Optional[BaseException] = None
+        self.__finished = False
+
+        # Spawn a fresh interpreter, forking a process with a running GUI is not safe
+        context = multiprocessing.get_context('spawn')
+        self.__connection, child_connection = context.Pipe(duplex=False)
+        self.__process = context.Process(target=_compile, args=(child_connection, file_names, parsed_files, codecs, spec_cache),
+                                         name='CompileProcess', daemon=True)
+        self.__process.start()
+        child_connection.close()
+
+    def poll(self, timeout: float = 0) -> bool:
+        """
+        Reads the messages of the child process and updates message and progress.
+
+        @param timeout: Time in seconds to wait for a message of the child process
+        @return: True if the child process finished, cancelled or failed
+        """
+        try:
+            while not self.__finished and self.__connection.poll(timeout):
+                kind, value = self.__connection.recv()
+                if kind == self.PROGRESS:
+                    self.message = value
+                    self.progress += 1
+                elif kind == self.RESULT:
+                    self.__result = value
+                    self.__finished = True
+                else:
+                    self.__error = value
+                    self.__finished = True
+                timeout = 0
+        except (EOFError, OSError):
+            self.__error = RuntimeError(f'Compile process terminated unexpectedly with exit code {self.__process.exitcode}')
+            self.__finished = True
+
+        if self.__finished:
+            self.__close()
+        return self.__finished
+
+    def cancel(self):
+        """
+        Kills the child process
+        """
+        if not self.__finished:
+            self.__error = RuntimeError('Compilation cancelled')
+            self.__finished = True
+            self.__process.kill()
+            self.__close()
+
+    def get_result(self) -> Dict[str, typing.Any]:
+        """
+        Returns the result of the child process. If the compilation failed in the child process, its exception is raised.
+
+        @return: State as returned by ASN1SpecHandler.get_state
+        """
+        while not self.poll(None):
+            pass
+        if self.__error is not None:
+            raise self.__error
+        return pickle.loads(self.__result)
+
+    def __close(self):
+        self.__connection.close()
+        self.__process.join()
+
+
+def _compile(connection, file_names: List[str], parsed_files: typing.Optional[Dict[str, Dict]], codecs: List[str],
+             spec_cache: typing.Optional[SpecCache]):
+    # Entry point of the child process, the import is delayed since the handler starts this process
+    from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+
+    try:
+        handler = ASN1SpecHandler(file_names, spec_cache)
+        if parsed_files is not None:
+            handler.set_state({'parsed_files': parsed_files, 'compiled': {}})
+        else:
+            connection.send((CompileProcess.PROGRESS, 'Parsing specification'))
+            handler.get_parsed()
+
+        for codec in codecs:
+            connection.send((CompileProcess.PROGRESS, f'Compiling {codec}'))
+            handler.get_compiled(codec)
+
+        connection.send((CompileProcess.RESULT, pickle.dumps(handler.get_state(codecs), pickle.HIGHEST_PROTOCOL)))
+    except Exception as e:
+        try:
+            connection.send((CompileProcess.ERROR, e))
+        except Exception:
+            # The exception itself cannot be pickled
+            connection.send((CompileProcess.ERROR, RuntimeError(f'{type(e).__name__}: {e}')))
+    finally:
+        connection.close()
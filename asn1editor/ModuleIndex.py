@@ -0,0 +1,166 @@
+import glob
+import os
+import re
+import typing
+from typing import Dict, List, Tuple
+
+
+class ModuleInfo:
+    """
+    Represents the header information of an ASN.1 module
+
+    name: Name of the module
+    file_name: File the module is defined in
+    imports: Names of the modules this module imports from
+    types: Names of the types assigned in the module
+    """
+
+    def __init__(self, name: str, file_name: str, imports: List[str], types: List[str]):
+        self.name = name
+        self.file_name = file_name
+        self.imports = imports
+        self.types = types
+
+
+class ModuleIndex:
+    """
+    Index of all ASN.1 modules defined in the files of a directory.
+
+    The index maps each module name from a DEFINITIONS header to the file defining it. It is built once per directory and only files whose
+    modification time changed are scanned again.
+    """
+
+    COMMENT_REGEX = re.compile(r'/\*[\s\S]*?\*/|--.*?(?:--|$)', flags=re.MULTILINE)
+    MODULE_REGEX = re.compile(r'([A-Za-z][\w-]*)\s*(?:{[^}]*}\s*)?DEFINITIONS\b')
+    IMPORTS_REGEX = re.compile(r'\bIMPORTS\b([\s\S]*?);')
+    FROM_REGEX = re.compile(r'\bFROM\s+([A-Za-z][\w-]*)')
+    BEGIN_REGEX = re.compile(r'\bBEGIN\b')
+    TYPE_ASSIGNMENT_REGEX = re.compile(r'(?<![\w-])([A-Z][\w-]*)\s*::=(?=\s*(CLASS\b|{)?)')
+    VALUE_NAME_REGEX = re.compile(r'(?<![\w-])[a-z][\w-]*[ \t]+$')
+
+    __indices: Dict[str, 'ModuleIndex'] = {}
+
+    def __init__(self, directory: str):
+        self.__directory = directory
+        self.__files: Dict[str, Tuple[float, List[ModuleInfo]]] = {}
+        self.__modules: Dict[str, List[ModuleInfo]] = {}
+
+    @classmethod
+    def get(cls, directory: str) -> 'ModuleIndex':
+        """
+        Returns the up-to-date module index of a directory.
+
+        @param directory: Directory containing ASN.1 files
+        @return: Module index
+        """
+        directory = os.path.abspath(directory)
+        if directory not in cls.__indices:
+            cls.__indices[directory] = ModuleIndex(directory)
+        index = cls.__indices[directory]
+        index.update()
+        return index
+
+    def update(self):
+        """
+        Scans all files of the directory that were added or modified since the last update.
+        """
+        files = {}
+        for file_name in glob.glob(os.path.join(self.__directory, '*.asn')):
+            try:
+                mtime = os.path.getmtime(file_name)
+            except OSError:
+                continue
+            cached = self.__files.get(file_name)
+            if cached is not None and cached[0] == mtime:
+                files[file_name] = cached
+            else:
+                files[file_name] = (mtime, self.scan_file(file_name))
+        self.__files = files
+
+        self.__modules = {}
+        for file_name in sorted(self.__files):
+            for module in self.__files[file_name][1]:
+                self.__modules.setdefault(module.name, []).append(module)
+
+    def get_modules(self, file_name: str) -> List[ModuleInfo]:
+        """
+        Returns the modules defined in a file, which is scanned if it is not part of the index.
+        """
+        file_name = os.path.abspath(file_name)
+        if file_name not in self.__files:
+            return self.scan_file(file_name)
+        return self.__files[file_name][1]
+
+    def find_file(self, module_name: str, preferred: typing.Collection[str] = ()) -> typing.Optional[str]:
+        """
+        Returns the file that defines a module.
+
+        @param module_name: Name of the module
+        @param preferred: If the module is defined in several files, a file from this collection is returned if possible
+        @return: File name or None if the module is not defined in any file of the directory
+        """
+        modules = self.__modules.get(module_name, [])
+        for module in modules:
+            if module.file_name in preferred:
+                return module.file_name
+        return modules[0].file_name if modules else None
+
+    def resolve(self, file_name: str) -> List[str]:
+        """
+        Returns a file and all files it transitively imports modules from.
+
+        Imports are resolved by the exact module name. Modules that cannot be found in the directory are ignored.
+
+        @param file_name: ASN.1 file name
+        @return: List of file names, starting with the passed file
+        """
+        file_name = os.path.abspath(file_name)
+        file_names = [file_name]
+        defined_modules = set()
+        pending = list(self.get_modules(file_name))
+        while pending:
+            module = pending.pop(0)
+            defined_modules.add(module.name)
+            for imported_module in module.imports:
+                if imported_module in defined_modules:
+                    continue
+                imported_file = self.find_file(imported_module, file_names)
+                if imported_file is not None and imported_file not in file_names:
+                    file_names.append(imported_file)
+                    pending.extend(self.get_modules(imported_file))
+        return file_names
+
+    @classmethod
+    def scan_file(cls, file_name: str) -> List[ModuleInfo]:
+        """
+        Scans the module headers, imports and type assignments of an ASN.1 file.
+
+        Parameterized types and information object classes are not part of the type assignments.
+        """
+        with open(file_name, 'r', encoding='utf-8') as f:
+            content = cls.COMMENT_REGEX.sub(' ', f.read())
+
+        headers = list(cls.MODULE_REGEX.finditer(content))
+        modules = []
+        for index, header in enumerate(headers):
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(content)
+            imports = []
+            imports_match = cls.IMPORTS_REGEX.search(content, header.end(), end)
+            if imports_match is not None:
+                imports = [m.group(1) for m in cls.FROM_REGEX.finditer(imports_match.group(1))]
+            types = cls.__scan_types(content, header.end(), end)
+            modules.append(ModuleInfo(header.group(1), os.path.abspath(file_name), imports, types))
+        return modules
+
+    @classmethod
+    def __scan_types(cls, content: str, start: int, end: int) -> List[str]:
+        # Assignments may follow any token, e.g. in modules written on one line. A type reference before ::= is not a type if a class or a set in
+        # braces is assigned, or if it is the type of a value assignment that follows the value name in the same line.
+        begin = cls.BEGIN_REGEX.search(content, start, end)
+        if begin is None:
+            return []
+        types = []
+        for m in cls.TYPE_ASSIGNMENT_REGEX.finditer(content, begin.end(), end):
+            if m.group(2) is None and cls.VALUE_NAME_REGEX.search(content, max(begin.end(), m.start() - 200), m.start()) is None:
+                types.append(m.group(1))
+        return types
@@ -38,6 +38,15 @@ class PluginInterface:  # pragma: no cover
         """
         raise NotImplementedError
 
+    def update_layout(self):
+        """
+        Updates the layout of the editor now if the shown elements were changed.
+
+        The layout is updated after all pending events were handled, so several changes only update it once. Calling this function is only necessary
+        to access the controls of the editor directly after a change.
+        """
+        raise NotImplementedError
+
     def encode_data(self, codec: str) -> bytes:
         """
         Encodes the data currently edited in the editor window with an ASN.1 codec.
@@ -62,6 +71,15 @@ class PluginInterface:  # pragma: no cover
         """
         raise NotImplementedError
 
+    def warm_up_codec(self, codec: str):
+        """
+        Requests compilation of the loaded ASN.1 specification for a codec in the background, so that a later call to get_spec, encode_data
+        or show_data with this codec does not have to wait for the compilation.
+
+        @param codec: Codec to compile (reference asn1tools which ones are supported)
+        """
+        raise NotImplementedError
+
     def get_typename(self) -> typing.Optional[str]:
         """
         @return: The name of the currently used type name in the editor.
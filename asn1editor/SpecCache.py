@@ -0,0 +1,148 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import typing
+
+import asn1tools
+
+
+class SpecCache:
+    """
+    Persistent on-disk cache for compiled ASN.1 specifications.
+
+    Entries are keyed by the content hash of all specification files, the codec and the asn1tools version, so a changed file or an updated asn1tools
+    never returns a stale entry. Entries are written to a temporary file first and then atomically moved in place, which allows several editor
+    instances to share one cache directory. If the cache grows beyond its maximum size, the least recently used entries are evicted.
+    """
+
+    EXTENSION = '.pickle'
+
+    def __init__(self, directory: str, max_size: int = 512 * 1024 * 1024):
+        self.__directory = directory
+        self.__max_size = max_size
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def get_key(self, file_names: typing.List[str], codec: str) -> str:
+        """
+        Returns the cache key for a set of ASN.1 files and a codec.
+
+        The key is prefixed with a hash of the file names to be able to invalidate all entries of a specification.
+
+        @param file_names: File names of the ASN.1 specification
+        @param codec: ASN.1 codec or another identifier of the cached representation, e.g. 'parsed'
+        @return: Cache key
+        """
+        content_hash = hashlib.sha256()
+        for file_name in sorted(file_names):
+            with open(file_name, 'rb') as f:
+                content_hash.update(hashlib.sha256(f.read()).digest())
+        content_hash.update(codec.encode())
+        content_hash.update(asn1tools.version.__version__.encode())
+
+        return f'{self.__get_names_hash(file_names)}-{content_hash.hexdigest()}'
+
+    def load(self, key: str) -> typing.Optional[typing.Any]:
+        """
+        Loads an entry from the cache.
+
+        @param key: Cache key as returned by get_key
+        @return: The cached object or None if the entry does not exist or cannot be read
+        """
+        file_name = self.__get_file_name(key)
+        try:
+            with open(file_name, 'rb') as f:
+                entry = pickle.load(f)
+            # Mark the entry as recently used
+            os.utime(file_name)
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Entry is corrupt, e.g. written by an incompatible version
+            self.__remove(file_name)
+            return None
+
+    def contains(self, key: str) -> bool:
+        """
+        @param key: Cache key as returned by get_key
+        @return: True if an entry exists for the key, without loading it
+        """
+        return os.path.exists(self.__get_file_name(key))
+
+    def store(self, key: str, entry: typing.Any):
+        """
+        Stores an entry in the cache and evicts old entries if the cache size exceeds the maximum size.
+
+        @param key: Cache key as returned by get_key
+        @param entry: Object to store, must be pickleable
+        """
+        try:
+            data = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            return
+
+        handle, temp_file_name = tempfile.mkstemp(dir=self.__directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file_name, self.__get_file_name(key))
+        except OSError:
+            self.__remove(temp_file_name)
+            return
+
+        self.__evict()
+
+    def invalidate(self, file_names: typing.Optional[typing.List[str]] = None):
+        """
+        Removes entries from the cache.
+
+        @param file_names: If given, only the entries of the specification consisting of these files are removed, otherwise the whole cache is cleared
+        """
+        prefix = '' if file_names is None else self.__get_names_hash(file_names) + '-'
+        for entry in self.__get_entries():
+            if entry.name.startswith(prefix):
+                self.__remove(entry.path)
+
+    def get_size(self) -> int:
+        """
+        @return: Current size of all cache entries in bytes
+        """
+        return sum(entry.stat().st_size for entry in self.__get_entries())
+
+    def __evict(self):
+        entries = []
+        for entry in self.__get_entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.__max_size:
+                break
+            self.__remove(path)
+            size -= entry_size
+
+    def __get_entries(self) -> typing.List[os.DirEntry]:
+        try:
+            return [entry for entry in os.scandir(self.__directory) if entry.name.endswith(self.EXTENSION)]
+        except FileNotFoundError:
+            return []
+
+    def __get_file_name(self, key: str) -> str:
+        return os.path.join(self.__directory, key + self.EXTENSION)
+
+    @staticmethod
+    def __get_names_hash(file_names: typing.List[str]) -> str:
+        names = '\n'.join(sorted(os.path.abspath(file_name) for file_name in file_names))
+        return hashlib.sha256(names.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def __remove(file_name: str):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
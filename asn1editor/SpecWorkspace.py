@@ -0,0 +1,67 @@
+import typing
+
+from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.SpecCache import SpecCache
+
+
+class SpecWorkspace:
+    """
+    Keeps the recently used ASN.1 specifications loaded to be able to switch between them without parsing and compiling them again.
+
+    The handlers are kept in the order of their last use. If the estimated memory usage of all handlers exceeds the memory budget, the least recently used
+    handlers are closed and removed. The most recently used handler is always kept.
+    """
+
+    def __init__(self, spec_cache: typing.Optional[SpecCache] = None, max_memory: int = 256 * 1024 * 1024):
+        self.__spec_cache = spec_cache
+        self.__max_memory = max_memory
+        # Most recently used handler first
+        self.__handlers: typing.List[typing.Tuple[ASN1SpecHandler, bool]] = []
+
+    def get(self, file_name: str, compile_type_only: bool = False) -> ASN1SpecHandler:
+        """
+        Returns the handler of a specification, which is created if the specification is not loaded in the workspace.
+
+        @param file_name: ASN.1 file name
+        @param compile_type_only: See ASN1SpecHandler
+        @return: Handler for the specification
+        """
+        for entry in self.__handlers:
+            handler, handler_compile_type_only = entry
+            if handler.is_loaded(file_name) and handler_compile_type_only == compile_type_only:
+                self.__handlers.remove(entry)
+                self.__handlers.insert(0, entry)
+                break
+        else:
+            handler = ASN1SpecHandler(file_name, self.__spec_cache, compile_type_only)
+            self.__handlers.insert(0, (handler, compile_type_only))
+
+        self.__evict()
+        return handler
+
+    def get_handlers(self) -> typing.List[ASN1SpecHandler]:
+        """
+        @return: Handlers in the workspace, most recently used first
+        """
+        return [handler for handler, _ in self.__handlers]
+
+    def get_memory_usage(self) -> int:
+        """
+        @return: Estimated memory usage of all handlers in the workspace in bytes
+        """
+        return sum(sum(handler.get_memory_usage().values()) for handler, _ in self.__handlers)
+
+    def close(self):
+        """
+        Closes and removes all handlers
+        """
+        for handler, _ in self.__handlers:
+            handler.close()
+        self.__handlers.clear()
+
+    def __evict(self):
+        memory_usage = [sum(handler.get_memory_usage().values()) for handler, _ in self.__handlers]
+        while len(self.__handlers) > 1 and sum(memory_usage) > self.__max_memory:
+            handler, _ = self.__handlers.pop()
+            memory_usage.pop()
+            handler.close()
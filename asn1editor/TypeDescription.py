@@ -0,0 +1,460 @@
+import typing
+
+from asn1tools.codecs import BaseType, compiler
+from asn1tools.codecs.ber import Class, Tag
+from asn1tools.parser import EXTENSION_MARKER
+
+
+def encode_tag(number: int, flags: int) -> bytes:
+    """
+    Encodes a tag like the OER codec does, so tags are displayed the same way as before the views were decoupled from the codec
+    """
+    if number < 63:
+        return bytes([flags | number])
+
+    encoded = bytearray()
+    while number > 0:
+        encoded.append(0x80 | (number & 0x7f))
+        number >>= 7
+    encoded[0] &= 0x7f
+    encoded.reverse()
+
+    return bytes([flags | 0x3f]) + bytes(encoded)
+
+
+# Version of the type descriptions, which needs to be increased whenever cached descriptions cannot be used anymore
+FORMAT_VERSION = 5
+
+
+class Type(BaseType):
+    """
+    Codec independent description of an ASN.1 type, used to create views and controllers.
+
+    name: Name of the type or member
+    type_name: ASN.1 type name or the name of the user type
+    optional: If set, the type is an OPTIONAL member
+    default: DEFAULT value of the member or None
+    additional: If set, the type is an extension addition of a SEQUENCE or SET
+    tag: Encoded tag or None if the type has no tag
+    minimum, maximum: Value or size constraints of the type. 'MIN' and 'MAX' if the type is not constrained or the constraint is extensible.
+    recursive: If set, the type was resolved from a reference to a type that contains itself
+    """
+
+    TAG: typing.Optional[int] = None
+
+    def __init__(self, name: str, type_name: str):
+        super().__init__(name, type_name)
+        self.additional = False
+        self.tag = None if self.TAG is None else encode_tag(self.TAG, 0)
+        self.minimum: typing.Union[str, int, float] = 'MIN'
+        self.maximum: typing.Union[str, int, float] = 'MAX'
+        self.recursive = False
+
+    def set_tag(self, number: int, flags: int):
+        if not Class.APPLICATION & flags:
+            flags |= Class.CONTEXT_SPECIFIC
+
+        self.tag = encode_tag(number, flags)
+
+    def set_range(self, minimum, maximum, has_extension_marker):
+        if has_extension_marker:
+            return
+
+        self.minimum = 'MIN' if minimum is None else minimum
+        self.maximum = 'MAX' if maximum is None else maximum
+
+    def set_size_range(self, minimum, maximum, has_extension_marker):
+        self.set_range(minimum, maximum, has_extension_marker)
+
+    def set_restricted_to_range(self, minimum, maximum, has_extension_marker):
+        self.set_range(minimum, maximum, has_extension_marker)
+
+
+class Integer(Type):
+    TAG = Tag.INTEGER
+
+    def __init__(self, name: str):
+        super().__init__(name, 'INTEGER')
+
+
+class Real(Type):
+    TAG = Tag.REAL
+
+    def __init__(self, name: str):
+        super().__init__(name, 'REAL')
+
+
+class Boolean(Type):
+    TAG = Tag.BOOLEAN
+
+    def __init__(self, name: str):
+        super().__init__(name, 'BOOLEAN')
+
+
+class Null(Type):
+    TAG = Tag.NULL
+
+    def __init__(self, name: str):
+        super().__init__(name, 'NULL')
+
+
+class Enumerated(Type):
+    """
+    values: Names of the enumeration values in the order of their definition
+    initial_value: Value of new elements if the type has no DEFAULT, the first value in alphabetical order
+    """
+    TAG = Tag.ENUMERATED
+
+    def __init__(self, name: str, values: typing.List):
+        super().__init__(name, 'ENUMERATED')
+        self.values: typing.List[str] = list(compiler.enum_values_as_dict(values).values())
+        self.initial_value: typing.Optional[str] = min(self.values, default=None)
+
+
+class OctetString(Type):
+    TAG = Tag.OCTET_STRING
+
+    def __init__(self, name: str, minimum, maximum, has_extension_marker):
+        super().__init__(name, 'OCTET STRING')
+        self.set_size_range(minimum, maximum, has_extension_marker)
+
+
+class BitString(Type):
+    """
+    named_bits: List of tuples with the name and the position of named bits or None
+    number_of_bits: Number of bits if the BIT STRING has a fixed size, otherwise None
+    """
+    TAG = Tag.BIT_STRING
+
+    def __init__(self, name: str, named_bits, minimum, maximum, has_extension_marker):
+        super().__init__(name, 'BIT STRING')
+        self.named_bits = named_bits
+        self.number_of_bits = None
+        if (minimum is not None or maximum is not None) and not has_extension_marker and minimum == maximum:
+            self.number_of_bits = minimum
+        self.set_size_range(minimum, maximum, has_extension_marker)
+
+
+class String(Type):
+    """
+    Base class of all character string types
+    """
+
+    def __init__(self, name: str, minimum=None, maximum=None, has_extension_marker=None):
+        super().__init__(name, self.__class__.__name__)
+        self.set_size_range(minimum, maximum, has_extension_marker)
+
+
+class UTF8String(String):
+    TAG = Tag.UTF8_STRING
+
+
+class VisibleString(String):
+    TAG = Tag.VISIBLE_STRING
+
+
+class GeneralString(String):
+    TAG = Tag.GENERAL_STRING
+
+
+class IA5String(String):
+    TAG = Tag.IA5_STRING
+
+
+class ObjectIdentifier(Type):
+    TAG = Tag.OBJECT_IDENTIFIER
+
+    def __init__(self, name: str):
+        super().__init__(name, 'OBJECT IDENTIFIER')
+
+
+class Sequence(Type):
+    """
+    root_members: Members of the extension root
+    additions: Extension additions or None if the type is not extensible
+    """
+    TAG = Tag.SEQUENCE
+
+    def __init__(self, name: str, root_members: typing.List[Type], additions: typing.Optional[typing.List[Type]]):
+        super().__init__(name, 'SEQUENCE')
+        self.root_members = root_members
+        self.additions = additions
+
+
+class Set(Sequence):
+    TAG = Tag.SET
+
+    def __init__(self, name: str, root_members: typing.List[Type], additions: typing.Optional[typing.List[Type]]):
+        super().__init__(name, root_members, additions)
+        self.type_name = 'SET'
+
+
+class SequenceOf(Type):
+    TAG = Tag.SEQUENCE
+
+    def __init__(self, name: str, element_type: Type, minimum, maximum, has_extension_marker):
+        super().__init__(name, 'SEQUENCE OF')
+        self.element_type = element_type
+        self.set_size_range(minimum, maximum, has_extension_marker)
+
+
+class SetOf(SequenceOf):
+    TAG = Tag.SET
+
+    def __init__(self, name: str, element_type: Type, minimum, maximum, has_extension_marker):
+        super().__init__(name, element_type, minimum, maximum, has_extension_marker)
+        self.type_name = 'SET OF'
+
+
+class Choice(Type):
+    """
+    members: All alternatives, including extension additions
+    initial_member: Alternative of new elements if the type has no DEFAULT, the first one in alphabetical order that does not contain itself
+    """
+
+    def __init__(self, name: str, root_members: typing.List[Type], additions: typing.Optional[typing.List[Type]]):
+        super().__init__(name, 'CHOICE')
+        self.members = root_members + ([] if additions is None else additions)
+        self.initial_member: typing.Optional[str] = min((member.name for member in self.members if not self.__is_recursive(member)), default=None)
+
+    @staticmethod
+    def __is_recursive(member: Type) -> bool:
+        if isinstance(member, Recursive):
+            return True
+        elif isinstance(member, Sequence):
+            return any(isinstance(m, Recursive) for m in member.root_members)
+        elif isinstance(member, SequenceOf):
+            return isinstance(member.element_type, Recursive)
+        return False
+
+
+class Date(Type):
+    def __init__(self, name: str):
+        super().__init__(name, 'DATE')
+
+
+class TimeOfDay(Type):
+    def __init__(self, name: str):
+        super().__init__(name, 'TIME-OF-DAY')
+
+
+class DateTime(Type):
+    def __init__(self, name: str):
+        super().__init__(name, 'DATE-TIME')
+
+
+class UTCTime(Type):
+    TAG = Tag.UTC_TIME
+
+    def __init__(self, name: str):
+        super().__init__(name, 'UTCTime')
+
+
+class GeneralizedTime(Type):
+    TAG = Tag.GENERALIZED_TIME
+
+    def __init__(self, name: str):
+        super().__init__(name, 'GeneralizedTime')
+
+
+class Unsupported(Type):
+    """
+    ASN.1 type that cannot be edited, e.g. ANY or a string type without a view.
+
+    The string types have their own classes, so plugins can register views for them.
+    """
+
+    def __repr__(self):
+        return f'{self.type_name}({self.name})'
+
+
+class TeletexString(Unsupported):
+    TAG = Tag.T61_STRING
+
+
+class NumericString(Unsupported):
+    TAG = Tag.NUMERIC_STRING
+
+
+class PrintableString(Unsupported):
+    TAG = Tag.PRINTABLE_STRING
+
+
+class BMPString(Unsupported):
+    TAG = Tag.BMP_STRING
+
+
+class GraphicString(Unsupported):
+    TAG = Tag.GRAPHIC_STRING
+
+
+class UniversalString(Unsupported):
+    TAG = Tag.UNIVERSAL_STRING
+
+
+class ObjectDescriptor(Unsupported):
+    TAG = Tag.OBJECT_DESCRIPTOR
+
+
+class Recursive(compiler.Recursive, Type):
+    """
+    Reference to a type that contains itself. The inner type is set after all types are compiled.
+    """
+
+    def __init__(self, name: str, type_name: str, module_name: str):
+        super().__init__(name, 'RECURSIVE')
+        self.type_name = type_name
+        self.module_name = module_name
+        self.inner: typing.Optional[Type] = None
+        self._resolved: typing.Optional[typing.Tuple[typing.Tuple, Type]] = None
+
+    def set_inner_type(self, inner: Type):
+        self.inner = inner
+
+    def resolve(self) -> Type:
+        """
+        Returns a copy of the inner type that carries the name, the tag and the member properties of this reference.
+
+        The copy is kept, so resolving the same reference again returns the same type.
+        """
+        properties = (self.name, self.optional, self.default, self.additional, self.tag)
+        if self._resolved is not None and self._resolved[0] == properties:
+            return self._resolved[1]
+
+        inner = compiler.copy(self.inner)
+        inner.name = self.name
+        inner.optional = self.optional
+        inner.default = self.default
+        inner.additional = self.additional
+        inner.recursive = True
+        if self.tag is not None:
+            inner.tag = self.tag
+
+        self._resolved = (properties, inner)
+        return inner
+
+
+class Compiler(compiler.Compiler):
+    """
+    Compiles a parsed ASN.1 specification to type descriptions.
+
+    The compilation follows the asn1tools codecs, but only evaluates what is needed to edit the types, so it is faster than compiling a codec.
+    """
+
+    UNSUPPORTED_TYPES = {'TeletexString': TeletexString, 'NumericString': NumericString, 'PrintableString': PrintableString, 'BMPString': BMPString,
+                         'GraphicString': GraphicString, 'UniversalString': UniversalString, 'ObjectDescriptor': ObjectDescriptor,
+                         'ANY': Unsupported, 'ANY DEFINED BY': Unsupported}
+
+    def process_type(self, type_name, type_descriptor, module_name):
+        return compiler.CompiledType(self.compile_type(type_name, type_descriptor, module_name))
+
+    def compile_open_types(self, name, type_descriptor, module_name):
+        return None
+
+    def compile_type(self, name, type_descriptor, module_name):
+        module_name = self.get_module_name(type_descriptor, module_name)
+        type_name = type_descriptor['type']
+
+        if type_name == 'SEQUENCE':
+            compiled = Sequence(name, *self.compile_members(type_descriptor['members'], module_name))
+        elif type_name == 'SET':
+            compiled = Set(name, *self.compile_members(type_descriptor['members'], module_name, sort_by_tag=True))
+        elif type_name == 'EXTERNAL':
+            compiled = Sequence(name, *self.compile_members(self.external_type_descriptor()['members'], module_name))
+            compiled.set_tag(Tag.EXTERNAL, 0)
+        elif type_name == 'SEQUENCE OF':
+            compiled = SequenceOf(name, self.compile_type('', type_descriptor['element'], module_name), *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'SET OF':
+            compiled = SetOf(name, self.compile_type('', type_descriptor['element'], module_name), *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'CHOICE':
+            compiled = Choice(name, *self.compile_members(type_descriptor['members'], module_name, mark_additions=False))
+        elif type_name == 'INTEGER':
+            compiled = Integer(name)
+        elif type_name == 'REAL':
+            compiled = Real(name)
+        elif type_name == 'ENUMERATED':
+            compiled = Enumerated(name, self.get_enum_values(type_descriptor, module_name))
+        elif type_name == 'BOOLEAN':
+            compiled = Boolean(name)
+        elif type_name == 'NULL':
+            compiled = Null(name)
+        elif type_name == 'OBJECT IDENTIFIER':
+            compiled = ObjectIdentifier(name)
+        elif type_name == 'OCTET STRING':
+            compiled = OctetString(name, *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'BIT STRING':
+            compiled = BitString(name, self.get_named_bits(type_descriptor, module_name), *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'UTF8String':
+            compiled = UTF8String(name, *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'VisibleString':
+            compiled = VisibleString(name, *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'GeneralString':
+            compiled = GeneralString(name)
+        elif type_name == 'IA5String':
+            compiled = IA5String(name, *self.get_size_range(type_descriptor, module_name))
+        elif type_name == 'DATE':
+            compiled = Date(name)
+        elif type_name == 'TIME-OF-DAY':
+            compiled = TimeOfDay(name)
+        elif type_name == 'DATE-TIME':
+            compiled = DateTime(name)
+        elif type_name == 'UTCTime':
+            compiled = UTCTime(name)
+        elif type_name == 'GeneralizedTime':
+            compiled = GeneralizedTime(name)
+        elif type_name in self.UNSUPPORTED_TYPES:
+            compiled = self.UNSUPPORTED_TYPES[type_name](name, type_name)
+            compiled.set_size_range(*self.get_size_range(type_descriptor, module_name))
+        elif type_name in self.types_backtrace:
+            compiled = Recursive(name, type_name, module_name)
+            self.recursive_types.append(compiled)
+        else:
+            compiled = self.compile_user_type(name, type_name, module_name)
+
+        if 'tag' in type_descriptor:
+            compiled = self.copy(compiled)
+            class_ = type_descriptor['tag'].get('class', None)
+            flags = Class.APPLICATION if class_ == 'APPLICATION' else Class.PRIVATE if class_ == 'PRIVATE' else 0
+            compiled.set_tag(type_descriptor['tag']['number'], flags)
+
+        if 'restricted-to' in type_descriptor:
+            compiled = self.set_compiled_restricted_to(compiled, type_descriptor, module_name)
+
+        return compiled
+
+    def compile_members(self, members, module_name, sort_by_tag=False, mark_additions=True):
+        root_members = []
+        additions = None
+        in_extension = False
+
+        for member in members:
+            if member == EXTENSION_MARKER:
+                in_extension = not in_extension
+                if in_extension:
+                    additions = []
+            elif in_extension:
+                # Extension addition groups are flattened
+                for addition in member if isinstance(member, list) else [member]:
+                    compiled_member = self.compile_member(addition, module_name)
+                    if mark_additions:
+                        compiled_member = self.copy(compiled_member)
+                        compiled_member.additional = True
+                    additions.append(compiled_member)
+            else:
+                root_members.append(self.compile_member(member, module_name))
+
+        if sort_by_tag:
+            root_members = sorted(root_members, key=lambda m: m.tag or b'')
+
+        return root_members, additions
+
+
+def compile_dict(specification: typing.Dict) -> typing.Dict[str, typing.Dict[str, Type]]:
+    """
+    Compiles the type descriptions of a parsed ASN.1 specification.
+
+    @param specification: Parsed specification as returned by asn1tools.parse_files
+    @return: Dictionary of module names to dictionaries of type names to type descriptions
+    """
+    return {module_name: {type_name: compiled.type for type_name, compiled in module.items()}
+            for module_name, module in Compiler(specification).process().items()}
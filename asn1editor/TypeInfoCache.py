@@ -0,0 +1,77 @@
+import copy
+import weakref
+from typing import Callable, Dict, Optional
+
+from asn1editor import TypeDescription
+from asn1editor.TypeAugmenter import TypeAugmenter
+from asn1editor.view.AbstractViewFactory import TypeInfo
+
+
+class TypeInfoCache:
+    """
+    Keeps the TypeInfo of the elements of a specification, so all views of the same element share one TypeInfo.
+
+    A TypeInfo is stored per type description and, if a type augmenter is used, per path of the element, since the augmenter may return a different
+    style or help text for every path. Views must not modify the TypeInfo they are created with.
+    The copies of type descriptions used for optional elements and list elements are kept as well, so recreated elements share their TypeInfo.
+    All entries are removed when their type description no longer exists.
+    """
+
+    def __init__(self, type_augmenter: Optional[TypeAugmenter]):
+        self.type_augmenter = type_augmenter
+        self.__type_infos: 'weakref.WeakKeyDictionary[TypeDescription.Type, Dict[Optional[str], TypeInfo]]' = weakref.WeakKeyDictionary()
+        self.__required_types: 'weakref.WeakKeyDictionary[TypeDescription.Type, TypeDescription.Type]' = weakref.WeakKeyDictionary()
+        self.__element_types: 'weakref.WeakKeyDictionary[TypeDescription.Type, Dict[int, TypeDescription.Type]]' = weakref.WeakKeyDictionary()
+
+    def get(self, type_: TypeDescription.Type, path: str, create: Callable[[TypeDescription.Type, str], TypeInfo]) -> TypeInfo:
+        """
+        Returns the TypeInfo of an element and creates it if it is not cached
+
+        @param type_: Description of the ASN.1 type
+        @param path: Path of the parent element
+        @param create: Creates the TypeInfo for a type description and path
+        @return: TypeInfo of the element
+        """
+        type_infos = self.__type_infos.setdefault(type_, {})
+        key = path if self.type_augmenter else None
+        type_info = type_infos.get(key)
+        if type_info is None:
+            type_info = type_infos[key] = create(type_, path)
+        return type_info
+
+    def get_required_type(self, type_: TypeDescription.Type) -> TypeDescription.Type:
+        """
+        Returns the description of an optional element once it is present
+
+        @param type_: Description of the optional element
+        @return: Copy of the description that is neither optional nor an extension addition
+        """
+        required_type = self.__required_types.get(type_)
+        if required_type is None:
+            required_type = self.__required_types[type_] = copy.copy(type_)
+            required_type.optional = False
+            required_type.additional = False
+        return required_type
+
+    def get_element_type(self, type_: TypeDescription.Type, instance: int) -> TypeDescription.Type:
+        """
+        Returns the description of a list element
+
+        @param type_: Description of the element type of the list
+        @param instance: Index of the element
+        @return: Copy of the description that is named after the index
+        """
+        element_types = self.__element_types.setdefault(type_, {})
+        element_type = element_types.get(instance)
+        if element_type is None:
+            element_type = element_types[instance] = copy.copy(type_)
+            element_type.name = f'Element {instance}'
+        return element_type
+
+    def __len__(self) -> int:
+        return sum(len(type_infos) for type_infos in self.__type_infos.values())
+
+    def clear(self):
+        self.__type_infos.clear()
+        self.__required_types.clear()
+        self.__element_types.clear()
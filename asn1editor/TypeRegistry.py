@@ -0,0 +1,40 @@
+import typing
+from typing import Dict, Generic, Optional, TypeVar
+
+from asn1editor import TypeDescription
+
+Handler = TypeVar('Handler')
+
+
+class TypeRegistry(Generic[Handler]):
+    """
+    Maps type description classes to handlers, e.g. the functions creating views and controllers for a type.
+
+    A handler registered for a class is also used for its subclasses, unless a handler is registered for the subclass itself. The handler of a class
+    is looked up once and then taken from a dictionary, so the lookup for a type description does not depend on the number of registered classes.
+    """
+
+    def __init__(self, handlers: Optional[Dict[type, Handler]] = None):
+        self.__handlers: Dict[type, Handler] = dict(handlers or {})
+        self.__resolved: Dict[type, Optional[Handler]] = {}
+
+    def register(self, type_class: typing.Type[TypeDescription.Type], handler: Handler):
+        """
+        Registers a handler for a type description class and its subclasses.
+
+        @param type_class: Type description class, e.g. TypeDescription.NumericString
+        @param handler: Handler for the type
+        """
+        self.__handlers[type_class] = handler
+        self.__resolved.clear()
+
+    def get(self, type_class: typing.Type[TypeDescription.Type]) -> Optional[Handler]:
+        """
+        Returns the handler for a type description class or None if no handler is registered for the class or one of its base classes
+        """
+        try:
+            return self.__resolved[type_class]
+        except KeyError:
+            handler = next((self.__handlers[c] for c in type_class.__mro__ if c in self.__handlers), None)
+            self.__resolved[type_class] = handler
+            return handler
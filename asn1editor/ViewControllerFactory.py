@@ -1,15 +1,23 @@
+import copy
+import datetime
 import typing
+import weakref
 
-from asn1tools.codecs import constraints_checker
-from asn1tools.compiler import oer
-
+from asn1editor import TypeDescription
 from asn1editor.TypeAugmenter import TypeAugmenter
+from asn1editor.TypeInfoCache import TypeInfoCache
+from asn1editor.TypeRegistry import TypeRegistry
 from asn1editor.controller.ChoiceInstanceFactory import ChoiceInstanceFactory
 from asn1editor.controller.Controller import Controller, RootController
 from asn1editor.controller.ControllerFactory import ControllerFactory
 from asn1editor.controller.ListInstanceFactory import ListInstanceFactory
+from asn1editor.controller.OptionalInstanceFactory import OptionalInstanceFactory
+from asn1editor.interfaces.PageInterface import PageInterface
 from asn1editor.view.AbstractView import AbstractView
 from asn1editor.view.AbstractViewFactory import AbstractViewFactory, TypeInfo
+from asn1editor.view.MemoryViewFactory import MemoryViewFactory
+
+Builder = typing.Callable[['ViewControllerFactory', TypeDescription.Type, Controller], AbstractView]
 
 
 class ViewControllerFactory:
@@ -20,24 +28,50 @@ class ViewControllerFactory:
     a given type.
     """
 
-    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter]):
+    TYPE_NAMES = {TypeDescription.Integer: 'INTEGER', TypeDescription.Real: 'REAL', TypeDescription.Enumerated: 'ENUMERATED',
+                  TypeDescription.Boolean: 'BOOLEAN', TypeDescription.OctetString: 'OCTET STRING', TypeDescription.VisibleString: 'VisibleString',
+                  TypeDescription.UTF8String: 'UTF8String', TypeDescription.GeneralString: 'GeneralString', TypeDescription.IA5String: 'IA5String',
+                  TypeDescription.ObjectIdentifier: 'OBJECT IDENTIFIER', TypeDescription.BitString: 'BIT STRING', TypeDescription.Sequence: 'SEQUENCE',
+                  TypeDescription.Set: 'SET', TypeDescription.SequenceOf: 'SEQUENCE OF', TypeDescription.SetOf: 'SET OF', TypeDescription.Choice: 'CHOICE',
+                  TypeDescription.Date: 'DATE', TypeDescription.TimeOfDay: 'TIME-OF-DAY', TypeDescription.DateTime: 'DATE-TIME',
+                  TypeDescription.GeneralizedTime: 'GeneralizedTime', TypeDescription.UTCTime: 'UTCTime', TypeDescription.Null: 'NULL'}
+
+    # Maximum number of ancestors of an element at which recursive types are still created, protects against endless types and too deeply nested data
+    MAX_DEPTH = 300
+
+    # Default models of lazily built elements per type description. Models with time values are not kept, since their default is the current time.
+    _default_models: 'weakref.WeakKeyDictionary[TypeDescription.Type, typing.Any]' = weakref.WeakKeyDictionary()
+    # Markers for types without a default model and for types whose default model is being created
+    __NO_MODEL = object()
+    __PENDING = object()
+
+    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter],
+                 type_info_cache: typing.Optional[TypeInfoCache] = None):
+        """
+        @param view_factory: Creates the views of the GUI implementation
+        @param type_augmenter: Optional type augmenter providing styles and help texts
+        @param type_info_cache: Cache of TypeInfo objects shared by all factories of a specification. If not given, a new one is used.
+        """
         self._view_factory = view_factory
         self._type_augmenter = type_augmenter
+        if type_info_cache is None or type_info_cache.type_augmenter is not type_augmenter:
+            type_info_cache = TypeInfoCache(type_augmenter)
+        self._type_info_cache = type_info_cache
 
-    def create(self, asn1_type: oer.CompiledType) -> typing.Tuple[AbstractView, Controller]:
+    def create(self, asn1_type: TypeDescription.Type) -> typing.Tuple[AbstractView, Controller]:
         """
         Creates the root view and root controller for a loaded ASN.1 specification.
 
         Needs to be called after loading a specification
-        @param asn1_type: Compiled ASN.1 specification
+        @param asn1_type: Description of the ASN.1 type
         @return: Root view and root controller
         """
         controller = RootController('root')
-        view = self.create_view_and_controller(asn1_type.type, asn1_type.constraints_checker.type, controller)
+        view = self._create(asn1_type, controller)
 
         return view, controller
 
-    def create_view_and_controller(self, type_: oer.Type, checker: constraints_checker.Type, controller: Controller) -> AbstractView:
+    def create_view_and_controller(self, type_: TypeDescription.Type, controller: Controller, lazy: bool = True) -> AbstractView:
         """
         Creates the view and controller for a given ASN.1 type.
 
@@ -46,125 +80,124 @@ class ViewControllerFactory:
 
         The reason here is that the controllers are all in the context of asn1editor and cannot be changed, while the views are interchangeable.
 
-        @param type_: Compiled ASN.1 type
-        @param checker: Constraints checker object to provide constraints info about the type
+        @param type_: Description of the ASN.1 type, including its constraints
         @param controller: Parent controller
+        @param lazy: If set, optional elements are created when they are enabled and containers, lists and choices are created when they are shown if
+                     the view factory supports it
         @return: View for the type
         """
-        if isinstance(type_, oer.Integer) or isinstance(type_, oer.Real):
-            view = self._number(type_, checker, controller)
-        elif isinstance(type_, oer.Boolean):
-            view = self._bool(type_, controller)
-        elif isinstance(type_, oer.Sequence) or isinstance(type_, oer.Set):
-            # noinspection PyTypeChecker
-            view = self._sequence(type_, checker, controller)
-        elif isinstance(type_, oer.SequenceOf) or isinstance(type_, oer.SetOf):
-            # noinspection PyTypeChecker
-            view = self._sequence_of(type_, checker, controller)
-        elif isinstance(type_, oer.Choice):
-            # noinspection PyTypeChecker
-            view = self._choice(type_, checker, controller)
-        elif isinstance(type_, oer.OctetString):
-            # noinspection PyTypeChecker
-            view = self._hex_string(type_, checker, controller)
-        elif type(type_) in [oer.UTF8String, oer.VisibleString, oer.GeneralString, oer.IA5String, oer.ObjectIdentifier]:
-            # noinspection PyTypeChecker
-            view = self._string(type_, checker, controller)
-        elif isinstance(type_, oer.Enumerated):
-            view = self._enumerated(type_, controller)
-        elif isinstance(type_, oer.BitString):
-            # noinspection PyTypeChecker
-            view = self._bitstring(type_, controller)
-        elif isinstance(type_, oer.Null):
-            view = self._null(type_, controller)
-        elif isinstance(type_, oer.Recursive):
-            # noinspection PyUnresolvedReferences
-            view = self.create_view_and_controller(type_.inner, checker.inner, controller)
-        elif isinstance(type_, oer.Date):
-            view = self._date(type_, controller)
-        elif isinstance(type_, oer.TimeOfDay):
-            view = self._time(type_, controller)
-        elif isinstance(type_, oer.DateTime) or isinstance(type_, oer.UTCTime) or isinstance(type_, oer.GeneralizedTime):
-            view = self._datetime(type_, controller)
-        else:
-            view = self._text(type_, f'ASN.1 type {type_.name} {type_.type_name} not supported')
+        if isinstance(type_, TypeDescription.Recursive):
+            if controller.depth >= self.MAX_DEPTH:
+                raise Exception(f'Nesting of the recursive type {type_.type_name} in {controller.get_path()} exceeds the maximum depth of {self.MAX_DEPTH}')
+            type_ = type_.resolve()
+        if lazy and type_.optional and self.__is_supported(type_) and not isinstance(type_, TypeDescription.Null):
+            view = self._optional(type_, controller)
+            if view is not None:
+                return view
+        if lazy and isinstance(type_, (TypeDescription.Sequence, TypeDescription.SequenceOf, TypeDescription.Choice)):
+            return self._lazy(type_, controller)
+        return self._create(type_, controller)
+
+    def _create(self, type_: TypeDescription.Type, controller: Controller) -> AbstractView:
+        return self.BUILDERS.get(type(type_))(self, type_, controller)
+
+    def _recursive(self, type_: TypeDescription.Recursive, controller: Controller) -> AbstractView:
+        return self._create(type_.resolve(), controller)
+
+    def _unsupported(self, type_: TypeDescription.Type, controller: Controller) -> AbstractView:
+        return self._text(type_, f'ASN.1 type {type_.name} {type_.type_name} not supported')
+
+    def _text(self, type_: TypeDescription.Type, text: str) -> AbstractView:
+        return self._view_factory.get_text_view(self.__get_type_info(type_, '?'), text)
+
+    def _optional(self, type_: TypeDescription.Type, controller: Controller) -> typing.Optional[AbstractView]:
+        container = isinstance(type_, (TypeDescription.Sequence, TypeDescription.SequenceOf, TypeDescription.Choice))
+        optional_view = self._view_factory.get_optional_view(self.__get_type_info(type_, controller.get_path()), container)
+        if optional_view is None:
+            return None
+        view, optional_interface = optional_view
+
+        optional_instance_factory = OptionalInstanceFactory(self._view_factory, self._type_augmenter, self._type_info_cache, view, type_)
+        ControllerFactory(controller).create_optional_controller(type_, optional_interface, optional_instance_factory)
 
         return view
 
-    def _text(self, type_: oer.Type, text: str) -> AbstractView:
-        return self._view_factory.get_text_view(self.__get_type_info(type_, '?'), text)
+    def _lazy(self, type_: TypeDescription.Type, controller: Controller) -> AbstractView:
+        lazy_controller = ControllerFactory(controller).create_lazy_controller(type_)
+        view = self._view_factory.get_lazy_view(self.__get_type_info(type_, controller.get_path()),
+                                                lambda: lazy_controller.build(lambda parent: self._create(type_, parent)))
+        lazy_controller.realize = view.realize
+        lazy_controller.get_default = lambda: self.get_default_model(type_, controller)
 
-    def _null(self, type_: oer.Type, controller: Controller) -> AbstractView:
+        return view
+
+    def _null(self, type_: TypeDescription.Type, controller: Controller) -> AbstractView:
         ControllerFactory(controller).create_null_controller(type_)
         return self._view_factory.get_text_view(self.__get_type_info(type_, controller.get_path()), "NULL")
 
-    def _number(self, type_: typing.Union[oer.Integer, oer.Real], checker: constraints_checker.Type, controller: Controller) -> AbstractView:
+    def _number(self, type_: typing.Union[TypeDescription.Integer, TypeDescription.Real], controller: Controller) -> AbstractView:
         view, value_interface, optional_interface = self._view_factory.get_number_view(self.__get_type_info(type_, controller.get_path()),
-                                                                                       self.__get_limit(checker.minimum), self.__get_limit(checker.maximum),
-                                                                                       isinstance(type_, oer.Real))
+                                                                                       self.__get_limit(type_.minimum), self.__get_limit(type_.maximum),
+                                                                                       isinstance(type_, TypeDescription.Real))
 
-        ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface, self.__get_limit(checker.minimum))
+        ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface, self.__get_limit(type_.minimum))
 
         return view
 
-    def _sequence(self, type_: oer.Sequence, checker: constraints_checker.Dict, controller: Controller) -> AbstractView:
+    def _sequence(self, type_: TypeDescription.Sequence, controller: Controller) -> AbstractView:
         view, optional_interface = self._view_factory.get_container_view(self.__get_type_info(type_, controller.get_path()))
 
         sub_controller = ControllerFactory(controller).create_container_controller(type_, optional_interface)
 
-        # Additions are always optional
         additions = [] if type_.additions is None else type_.additions
-        for sub_type in additions:
-            sub_type.additional = True
-
         for sub_type in type_.root_members + additions:
-            view.add_child(self.create_view_and_controller(sub_type, self.__get_member_checker(checker, sub_type.name), sub_controller))
+            view.add_child(self.create_view_and_controller(sub_type, sub_controller))
 
         return view
 
-    def _sequence_of(self, type_: oer.SequenceOf, checker: constraints_checker.List, controller: Controller) -> AbstractView:
+    def _sequence_of(self, type_: TypeDescription.SequenceOf, controller: Controller) -> AbstractView:
         view, value_interface, optional_interface = self._view_factory.get_list_view(self.__get_type_info(type_, controller.get_path()),
-                                                                                     self.__get_limit(checker.minimum),
-                                                                                     self.__get_limit(checker.maximum))
+                                                                                     self.__get_limit(type_.minimum),
+                                                                                     self.__get_limit(type_.maximum))
 
-        list_instance_factory = ListInstanceFactory(self._view_factory, self._type_augmenter, view, type_.element_type, checker.element_type)
+        list_instance_factory = ListInstanceFactory(self._view_factory, self._type_augmenter, self._type_info_cache, view, type_.element_type)
         ControllerFactory(controller).create_list_controller(type_, value_interface, optional_interface, list_instance_factory,
-                                                             self.__get_limit(checker.minimum))
+                                                             self.__get_limit(type_.minimum), view if isinstance(view, PageInterface) else None)
 
         return view
 
-    def _enumerated(self, type_: oer.Enumerated, controller: Controller) -> AbstractView:
-        choices = [str(value) for value in type_.value_to_data.values()]
+    def _enumerated(self, type_: TypeDescription.Enumerated, controller: Controller) -> AbstractView:
+        choices = type_.values
         view, value_interface, optional_interface = self._view_factory.get_enumerated_view(self.__get_type_info(type_, controller.get_path()), choices)
 
         ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface)
 
         return view
 
-    def _bool(self, type_: oer.Boolean, controller: Controller):
+    def _bool(self, type_: TypeDescription.Boolean, controller: Controller):
         view, value_interface, optional_interface = self._view_factory.get_boolean_view(self.__get_type_info(type_, controller.get_path()))
 
         ControllerFactory(controller).create_bool_controller(type_, value_interface, optional_interface)
 
         return view
 
-    def _string(self, type_: oer.VisibleString, checker: constraints_checker.String, controller: Controller):
+    def _string(self, type_: TypeDescription.VisibleString, controller: Controller):
         view, value_interface, optional_interface = self._view_factory.get_string_view(self.__get_type_info(type_, controller.get_path()),
-                                                                                       self.__get_limit(checker.minimum), self.__get_limit(checker.maximum))
+                                                                                       self.__get_limit(type_.minimum), self.__get_limit(type_.maximum))
 
-        ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface, self.__get_limit(checker.minimum))
+        ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface, self.__get_limit(type_.minimum))
 
         return view
 
-    def _hex_string(self, type_: oer.OctetString, checker: constraints_checker.String, controller: Controller):
+    def _hex_string(self, type_: TypeDescription.OctetString, controller: Controller):
         view, value_interface, optional_interface = self._view_factory.get_hex_string_view(self.__get_type_info(type_, controller.get_path()),
-                                                                                           self.__get_limit(checker.minimum), self.__get_limit(checker.maximum))
+                                                                                           self.__get_limit(type_.minimum), self.__get_limit(type_.maximum))
 
-        ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface, self.__get_limit(checker.minimum))
+        ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface, self.__get_limit(type_.minimum))
 
         return view
 
-    def _bitstring(self, type_: oer.BitString, controller: Controller):
+    def _bitstring(self, type_: TypeDescription.BitString, controller: Controller):
         if type_.number_of_bits is None:
             view, value_interface, optional_interface = self._view_factory.get_hex_string_view(self.__get_type_info(type_, controller.get_path()), None, None)
 
@@ -177,54 +210,93 @@ class ViewControllerFactory:
 
         return view
 
-    def _choice(self, type_: oer.Choice, checker: constraints_checker.Choice, controller: Controller):
+    def _choice(self, type_: TypeDescription.Choice, controller: Controller):
         choices = [member.name for member in type_.members]
         view, value_interface, optional_interface = self._view_factory.get_choice_view(self.__get_type_info(type_, controller.get_path()), choices)
 
         members = {member.name: member for member in type_.members}
-        checkers = {member.name: member for member in checker.members}
 
-        choice_instance_factory = ChoiceInstanceFactory(self._view_factory, self._type_augmenter, view, members, checkers)
+        choice_instance_factory = ChoiceInstanceFactory(self._view_factory, self._type_augmenter, self._type_info_cache, view, members)
         ControllerFactory(controller).create_choice_controller(type_, value_interface, optional_interface, choice_instance_factory)
 
         return view
 
-    def _date(self, type_: oer.Date, controller: Controller):
+    def _date(self, type_: TypeDescription.Date, controller: Controller):
         view, value_interface, optional_interface = self._view_factory.get_date_view(self.__get_type_info(type_, controller.get_path()))
 
         ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface)
 
         return view
 
-    def _time(self, type_: oer.TimeOfDay, controller: Controller):
+    def _time(self, type_: TypeDescription.TimeOfDay, controller: Controller):
         view, value_interface, optional_interface = self._view_factory.get_time_view(self.__get_type_info(type_, controller.get_path()))
 
         ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface)
 
         return view
 
-    def _datetime(self, type_: typing.Union[oer.DateTime, oer.UTCTime, oer.GeneralizedTime], controller: Controller):
+    def _datetime(self, type_: typing.Union[TypeDescription.DateTime, TypeDescription.UTCTime, TypeDescription.GeneralizedTime], controller: Controller):
         view, value_interface, optional_interface = self._view_factory.get_datetime_view(self.__get_type_info(type_, controller.get_path()))
 
         ControllerFactory(controller).create_value_controller(type_, value_interface, optional_interface)
 
         return view
 
-    @staticmethod
-    def __get_member_checker(checker: constraints_checker.Dict, name: str) -> constraints_checker.Type:
-        for member in checker.members:
-            if member.name == name:
-                return member
+    def __is_supported(self, type_: TypeDescription.Type) -> bool:
+        return self.BUILDERS.get(type(type_)) is not ViewControllerFactory._unsupported
 
     @staticmethod
     def __get_limit(limit: typing.Any) -> typing.Optional[int]:
         return None if limit in ['MIN', 'MAX'] or not isinstance(limit, int) else limit
 
-    def __get_type_info(self, type_: oer.Type, path: str) -> TypeInfo:
+    @staticmethod
+    def get_default_model(type_: TypeDescription.Type, parent: Controller) -> typing.Any:
+        """
+        Creates the default model of an element without its views, so elements that were never shown are not built to save or encode the data
+
+        @param type_: Description of the element
+        @param parent: Controller the element belongs to
+        @return: Model of the element
+        """
+        default_model = ViewControllerFactory._default_models.get(type_, ViewControllerFactory.__NO_MODEL)
+        if default_model is ViewControllerFactory.__PENDING:
+            # The default model of the type contains itself
+            raise Exception(f'The recursive type of {type_.name} in {parent.get_path()} has no end')
+        if default_model is ViewControllerFactory.__NO_MODEL:
+            ViewControllerFactory._default_models[type_] = ViewControllerFactory.__PENDING
+            try:
+                # The element is created at its place, so the path and the depth of the element are the same
+                controller = RootController('root')
+                controller.path = parent.get_path()
+                controller.depth = parent.depth
+                ViewControllerFactory(MemoryViewFactory(), None)._create(type_, controller)
+                default_model = controller.view_to_model().get(type_.name)
+            except Exception:
+                del ViewControllerFactory._default_models[type_]
+                raise
+            if ViewControllerFactory.__contains_time(default_model):
+                del ViewControllerFactory._default_models[type_]
+                return default_model
+            ViewControllerFactory._default_models[type_] = default_model
+        return copy.deepcopy(default_model)
+
+    @staticmethod
+    def __contains_time(model: typing.Any) -> bool:
+        if isinstance(model, dict):
+            return any(ViewControllerFactory.__contains_time(value) for value in model.values())
+        if isinstance(model, (list, tuple)):
+            return any(ViewControllerFactory.__contains_time(value) for value in model)
+        return isinstance(model, (datetime.date, datetime.time))
+
+    def __get_type_info(self, type_: TypeDescription.Type, path: str) -> TypeInfo:
+        return self._type_info_cache.get(type_, path, self.__create_type_info)
+
+    def __create_type_info(self, type_: TypeDescription.Type, path: str) -> TypeInfo:
         type_info = TypeInfo()
         type_info.name = type_.name
         type_info.optional = type_.optional
-        type_info.additional = hasattr(type_, "additional")
+        type_info.additional = type_.additional
+        type_info.recursive = type_.recursive
         type_info.tag = f'0x{type_.tag.hex()}' if type_.tag is not None else ''
         if self._type_augmenter:
             if len(path):
@@ -232,12 +304,22 @@ class ViewControllerFactory:
             path += f'{type_.name}'
             type_info.style = self._type_augmenter.get_style(path)
             type_info.help = self._type_augmenter.get_help(path)
-        type_to_str = {oer.Integer: 'INTEGER', oer.Real: 'REAL', oer.Enumerated: 'ENUMERATED', oer.Boolean: 'BOOLEAN', oer.OctetString: 'OCTET STRING',
-                       oer.VisibleString: 'VisibleString', oer.UTF8String: 'UTF8String', oer.GeneralString: 'GeneralString', oer.IA5String: 'IA5String',
-                       oer.ObjectIdentifier: 'OBJECT IDENTIFIER', oer.BitString: 'BIT STRING', oer.Sequence: 'SEQUENCE', oer.Set: 'SET',
-                       oer.SequenceOf: 'SEQUENCE OF', oer.SetOf: 'SET OF', oer.Choice: 'CHOICE', oer.Date: 'DATE', oer.TimeOfDay: 'TIME-OF-DAY',
-                       oer.DateTime: 'DATE-TIME', oer.GeneralizedTime: 'GeneralizedTime', oer.UTCTime: 'UTCTime', oer.Null: 'NULL'}
-
-        type_info.typename = type_to_str.get(type(type_), 'UNSUPPORTED: ' + str(type_))
+        if type(type_) in self.TYPE_NAMES:
+            type_info.typename = self.TYPE_NAMES[type(type_)]
+        else:
+            type_info.typename = type_.type_name if self.__is_supported(type_) else 'UNSUPPORTED: ' + str(type_)
 
         return type_info
+
+    # Functions creating the view and controller of a type description class and its subclasses. Plugins can register functions for further
+    # classes, e.g. BUILDERS.register(TypeDescription.NumericString, BUILDERS.get(TypeDescription.VisibleString)), if the ControllerFactory
+    # supports the type as well.
+    BUILDERS: TypeRegistry[Builder] = TypeRegistry({TypeDescription.Integer: _number, TypeDescription.Real: _number, TypeDescription.Boolean: _bool,
+                                                    TypeDescription.Sequence: _sequence, TypeDescription.SequenceOf: _sequence_of,
+                                                    TypeDescription.Choice: _choice, TypeDescription.OctetString: _hex_string,
+                                                    TypeDescription.String: _string, TypeDescription.ObjectIdentifier: _string,
+                                                    TypeDescription.Enumerated: _enumerated, TypeDescription.BitString: _bitstring,
+                                                    TypeDescription.Null: _null, TypeDescription.Recursive: _recursive, TypeDescription.Date: _date,
+                                                    TypeDescription.TimeOfDay: _time, TypeDescription.DateTime: _datetime,
+                                                    TypeDescription.UTCTime: _datetime, TypeDescription.GeneralizedTime: _datetime,
+                                                    TypeDescription.Type: _unsupported})
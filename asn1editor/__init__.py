@@ -4,14 +4,20 @@ __author__ = "Florian Fetz"
 
 import argparse
 
-import wx
-
 from .Plugin import Plugin
 from .PluginInterface import PluginInterface
 from .TypeAugmenter import TypeAugmenter
-from .wxPython import MainWindow as WxPythonMainWindow
+from .view.MemoryViewFactory import MemoryViewFactory
+
+__all__ = ['WxPythonMainWindow', 'Plugin', 'PluginInterface', 'TypeAugmenter', 'MemoryViewFactory']
 
-__all__ = ['WxPythonMainWindow', 'Plugin', 'PluginInterface', 'TypeAugmenter']
+
+def __getattr__(name: str):
+    # wxPython is only imported when the editor is used, so scripts using the MemoryViewFactory do not require it
+    if name == 'WxPythonMainWindow':
+        from .wxPython import MainWindow
+        return MainWindow
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def _wx_python_editor():
@@ -22,6 +28,9 @@ def _wx_python_editor():
 
     args = parser.parse_args()
 
+    import wx
+    from .wxPython import MainWindow as WxPythonMainWindow
+
     app = wx.App()
 
     frame = WxPythonMainWindow()
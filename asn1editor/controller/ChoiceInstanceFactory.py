@@ -1,9 +1,10 @@
+import collections
 import typing
-from typing import Dict, Optional
-
-from asn1tools.codecs import oer, constraints_checker
+from typing import Dict, Optional, Tuple
 
+from asn1editor import TypeDescription
 from asn1editor.TypeAugmenter import TypeAugmenter
+from asn1editor.TypeInfoCache import TypeInfoCache
 from asn1editor.controller.Controller import Controller
 from asn1editor.view.AbstractView import AbstractView, ChoiceView
 from asn1editor.view.AbstractViewFactory import AbstractViewFactory
@@ -14,25 +15,43 @@ class ChoiceInstanceFactory:
     Changes the element selected by a choice.
 
     This class stores the connection between views and controllers after initialization of the GUI to be able to create the choice element on demand.
+    The views and controllers of the last MAX_KEPT_MEMBERS elements that were deselected are kept, so selecting them again restores their values
+    without creating them again.
     """
 
-    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter], choice_view: ChoiceView,
-                 members: Dict[str, oer.Type], checkers: Dict[str, constraints_checker.Type]):
+    MAX_KEPT_MEMBERS = 4
+
+    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter], type_info_cache: TypeInfoCache,
+                 choice_view: ChoiceView, members: Dict[str, TypeDescription.Type]):
         self._view_factory = view_factory
         self._type_augmenter = type_augmenter
+        self._type_info_cache = type_info_cache
         self._choice_view = choice_view
         self._members = members
-        self._checkers = checkers
 
         self._content_view: Optional[AbstractView] = None
         self._member = None
+        # Views and controllers of deselected elements, the least recently deselected first
+        self._kept: typing.OrderedDict[str, Tuple[AbstractView, Controller]] = collections.OrderedDict()
 
     def create(self, member: str, parent: Controller):
         from asn1editor.ViewControllerFactory import ViewControllerFactory
 
         if member != self._member:
-            view_factory = ViewControllerFactory(self._view_factory, self._type_augmenter)
-
-            self._content_view = view_factory.create_view_and_controller(self._members[member], self._checkers[member], parent)
+            type_ = self._members[member]
+            if self._member is not None:
+                self._kept[self._member] = (self._content_view, parent.get_controller())
+
+            kept = self._kept.pop(member, None)
+            if kept is not None:
+                self._content_view, controller = kept
+                parent.add_controller(member, controller)
+            else:
+                view_factory = ViewControllerFactory(self._view_factory, self._type_augmenter, self._type_info_cache)
+                self._content_view = view_factory.create_view_and_controller(type_, parent)
             self._member = member
-            self._choice_view.set_view(self._content_view)
+            self._choice_view.set_view(self._content_view, keep=True)
+
+            while len(self._kept) > self.MAX_KEPT_MEMBERS:
+                view, _ = self._kept.popitem(last=False)[1]
+                self._choice_view.discard_view(view)
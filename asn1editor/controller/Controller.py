@@ -1,8 +1,10 @@
-from typing import Optional, Any, Dict, List, Tuple, Union
+import copy
+from typing import Optional, Any, Callable, Dict, List, Tuple, Union
 
 from asn1editor.controller import Converter
 from asn1editor.interfaces.BitstringInterface import BitstringInterface
 from asn1editor.interfaces.OptionalInterface import OptionalInterface
+from asn1editor.interfaces.PageInterface import PageInterface
 from asn1editor.interfaces.ValueInterface import ValueInterface
 
 
@@ -19,6 +21,8 @@ class Controller:
         self._optional_interface = optional_interface
         if self._optional_interface:
             self._optional_interface.set_has_value(self._optional_interface.get_default_has_value())
+        # Number of ancestors of the controller
+        self.depth = 0 if parent is None else parent.depth + 1
         self.path = ''
         if parent is not None:
             parent.add_controller(name, self)
@@ -35,6 +39,15 @@ class Controller:
         """
         raise NotImplementedError()
 
+    def replace_controller(self, old: 'Controller') -> 'Controller':
+        """
+        Replaces a child controller by the controller that was added last, e.g. when a lazily created element is built.
+
+        @param old: Controller to replace
+        @return: The new controller
+        """
+        raise NotImplementedError()
+
     def model_to_view(self, model: Dict[str, Any]):
         """
         Sets the values from the model to the views
@@ -47,6 +60,17 @@ class Controller:
         """
         raise NotImplementedError()
 
+    def restore(self, value: Any) -> List[str]:
+        """
+        Sets a value of a model that was created for a different version of the ASN.1 specification, for example after the specification was reloaded.
+
+        In contrast to model_to_view, values that do not fit the element are skipped and keep their current value.
+
+        @param value: Value of this element, not a dictionary containing the element name
+        @return: Paths of the values that could not be restored
+        """
+        raise NotImplementedError()
+
     def event_handler(self):
         """
         Handles an event that involves creation or removal of sub-controllers like changing the number of list elements or changing a choice.
@@ -72,6 +96,11 @@ class Controller:
     def _view_to_model_optional(self):
         return not self._optional_interface or self._optional_interface.get_has_value()
 
+    def _restore_optional(self, has_value: bool):
+        if self._optional_interface:
+            self._optional_interface.set_has_value(has_value)
+            self.optional_handler()
+
     def get_path(self) -> str:
         return self.path
 
@@ -108,6 +137,13 @@ class ValueController(Controller):
         if self._view_to_model_optional():
             return self._data_converter.from_view(self._value_interface.get_value())
 
+    def restore(self, value: Any) -> List[str]:
+        if not self._data_converter.accepts(value):
+            return [self.path]
+        self._restore_optional(True)
+        self._set_value(value)
+        return []
+
     def _set_value(self, value: Any):
         self._value_interface.set_value(self._data_converter.to_view(value))
 
@@ -137,19 +173,36 @@ class BoolController(Controller):
         if self._view_to_model_optional():
             return self._value_interface.get_value()
 
+    def restore(self, value: Any) -> List[str]:
+        if not isinstance(value, bool):
+            return [self.path]
+        self._restore_optional(True)
+        self._value_interface.set_value(value)
+        return []
+
 
 class ListController(Controller):
     """
     A list controller manages a list of elements with the same type. The number of elements may be dynamic and a factory is provided to create or destroy new
     instances of the list. This factory creates both the views and the controllers for a new element.
+
+    If the list view has pages, only the elements of the shown page have a view and a controller. The models of all elements are kept by the list
+    controller, so the memory needed for a large list depends on its data and not on its views.
     """
 
+    # Model of an element that was added, but not shown yet
+    __DEFAULT = object()
+
     def __init__(self, name: str, parent: Controller, value_interface: ValueInterface, optional_interface: Optional[OptionalInterface], list_instance_factory,
-                 default: int):
+                 default: int, page_interface: Optional[PageInterface] = None):
         super().__init__(name, parent, optional_interface)
         self._value_interface = value_interface
         self._controllers = []
         self._list_instance_factory = list_instance_factory
+        self._page_interface = page_interface
+        # Models of all elements and index of the first shown element if the list has pages
+        self._values: List[Any] = []
+        self._first = 0
         if default is not None and default > 0 and not optional_interface:
             self._value_interface.set_value(str(default))
             self.event_handler()
@@ -157,25 +210,61 @@ class ListController(Controller):
     def add_controller(self, name: str, other: Controller):
         self._controllers.append(other)
 
+    def replace_controller(self, old: Controller) -> Controller:
+        new = self._controllers.pop()
+        self._controllers[self._controllers.index(old)] = new
+        return new
+
     def model_to_view(self, model: Union[List[Any], Dict[str, Any]]):
-        if self._model_to_view_optional(model):
-            if isinstance(model, Dict):
-                model: List = model[self._name]
-            new_num = len(model)
-            self.__sync_controllers(new_num)
-            for i, controller in enumerate(self._controllers):
-                controller.model_to_view(model[i])
-            self._value_interface.set_value(str(new_num))
-        else:
-            self.__sync_controllers(0)
+        with self._list_instance_factory.update():
+            if self._model_to_view_optional(model):
+                if isinstance(model, Dict):
+                    model: List = model[self._name]
+                new_num = len(model)
+                if self._page_interface is not None:
+                    self.__resize_page(0, store=False)
+                    self._values = copy.deepcopy(model)
+                    self.__show_page(self._first, new_num)
+                else:
+                    self.__sync_controllers(new_num)
+                    for i, controller in enumerate(self._controllers):
+                        controller.model_to_view(model[i])
+                self._value_interface.set_value(str(new_num))
+            else:
+                self.__sync_controllers(0)
 
     def view_to_model(self) -> Optional[List]:
         if self._view_to_model_optional():
+            if self._page_interface is not None:
+                self.__store_page()
+                return [self._list_instance_factory.get_default(self) if value is self.__DEFAULT else copy.deepcopy(value) for value in self._values]
             model = []
             for controller in self._controllers:
                 model.append(controller.view_to_model())
             return model
 
+    def restore(self, value: Any) -> List[str]:
+        if not isinstance(value, list):
+            return [self.path]
+        with self._list_instance_factory.update():
+            return self.__restore(value)
+
+    def __restore(self, value: List[Any]) -> List[str]:
+        self._restore_optional(True)
+        if self._page_interface is not None:
+            # Elements on other pages are restored when their page is shown
+            self.__resize_page(0, store=False)
+            self._values = [self.__DEFAULT] * len(value)
+            self.__show_page(self._first, len(value))
+            self._values = copy.deepcopy(value)
+        else:
+            self.__sync_controllers(len(value))
+        self._value_interface.set_value(str(len(value)))
+        not_restored = []
+        for controller, element in zip(self._controllers, value[self._first:] if self._page_interface is not None else value):
+            not_restored += controller.restore(element)
+        return not_restored
+
     def event_handler(self):
         new_num = int(self._value_interface.get_value())
         self.__sync_controllers(new_num)
@@ -186,8 +275,18 @@ class ListController(Controller):
         else:
             self.event_handler()
 
+    def page_handler(self):
+        with self._list_instance_factory.update():
+            self.__show_page(self._page_interface.get_page() * self._page_interface.get_page_size(), len(self._values))
+
     def __sync_controllers(self, new_num: int):
-        if new_num > len(self._controllers):
+        with self._list_instance_factory.update():
+            self.__sync_elements(new_num)
+
+    def __sync_elements(self, new_num: int):
+        if self._page_interface is not None:
+            self.__show_page(self._first, new_num)
+        elif new_num > len(self._controllers):
             prev_num = len(self._controllers)
             for i in range(prev_num, new_num):
                 self._list_instance_factory.create(i, self)
@@ -198,6 +297,38 @@ class ListController(Controller):
                 # And finally destroy the controller
                 del self._controllers[i]
 
+    def __show_page(self, first: int, new_num: int):
+        page_size = self._page_interface.get_page_size()
+        first = min(first, (max(new_num, 1) - 1) // page_size * page_size)
+        self._values += [self.__DEFAULT] * (new_num - len(self._values))
+        if first != self._first:
+            self.__resize_page(0)
+            self._first = first
+        self.__resize_page(min(page_size, new_num - first))
+        del self._values[new_num:]
+        self._page_interface.set_page(first // page_size, max(-(-new_num // page_size), 1))
+
+    def __resize_page(self, num: int, store: bool = True):
+        for i in range(len(self._controllers), num):
+            self._list_instance_factory.create(self._first + i, self)
+            if self._values[self._first + i] is not self.__DEFAULT:
+                self._controllers[i].model_to_view(self._values[self._first + i])
+        for i in reversed(range(num, len(self._controllers))):
+            if store:
+                self.__store(i)
+            self._list_instance_factory.destroy(self._first + i)
+            del self._controllers[i]
+
+    def __store_page(self):
+        for i in range(len(self._controllers)):
+            self.__store(i)
+
+    def __store(self, i: int):
+        controller = self._controllers[i]
+        # Elements that were not built still have the model they were created with
+        if not isinstance(controller, LazyController) or controller.is_built():
+            self._values[self._first + i] = controller.view_to_model()
+
 
 class ChoiceController(Controller):
     """
@@ -216,6 +347,15 @@ class ChoiceController(Controller):
     def add_controller(self, name: str, other: 'Controller'):
         self._controller = other
 
+    def replace_controller(self, old: Controller) -> Controller:
+        return self._controller
+
+    def get_controller(self) -> Optional[Controller]:
+        """
+        @return: Controller of the selected element
+        """
+        return self._controller
+
     def model_to_view(self, model: Dict[str, Any]):
         if self._model_to_view_optional(model):
             choice = model[self._name][0]
@@ -227,6 +367,18 @@ class ChoiceController(Controller):
         if self._view_to_model_optional():
             return self._value_interface.get_value(), self._controller.view_to_model()
 
+    def restore(self, value: Any) -> List[str]:
+        if not isinstance(value, (tuple, list)) or len(value) != 2:
+            return [self.path]
+        choice = value[0]
+        try:
+            self._choice_instance_factory.create(choice, self)
+        except KeyError:
+            return [f'{self.path}.{choice}']
+        self._restore_optional(True)
+        self._value_interface.set_value(choice)
+        return self._controller.restore(value[1])
+
     def event_handler(self):
         choice = self._value_interface.get_value()
         self._choice_instance_factory.create(choice, self)
@@ -265,6 +417,12 @@ class BitstringController(Controller):
 
             return bytes_, self._number_of_bits
 
+    def restore(self, value: Any) -> List[str]:
+        if not isinstance(value, (tuple, list)) or len(value) != 2 or value[1] != self._number_of_bits:
+            return [self.path]
+        self.model_to_view({self._name: value})
+        return []
+
 
 class ContainerController(Controller):
     def __init__(self, name: str, parent: Optional[Controller], optional_interface: Optional[OptionalInterface]):
@@ -274,6 +432,10 @@ class ContainerController(Controller):
     def add_controller(self, name: str, other: Controller):
         self._controllers[name] = other
 
+    def replace_controller(self, old: Controller) -> Controller:
+        # The new controller was added with the same name
+        return self._controllers[old._name]
+
     def model_to_view(self, model: Dict[str, Any]):
         if self._model_to_view_optional(model):
             if isinstance(self._parent, ListController) or isinstance(self._parent, ChoiceController):
@@ -285,10 +447,27 @@ class ContainerController(Controller):
         if self._view_to_model_optional():
             return self._view_to_model()
 
+    def restore(self, value: Any) -> List[str]:
+        if not isinstance(value, dict):
+            return [self.path]
+        self._restore_optional(True)
+        return self._restore(value)
+
     def _model_to_view(self, model: Dict[str, Any]):
         for name, controller in self._controllers.items():
             controller.model_to_view(model)
 
+    def _restore(self, model: Dict[str, Any]) -> List[str]:
+        not_restored = []
+        for name, controller in self._controllers.items():
+            if name in model:
+                not_restored += controller.restore(model[name])
+            elif controller._optional_interface:
+                controller._restore_optional(False)
+        prefix = self.path + '.' if self.path else ''
+        not_restored += [prefix + name for name in model if name not in self._controllers]
+        return not_restored
+
     def _view_to_model(self) -> Dict[str, Any]:
         model = {}
         for name, controller in self._controllers.items():
@@ -309,6 +488,111 @@ class NullController(Controller):
     def view_to_model(self) -> Optional:
         return None
 
+    def restore(self, value: Any) -> List[str]:
+        return []
+
+
+class OptionalController(Controller):
+    """
+    An optional controller manages an optional element, whose view and controller only exist while the element is present.
+
+    A factory creates the element when it is enabled or a model contains it, and removes it again when it is disabled. The controller of the element
+    is a child of this controller, but it has the path it would have as a child of the parent.
+    """
+
+    def __init__(self, name: str, parent: Controller, optional_interface: OptionalInterface, optional_instance_factory):
+        super().__init__(name, parent, optional_interface)
+        self._controller: Optional[Controller] = None
+        self._optional_instance_factory = optional_instance_factory
+
+    def add_controller(self, name: str, other: Controller):
+        self._controller = other
+
+    def get_path(self) -> str:
+        return self._parent.get_path()
+
+    def model_to_view(self, model: Dict[str, Any]):
+        if self._model_to_view_optional(model):
+            self.__create()
+            self._controller.model_to_view(model)
+        else:
+            self.__destroy()
+
+    def view_to_model(self) -> Any:
+        if self._controller is not None and self._view_to_model_optional():
+            return self._controller.view_to_model()
+
+    def restore(self, value: Any) -> List[str]:
+        self._restore_optional(True)
+        return self._controller.restore(value)
+
+    def optional_handler(self):
+        if self._optional_interface.get_has_value():
+            self.__create()
+        else:
+            self.__destroy()
+
+    def __create(self):
+        if self._controller is None:
+            self._optional_instance_factory.create(self)
+
+    def __destroy(self):
+        if self._controller is not None:
+            self._optional_instance_factory.destroy()
+            self._controller = None
+
+
+class LazyController(Controller):
+    """
+    Placeholder for an element whose view and controller are created on demand, e.g. when its view is shown for the first time.
+
+    Building the element replaces the placeholder in the parent controller. Setting the model of an element that was not built yet builds it, while reading
+    its model returns the default model without building it.
+    """
+
+    def __init__(self, name: str, parent: Controller):
+        super().__init__(name, parent, None)
+        # Builds the view of the element, set by the view controller factory
+        self.realize: Optional[Callable[[], Any]] = None
+        # Returns the model of the element with default values, set by the view controller factory
+        self.get_default: Optional[Callable[[], Any]] = None
+        self._controller: Optional[Controller] = None
+
+    def add_controller(self, name: str, other: 'Controller'):
+        raise Exception('LazyController cannot add a controller')
+
+    def build(self, create: Callable[[Controller], Any]) -> Any:
+        """
+        Creates the element in the parent controller and replaces the placeholder with it.
+
+        @param create: Creates the view and the controller of the element for a given parent controller
+        @return: View of the element
+        """
+        view = create(self._parent)
+        self._controller = self._parent.replace_controller(self)
+        return view
+
+    def is_built(self) -> bool:
+        return self._controller is not None
+
+    def model_to_view(self, model: Dict[str, Any]):
+        self.__get_controller().model_to_view(model)
+
+    def view_to_model(self) -> Any:
+        if self._controller is None and self.get_default is not None:
+            return self.get_default()
+        return self.__get_controller().view_to_model()
+
+    def restore(self, value: Any) -> List[str]:
+        if self._controller is None and self.get_default is not None and value == self.get_default():
+            return []
+        return self.__get_controller().restore(value)
+
+    def __get_controller(self) -> Controller:
+        if self._controller is None:
+            self.realize()
+        return self._controller
+
 
 class RootController(ContainerController):
     def __init__(self, name: str):
@@ -319,3 +603,6 @@ class RootController(ContainerController):
 
     def view_to_model(self) -> Optional[Dict[str, Any]]:
         return self._view_to_model()
+
+    def restore(self, value: Dict[str, Any]) -> List[str]:
+        return self._restore(value)
@@ -25,6 +25,12 @@ class Converter:
     def default() -> typing.Union[str, bytes, int, float]:  # pragma: no cover
         raise NotImplementedError
 
+    def accepts(self, val: typing.Any) -> bool:  # pragma: no cover
+        """
+        Returns True if a model value has the data type expected by the converter
+        """
+        raise NotImplementedError
+
 
 class Str(Converter):
     @staticmethod
@@ -38,6 +44,9 @@ class Str(Converter):
     def default(self) -> str:
         return ' ' * self._minimum if not self._default else self._default
 
+    def accepts(self, val: typing.Any) -> bool:
+        return isinstance(val, str)
+
 
 class Any(Converter):
     @staticmethod
@@ -51,6 +60,9 @@ class Any(Converter):
     def default(self) -> typing.Any:
         return self._default
 
+    def accepts(self, val: typing.Any) -> bool:
+        return self._default is None or type(val) is type(self._default)
+
 
 class Int(Converter):
     @staticmethod
@@ -68,6 +80,9 @@ class Int(Converter):
     def default(self) -> int:
         return self._minimum if not self._default else self.from_view(self._default)
 
+    def accepts(self, val: typing.Any) -> bool:
+        return isinstance(val, int) and not isinstance(val, bool)
+
 
 class Float(Converter):
     @staticmethod
@@ -85,6 +100,9 @@ class Float(Converter):
     def default(self) -> float:
         return self._minimum if not self._default else self._default
 
+    def accepts(self, val: typing.Any) -> bool:
+        return isinstance(val, (int, float)) and not isinstance(val, bool)
+
 
 class ByteString(Converter):
     @staticmethod
@@ -99,3 +117,7 @@ class ByteString(Converter):
         if isinstance(self._default, str):
             self._default = self._default.encode('latin-1')
         return b' ' * self._minimum if not self._default else self._default
+
+    def accepts(self, val: typing.Any) -> bool:
+        # BIT STRINGs without a fixed size are edited as byte strings, but their model value is a tuple of bytes and number of bits
+        return isinstance(val, (bytes, bytearray, tuple))
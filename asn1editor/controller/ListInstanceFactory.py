@@ -1,9 +1,10 @@
+import contextlib
 import typing
 from typing import Dict
 
-from asn1tools.codecs import oer, constraints_checker
-
+from asn1editor import TypeDescription
 from asn1editor.TypeAugmenter import TypeAugmenter
+from asn1editor.TypeInfoCache import TypeInfoCache
 from asn1editor.controller.Controller import Controller
 from asn1editor.view.AbstractView import ListView, AbstractView
 from asn1editor.view.AbstractViewFactory import AbstractViewFactory
@@ -16,22 +17,24 @@ class ListInstanceFactory:
     This class stores the connection between views and controllers after initialization of the GUI to be able to create list elements on demand.
     """
 
-    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter], list_view: ListView, _type: oer.Type,
-                 checker: constraints_checker.Type):
+    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter], type_info_cache: TypeInfoCache,
+                 list_view: ListView, _type: TypeDescription.Type):
         self._view_factory = view_factory
         self._type_augmenter = type_augmenter
+        self._type_info_cache = type_info_cache
         self._list_view = list_view
         self._type = _type
-        self._checker = checker
 
         self.content_views: Dict[int, AbstractView] = {}
+        self._view_controller_factory = None
 
     def create(self, instance: int, parent: Controller):
-        from asn1editor.ViewControllerFactory import ViewControllerFactory
+        if self._view_controller_factory is None:
+            self._view_controller_factory = self.__get_view_controller_factory_class()(self._view_factory, self._type_augmenter, self._type_info_cache)
 
-        view_factory = ViewControllerFactory(self._view_factory, self._type_augmenter)
-        self._type.name = f'Element {instance}'
-        self.content_views[instance] = view_factory.create_view_and_controller(self._type, self._checker, parent)
+        # The element types are kept by the cache, so the views of recreated elements share their TypeInfo
+        element_type = self._type_info_cache.get_element_type(self._type, instance)
+        self.content_views[instance] = self._view_controller_factory.create_view_and_controller(element_type, parent)
 
         self._list_view.add(self.content_views[instance])
 
@@ -39,3 +42,29 @@ class ListInstanceFactory:
         self._list_view.remove(self.content_views[instance])
 
         del self.content_views[instance]
+
+    def get_default(self, parent: Controller) -> typing.Any:
+        """
+        Returns the model of a new list element without creating its views and controllers
+
+        @param parent: Controller of the list
+        @return: Default model of an element
+        """
+        return self.__get_view_controller_factory_class().get_default_model(self._type, parent)
+
+    @staticmethod
+    def __get_view_controller_factory_class():
+        from asn1editor.ViewControllerFactory import ViewControllerFactory
+
+        return ViewControllerFactory
+
+    @contextlib.contextmanager
+    def update(self):
+        """
+        Context in which several list elements are created, destroyed or changed, while the list view updates its layout only once
+        """
+        self._list_view.begin_update()
+        try:
+            yield
+        finally:
+            self._list_view.end_update()
@@ -0,0 +1,34 @@
+import typing
+
+from asn1editor import TypeDescription
+from asn1editor.TypeAugmenter import TypeAugmenter
+from asn1editor.TypeInfoCache import TypeInfoCache
+from asn1editor.controller.Controller import Controller
+from asn1editor.view.AbstractView import OptionalView
+from asn1editor.view.AbstractViewFactory import AbstractViewFactory
+
+
+class OptionalInstanceFactory:
+    """
+    Creates or removes the element of an optional element.
+
+    This class stores the connection between views and controllers after initialization of the GUI to be able to create the element on demand.
+    """
+
+    def __init__(self, view_factory: AbstractViewFactory, type_augmenter: typing.Optional[TypeAugmenter], type_info_cache: TypeInfoCache,
+                 optional_view: OptionalView, _type: TypeDescription.Type):
+        self._view_factory = view_factory
+        self._type_augmenter = type_augmenter
+        self._type_info_cache = type_info_cache
+        self._optional_view = optional_view
+        # The presence of the element is managed by the optional controller
+        self._type = type_info_cache.get_required_type(_type)
+
+    def create(self, parent: Controller):
+        from asn1editor.ViewControllerFactory import ViewControllerFactory
+
+        view_factory = ViewControllerFactory(self._view_factory, self._type_augmenter, self._type_info_cache)
+        self._optional_view.set_view(view_factory.create_view_and_controller(self._type, parent, lazy=False))
+
+    def destroy(self):
+        self._optional_view.set_view(None)
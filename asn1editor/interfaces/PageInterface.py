@@ -0,0 +1,28 @@
+from typing import Callable
+
+
+class PageInterface:  # pragma: no cover
+    """
+    Interface for list views that only show the elements of one page.
+
+    Only the views and controllers of the elements on the shown page exist, the list controller keeps the models of the other elements.
+    Needs to be provided by the list view if the view factory supports pages.
+    """
+
+    def register_page_event(self, callback: Callable):
+        """
+        Called by the controller to register a callback that needs to be called whenever another page is selected.
+        """
+        raise NotImplementedError
+
+    def get_page_size(self) -> int:
+        raise NotImplementedError
+
+    def get_page(self) -> int:
+        raise NotImplementedError
+
+    def set_page(self, page: int, pages: int):
+        """
+        Shows the index of the current page and the number of pages
+        """
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any
+from typing import Any, Optional
 
 
 class AbstractView:  # pragma: no cover
@@ -43,14 +43,45 @@ class ListView(AbstractView, ABC):  # pragma: no cover
         """
         raise NotImplementedError
 
+    def begin_update(self):
+        """
+        Called before several list elements are added, removed or changed. Updates may be nested.
+        """
+        pass
+
+    def end_update(self):
+        """
+        Called after the list elements were changed, so the view can update its layout once for all changes.
+        """
+        pass
+
+
+class OptionalView(AbstractView, ABC):  # pragma: no cover
+    """
+    Abstract view of an optional element, whose element view only exists while the element is present
+    """
+
+    def set_view(self, view: Optional[AbstractView]):
+        """
+        Sets the view of the element when it is enabled or removes it when it is disabled
+        """
+        raise NotImplementedError
+
 
 class ChoiceView(AbstractView, ABC):  # pragma: no cover
     """
     Abstract choice view allowing to replace the choice element view
     """
 
-    def set_view(self, view: AbstractView):
+    def set_view(self, view: AbstractView, keep: bool = False):
+        """
+        Replaces the choice element view. If keep is set, the replaced view is only hidden, so it can be set again later, otherwise it is destroyed.
+        Kept views are destroyed together with the choice view.
+        """
+        raise NotImplementedError
+
+    def discard_view(self, view: AbstractView):
         """
-        Replaces the choice element view
+        Destroys a view that was kept when it was replaced
         """
         raise NotImplementedError
@@ -5,7 +5,7 @@ from typing import Tuple, List, Optional
 from asn1editor.interfaces.BitstringInterface import BitstringInterface
 from asn1editor.interfaces.OptionalInterface import OptionalInterface
 from asn1editor.interfaces.ValueInterface import ValueInterface
-from asn1editor.view.AbstractView import AbstractView, ContainerView, ListView, ChoiceView
+from asn1editor.view.AbstractView import AbstractView, ContainerView, ListView, ChoiceView, OptionalView
 
 
 class Styles(IntFlag):
@@ -29,6 +29,7 @@ class TypeInfo:
     additional: If set, the element is part of the additional elements in an ASN.1 spec
     style: Additional styling flags
     help: Optional help string
+    recursive: If set, the element is a reference to a type that contains itself, so its view should only be built when it is used
     """
     name: str = ''
     tag: str = ''
@@ -37,6 +38,7 @@ class TypeInfo:
     additional: bool = False
     style: Styles = 0
     help: typing.Optional[str] = None
+    recursive: bool = False
 
 
 class AbstractViewFactory:  # pragma: no cover
@@ -78,6 +80,22 @@ class AbstractViewFactory:  # pragma: no cover
             Tuple[AbstractView, BitstringInterface, OptionalInterface]:
         raise NotImplementedError
 
+    def get_lazy_view(self, type_info: TypeInfo, build: typing.Callable[[], AbstractView]) -> AbstractView:
+        """
+        Returns a placeholder for a container, list or choice view, which calls build to create the view and its controller when it is realized.
+
+        View factories that do not create views lazily return the built view.
+        """
+        return build()
+
+    def get_optional_view(self, type_info: TypeInfo, container: bool) -> Optional[Tuple[OptionalView, OptionalInterface]]:
+        """
+        Returns the view of an optional element, which only contains the control to enable the element. The view of the element is set when it is enabled.
+
+        The default implementation returns None, which means that optional elements are always created.
+        """
+        return None
+
     def get_date_view(self, type_info: TypeInfo) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
         raise NotImplementedError
 
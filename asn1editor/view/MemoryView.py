@@ -0,0 +1,143 @@
+import typing
+from typing import Any, Callable, List, Optional
+
+from asn1editor.interfaces.BitstringInterface import BitstringInterface
+from asn1editor.interfaces.OptionalInterface import OptionalInterface
+from asn1editor.interfaces.PageInterface import PageInterface
+from asn1editor.interfaces.ValueInterface import ValueInterface
+from asn1editor.view.AbstractView import ContainerView, ListView, ChoiceView, OptionalView
+from asn1editor.view.AbstractViewFactory import TypeInfo
+
+
+class MemoryView(ContainerView, ListView, ChoiceView, OptionalView, ValueInterface, OptionalInterface, BitstringInterface):
+    """
+    View without any GUI, which stores the values set by its controller.
+
+    A single class serves as view and interface for all types, so the view tree can be walked without knowing the type of its elements.
+    change_value and change_has_value simulate the input of a user by calling the registered callbacks.
+    """
+
+    def __init__(self, type_info: TypeInfo, value: Any = None):
+        self.type_info = type_info
+        self.children: List['MemoryView'] = []
+        self.view: Optional['MemoryView'] = None
+        self._value = value
+        self._values: List[int] = []
+        self._has_value = True
+        self._change_callback: Optional[Callable] = None
+        self._optional_callback: Optional[Callable] = None
+
+    def realize(self) -> 'MemoryView':
+        return self
+
+    def add_child(self, view: 'MemoryView'):
+        self.children.append(view)
+
+    def add(self, view: 'MemoryView'):
+        self.children.append(view)
+
+    def remove(self, view: 'MemoryView'):
+        self.children.remove(view)
+
+    def set_view(self, view: Optional['MemoryView'], keep: bool = False):
+        self.view = view
+
+    def discard_view(self, view: 'MemoryView'):
+        pass
+
+    def register_change_event(self, callback: Callable):
+        self._change_callback = callback
+
+    def register_optional_event(self, callback: Callable):
+        self._optional_callback = callback
+
+    def get_value(self) -> Any:
+        return self._value
+
+    def set_value(self, val: Any):
+        self._value = val
+
+    def get_values(self) -> typing.List[int]:
+        return self._values
+
+    def set_values(self, values: typing.List[int]):
+        self._values = list(values)
+
+    def get_has_value(self) -> bool:
+        if self.type_info.additional and not self.type_info.optional:
+            return True
+        return self._has_value
+
+    def set_has_value(self, val: bool):
+        self._has_value = val
+
+    def get_default_has_value(self) -> bool:
+        return not self.type_info.optional
+
+    def change_value(self, val: Any):
+        """
+        Sets a value and notifies the controller, e.g. to change the number of list elements or the selected choice element
+        """
+        self.set_value(val)
+        if self._change_callback is not None:
+            self._change_callback()
+
+    def change_has_value(self, val: bool):
+        """
+        Sets the presence of an optional element and notifies the controller
+        """
+        self.set_has_value(val)
+        if self._optional_callback is not None:
+            self._optional_callback()
+
+
+class MemoryLazyView(MemoryView):
+    """
+    Placeholder for the view of a recursive type, which builds the view and its controller when it is realized
+    """
+
+    def __init__(self, type_info: TypeInfo, build: Callable[[], MemoryView]):
+        super(MemoryLazyView, self).__init__(type_info)
+        self._build = build
+        self._view: Optional[MemoryView] = None
+
+    def realize(self) -> MemoryView:
+        if self._view is None:
+            self._view = self._build()
+        return self._view
+
+
+class MemoryPagedView(MemoryView, PageInterface):
+    """
+    List view without any GUI, which only contains the elements of one page.
+
+    change_page simulates the selection of another page by a user.
+    """
+
+    def __init__(self, type_info: TypeInfo, value: Any, page_size: int):
+        super(MemoryPagedView, self).__init__(type_info, value)
+        self.page_size = page_size
+        self.page = 0
+        self.pages = 1
+        self._page_callback: Optional[Callable] = None
+
+    def register_page_event(self, callback: Callable):
+        self._page_callback = callback
+
+    def get_page_size(self) -> int:
+        return self.page_size
+
+    def get_page(self) -> int:
+        return self.page
+
+    def set_page(self, page: int, pages: int):
+        self.page = page
+        self.pages = pages
+
+    def change_page(self, page: int):
+        """
+        Selects another page and notifies the controller
+        """
+        self.page = page
+        if self._page_callback is not None:
+            self._page_callback()
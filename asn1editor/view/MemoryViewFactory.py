@@ -0,0 +1,86 @@
+from typing import Callable, List, Tuple, Optional, Union
+
+from asn1editor.interfaces.BitstringInterface import BitstringInterface
+from asn1editor.interfaces.OptionalInterface import OptionalInterface
+from asn1editor.interfaces.ValueInterface import ValueInterface
+from asn1editor.view.AbstractView import AbstractView, ContainerView, ListView, ChoiceView, OptionalView
+from asn1editor.view.AbstractViewFactory import AbstractViewFactory, TypeInfo
+from asn1editor.view.MemoryView import MemoryView, MemoryLazyView, MemoryPagedView
+
+
+class MemoryViewFactory(AbstractViewFactory):
+    """
+    Creates views that only store their values in memory.
+
+    Controllers created with this factory work without any GUI toolkit, e.g. to create default values, to check data or to convert data in scripts and tests.
+    Optional elements are only created when they are enabled and references to recursive types when they are realized.
+    """
+
+    def __init__(self, page_size: Optional[int] = None):
+        """
+        @param page_size: If set, lists only contain the elements of one page with the given number of elements
+        """
+        self._page_size = page_size
+
+    def get_number_view(self, type_info: TypeInfo, minimum: Optional[Union[int, float]], maximum: Optional[Union[int, float]], float_: bool) -> \
+            Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_text_view(self, type_info: TypeInfo, text: str) -> AbstractView:
+        return MemoryView(type_info, text)
+
+    def get_container_view(self, type_info: TypeInfo) -> Tuple[ContainerView, OptionalInterface]:
+        view = MemoryView(type_info)
+        return view, self.__get_optional_interface(view)
+
+    def get_lazy_view(self, type_info: TypeInfo, build: Callable[[], AbstractView]) -> AbstractView:
+        if type_info.recursive:
+            return MemoryLazyView(type_info, build)
+        return build()
+
+    def get_optional_view(self, type_info: TypeInfo, container: bool) -> Tuple[OptionalView, OptionalInterface]:
+        view = MemoryView(type_info)
+        return view, view
+
+    def get_list_view(self, type_info: TypeInfo, minimum: int, maximum: int) -> Tuple[ListView, ValueInterface, OptionalInterface]:
+        if self._page_size is None:
+            return self.__get_value_view(type_info, 0)
+        view = MemoryPagedView(type_info, 0, self._page_size)
+        return view, view, self.__get_optional_interface(view)
+
+    def get_enumerated_view(self, type_info: TypeInfo, choices: List[str]) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_boolean_view(self, type_info: TypeInfo) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_hex_string_view(self, type_info: TypeInfo, minimum: Optional[int], maximum: Optional[int]) -> \
+            Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_string_view(self, type_info: TypeInfo, minimum: int, maximum: int) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_choice_view(self, type_info: TypeInfo, choices: List[str]) -> Tuple[ChoiceView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_bitstring_view(self, type_info: TypeInfo, number_of_bits: int, named_bits: List[Tuple[int, str]]) -> \
+            Tuple[AbstractView, BitstringInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_date_view(self, type_info: TypeInfo) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_time_view(self, type_info: TypeInfo) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def get_datetime_view(self, type_info: TypeInfo) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
+        return self.__get_value_view(type_info)
+
+    def __get_value_view(self, type_info: TypeInfo, value=None) -> Tuple[MemoryView, MemoryView, Optional[MemoryView]]:
+        view = MemoryView(type_info, value)
+        return view, view, self.__get_optional_interface(view)
+
+    @staticmethod
+    def __get_optional_interface(view: MemoryView) -> Optional[MemoryView]:
+        return view if view.type_info.optional or view.type_info.additional else None
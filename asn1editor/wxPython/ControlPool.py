@@ -0,0 +1,56 @@
+import typing
+
+import wx
+import wx.lib.masked.numctrl
+
+Control = typing.TypeVar('Control', bound=wx.Window)
+
+
+class ControlPool:
+    """
+    Keeps the controls of destroyed views hidden to reuse them for new views of the same kind.
+
+    Creating and destroying native controls is slow, so resizing lists and switching choices reuses the controls of the removed elements.
+    """
+
+    KINDS = (wx.TextCtrl, wx.lib.masked.numctrl.NumCtrl, wx.CheckBox, wx.ComboBox, wx.SpinCtrl, wx.StaticText, wx.StaticBitmap)
+    # Maximum number of kept controls of each kind, further released controls are destroyed
+    MAX_CONTROLS = 500
+
+    def __init__(self):
+        self._controls: typing.Dict[type, typing.List[wx.Window]] = {}
+
+    def get(self, kind: typing.Type[Control]) -> typing.Optional[Control]:
+        """
+        Returns a released control, which is shown and enabled again. The caller has to set everything else, e.g. the value and the tooltip.
+
+        @param kind: Class of the control
+        @return: Released control of this class or None if there is none
+        """
+        controls = self._controls.get(kind)
+        if not controls:
+            return None
+
+        control = controls.pop()
+        control.Enable(True)
+        control.Show(True)
+        return control
+
+    def release(self, control: wx.Window):
+        """
+        Hides the control to reuse it or destroys it if it cannot be reused or the pool is full.
+        The event handlers of the control must be unbound before.
+
+        @param control: Control of a destroyed view
+        """
+        kind = type(control)
+        if kind not in self.KINDS or len(self._controls.get(kind, [])) >= self.MAX_CONTROLS:
+            control.Destroy()
+            return
+
+        sizer = control.GetContainingSizer()
+        if sizer is not None:
+            sizer.Detach(control)
+        control.Hide()
+        control.UnsetToolTip()
+        self._controls.setdefault(kind, []).append(control)
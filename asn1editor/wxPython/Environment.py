@@ -18,6 +18,10 @@ def _get_dir() -> str:
         return ''
 
 
+def get_spec_cache_dir() -> str:
+    return os.path.join(_get_dir(), 'spec_cache')
+
+
 def _get_settings_filename() -> str:
     return os.path.join(_get_dir(), 'settings.json')
 
@@ -1,3 +1,4 @@
+import contextlib
 import os
 import sys
 import typing
@@ -7,8 +8,11 @@ import wx.svg
 
 import asn1editor
 from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.CompileProcess import CompileProcess
 from asn1editor.Plugin import Plugin
 from asn1editor.PluginInterface import PluginInterface
+from asn1editor.SpecCache import SpecCache
+from asn1editor.SpecWorkspace import SpecWorkspace
 from asn1editor.TypeAugmenter import TypeAugmenter
 from asn1editor.wxPython import Environment, Resources
 from asn1editor.wxPython import WxPythonViewFactory
@@ -32,6 +36,9 @@ class MainWindow(wx.Frame, PluginInterface):
         Environment.load()
         Resources.image_list = ImageList()
 
+        self.__spec_cache = SpecCache(Environment.get_spec_cache_dir(), Environment.settings.get('spec_cache_size', 512 * 1024 * 1024))
+        self.__workspace = SpecWorkspace(self.__spec_cache, Environment.settings.get('workspace_memory', 256 * 1024 * 1024))
+
         if plugins is not None:
             for plugin in plugins:
                 plugin.connect(self)
@@ -41,7 +48,7 @@ class MainWindow(wx.Frame, PluginInterface):
         self._status_bar = self.CreateStatusBar()
 
         self._menu_handler = MenuHandler(self, plugins, self.__about_box_content(title, plugins))
-        self._menu_handler.build(self.load_spec, self.load_data_from_file, self.save_data_to_file, self._structure_changed)
+        self._menu_handler.build(self.load_spec, self.load_data_from_file, self.save_data_to_file, self._structure_changed, self.clear_spec_cache)
 
         self.Bind(wx.EVT_CLOSE, self.close)
 
@@ -54,6 +61,7 @@ class MainWindow(wx.Frame, PluginInterface):
             pass
         self._menu_handler.recent = Environment.settings.get('recent', [])
         self._menu_handler.load_last = Environment.settings.get('load_last', True)
+        self._menu_handler.compile_type_only = Environment.settings.get('compile_type_only', False)
 
         self.__asn1_handler: typing.Optional[ASN1SpecHandler] = None
 
@@ -67,6 +75,19 @@ class MainWindow(wx.Frame, PluginInterface):
 
         self.__progress_window: typing.Optional[wx.ProgressDialog] = None
 
+        # Set if the structure of the views changed and the layout is rebuilt when the pending events were handled
+        self.__layout_pending = False
+        # Number of running changes of the views, which update the layout themselves when they are done
+        self.__layout_suspended = 0
+        # Set if all views are shown again before the next layout in the groups view, which also creates all sizers again
+        self.__show_all = True
+
+        # Poll the loaded spec files to reload them when they are edited
+        self.__reload_timer = wx.Timer(self)
+        # Handler whose changed spec files are parsed in the background while the editor stays usable, and the parsing process
+        self.__reload_process: typing.Optional[typing.Tuple[ASN1SpecHandler, CompileProcess]] = None
+        self.Bind(wx.EVT_TIMER, self.__check_spec_files, self.__reload_timer)
+
         self.SetDropTarget(SingleFileDropTarget(self.__file_dropped))
 
         self.SetSizer(wx.GridSizer(1))
@@ -75,7 +96,7 @@ class MainWindow(wx.Frame, PluginInterface):
         # noinspection SpellCheckingInspection
         sys.excepthook = self.__exception_handler
 
-        WxPythonView.structure_changed = None
+        WxPythonView.structure_changed = self.__structure_changed_later
 
         if self._menu_handler.load_last and enable_load_last:
             # noinspection PyBroadException
@@ -102,21 +123,31 @@ class MainWindow(wx.Frame, PluginInterface):
 
     def load_spec(self, file_name: typing.Optional[str], type_name: typing.Optional[str] = None) -> bool:
         wx.App.Get().ProcessPendingEvents()
+        self.__reload_timer.Stop()
         if file_name is None:
             # Close spec
             self.__close_spec()
             return True
 
-        # Spec file loaded, compile it to show a selection of type names
+        previous = self.__asn1_handler, self.__type_name
+        # Spec file loaded, compile it to show a selection of type names. Recently used specs are taken from the workspace.
         if not self.__asn1_handler or not self.__asn1_handler.is_loaded(file_name):
             try:
-                self.__asn1_handler = ASN1SpecHandler(file_name)
+                self.__asn1_handler = self.__workspace.get(file_name, self._menu_handler.compile_type_only)
             except FileNotFoundError:
                 self.show_message(f'File {file_name} not found', 'Error', PluginInterface.MessageType.ERROR)
                 return False
+        if len(self.__asn1_handler.get_changed_files()) and not self.__reload_changed_files(file_name):
+            self.__asn1_handler, self.__type_name = previous
+            if self.__view is not None:
+                self.__reload_timer.Start(1000)
+            return False
 
+        process = None
         if type_name is None:
-            types = self.__asn1_handler.get_types()
+            # Compile while the user selects the type
+            process = self.__asn1_handler.start_compile_process([ASN1SpecHandler.DESCRIPTION])
+            types = self.__asn1_handler.get_type_names()
             dialog = wx.SingleChoiceDialog(self, 'Select type from ASN.1 file', 'Select type', types)
             try:
                 if dialog.ShowModal() == wx.ID_OK:
@@ -127,11 +158,61 @@ class MainWindow(wx.Frame, PluginInterface):
             self.__type_name = type_name
 
         if self.__type_name is not None:
-            self.__load_spec(file_name)
+            if not self.__load_spec(file_name, process):
+                # Compilation was cancelled, keep the previously loaded spec
+                self.__asn1_handler, self.__type_name = previous
+                if self.__view is not None:
+                    self.__reload_timer.Start(1000)
+                return False
+        elif process is not None:
+            process.cancel()
 
         return self.__type_name is not None
 
-    def __load_spec(self, file_name):
+    def __compile_spec(self, file_name: str, process: typing.Optional[CompileProcess]) -> bool:
+        if process is None:
+            process = self.__asn1_handler.start_compile_process([ASN1SpecHandler.DESCRIPTION])
+        if process is None:
+            return True
+
+        if not self.__wait_for_process(process, f'Compiling {os.path.basename(file_name)}', 'Compiling specification'):
+            self._status_bar.SetStatusText(f'Compiling {file_name} cancelled')
+            return False
+
+        self.__asn1_handler.set_state(process.get_result())
+        return True
+
+    def __reload_changed_files(self, file_name: str) -> bool:
+        # The changed files are parsed in a child process like a compilation, errors keep the previously parsed files.
+        # A reload in the background is replaced, since the new process also parses its files.
+        self.__stop_reload()
+        try:
+            process = self.__asn1_handler.start_reload_process()
+            if process is not None and not self.__wait_for_process(process, f'Parsing {os.path.basename(file_name)}', 'Reloading specification'):
+                self._status_bar.SetStatusText(f'Reloading {file_name} cancelled')
+                return False
+            self.__asn1_handler.reload(process.get_result() if process is not None else None)
+        except Exception as e:
+            self.show_message(f'Error reloading {file_name}:\n\n{e}', 'Error', PluginInterface.MessageType.ERROR)
+            return False
+        return True
+
+    def __wait_for_process(self, process: CompileProcess, message: str, caption: str) -> bool:
+        if not process.poll():
+            self.show_progress(message, caption, process.max_progress)
+            try:
+                while not process.poll(0.05):
+                    if not self.update_progress(process.message, progress=process.progress):
+                        process.cancel()
+                        return False
+            finally:
+                self.update_progress(close=True)
+        return True
+
+    def __load_spec(self, file_name: str, process: typing.Optional[CompileProcess] = None) -> bool:
+        if not self.__compile_spec(file_name, process):
+            return False
+
         self._menu_handler.add_recent(os.path.abspath(file_name), self.__type_name)
 
         self._status_bar.SetStatusText(f'Loaded {file_name}')
@@ -140,35 +221,94 @@ class MainWindow(wx.Frame, PluginInterface):
         if self._type_augmenter:
             self._type_augmenter.set_spec_filename(file_name)
 
-        if self.__view is not None:
-            self.__view.realize().destroy()
-            self.__content_panel.Destroy()
-        if self.__tree_view is not None:
-            self.__tree_view.destroy()
+        with self.suspend_layout():
+            if self.__view is not None:
+                self.__view.realize().destroy()
+                self.__content_panel.Destroy()
+            if self.__tree_view is not None:
+                self.__tree_view.destroy()
 
-        WxPythonView.structure_changed = lambda x: None
+            self.__content_panel = wx.ScrolledWindow(self, style=wx.HSCROLL | wx.VSCROLL)
+            self.__content_panel.SetScrollbars(15, 15, 50, 50)
+            self.__content_panel.SetAutoLayout(True)
+            self.__content_panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            labels = Labels(self._menu_handler.view_select)
 
-        self.__content_panel = wx.ScrolledWindow(self, style=wx.HSCROLL | wx.VSCROLL)
-        self.__content_panel.SetScrollbars(15, 15, 50, 50)
-        self.__content_panel.SetAutoLayout(True)
-        self.__content_panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
-        labels = Labels(self._menu_handler.view_select)
+            # Only the selected node is shown in the tree view, so the other nodes are built when they are selected
+            view_factory = WxPythonViewFactory.WxPythonViewFactory(self.__content_panel, labels, self._menu_handler.view_select.view_type == ViewType.TREE,
+                                                                   self.suspend_layout)
 
-        view_factory = WxPythonViewFactory.WxPythonViewFactory(self.__content_panel, labels)
+            self.Freeze()
 
-        self.Freeze()
+            self.__view, self.__controller = self.__asn1_handler.create_view_controller_for_type(self.__type_name, view_factory, self._type_augmenter)
+            self.__tree_view = TreeView(self, self.__content_panel, self.__type_name, labels, self.suspend_layout)
 
-        self.__view, self.__controller = self.__asn1_handler.create_view_controller_for_type(self.__type_name, view_factory, self._type_augmenter)
-        self.__tree_view = TreeView(self, self.__content_panel, self.__type_name, labels)
+            self.Thaw()
 
-        self.Thaw()
+        # Warm up the codecs that were recently used with this spec
+        self.__asn1_handler.precompile(Environment.settings.get('recent_codecs', {}).get(self.__asn1_handler.get_filenames()[0], []))
 
-        WxPythonView.structure_changed = self._structure_changed
+        self.__show_all = True
         self._structure_changed()
 
         self._menu_handler.enable()
 
+        self.__reload_timer.Start(1000)
+        return True
+
+    # noinspection PyUnusedLocal
+    def __check_spec_files(self, e: wx.TimerEvent):
+        if self.__asn1_handler is None or self.__controller is None:
+            return
+        if self.__reload_process is not None and self.__reload_process[0] is not self.__asn1_handler:
+            # Another spec was loaded in the meantime
+            self.__stop_reload()
+        if self.__reload_process is not None:
+            # The spec is reloaded once the changed files were parsed in the background
+            if self.__reload_process[1].poll():
+                _, process = self.__reload_process
+                self.__reload_process = None
+                self.__reload_spec(process)
+        elif len(self.__asn1_handler.get_changed_files()):
+            try:
+                process = self.__asn1_handler.start_reload_process()
+            except Exception as e:
+                self._status_bar.SetStatusText(f'Error reloading {self.__file_name}: {e}')
+                return
+            if process is None:
+                self.__reload_spec(None)
+            else:
+                self.__reload_process = self.__asn1_handler, process
+
+    def __stop_reload(self):
+        if self.__reload_process is not None:
+            self.__reload_process[1].cancel()
+            self.__reload_process = None
+
+    def __reload_spec(self, process: typing.Optional[CompileProcess]):
+        model = self.__controller.view_to_model()
+        try:
+            modules = self.__asn1_handler.reload(process.get_result() if process is not None else None)
+        except Exception as e:
+            self._status_bar.SetStatusText(f'Error reloading {self.__file_name}: {e}')
+            return
+
+        if self.__type_name not in self.__asn1_handler.get_type_names():
+            self._status_bar.SetStatusText(f'Reloaded {", ".join(modules)}, but type {self.__type_name} no longer exists')
+            return
+
+        if not self.__load_spec(self.__file_name):
+            return
+        not_restored = self.__update_views(lambda: self.__controller.restore(model))
+
+        self._status_bar.SetStatusText(f'Reloaded {", ".join(modules)}')
+        if len(not_restored):
+            self.show_message('The following values do not fit the changed specification and were reset:\n\n' + '\n'.join(not_restored[:20]) +
+                              ('\n...' if len(not_restored) > 20 else ''), 'Specification reloaded', PluginInterface.MessageType.WARNING)
+
     def __close_spec(self):
+        self.__reload_timer.Stop()
+        self.__stop_reload()
         self.__asn1_handler = None
         self.__type_name = None
         self.__file_name = None
@@ -182,7 +322,30 @@ class MainWindow(wx.Frame, PluginInterface):
             self.__tree_view = None
         self.SetTitle(self.__title)
 
+    @contextlib.contextmanager
+    def suspend_layout(self):
+        """
+        Context in which changes of the structure of the views are ignored, because the caller updates the layout afterwards. May be nested.
+        """
+        self.__layout_suspended += 1
+        try:
+            yield
+        finally:
+            self.__layout_suspended -= 1
+
+    def __structure_changed_later(self):
+        # Several changes of the structure by one user action only rebuild the layout once
+        if not self.__layout_pending and not self.__layout_suspended:
+            self.__layout_pending = True
+            wx.CallAfter(self.update_layout)
+
+    def update_layout(self):
+        # The window may have been closed since the update was scheduled
+        if self and self.__layout_pending:
+            self._structure_changed()
+
     def _structure_changed(self, force_reload: bool = False):
+        self.__layout_pending = False
         if self.__type_name is None:
             return
 
@@ -190,14 +353,23 @@ class MainWindow(wx.Frame, PluginInterface):
             self.load_spec(self.__file_name, self.__type_name)
             return
 
+        with self.suspend_layout():
+            self.__update_layout()
+
+    def __update_layout(self):
         self.Freeze()
 
         sizer = self.GetSizer()
         sizer.Clear()
         content_panel_sizer: wx.Sizer = self.__content_panel.GetSizer()
-        content_panel_sizer.Clear()
+        root = self.__view.realize()
 
         if self._menu_handler.view_select.view_type == ViewType.TREE:
+            # The tree view only shows the sizers of the selected view, the kept sizers of the groups view are deleted
+            content_panel_sizer.Clear()
+            root._forget_layout()
+            self.__show_all = True
+
             sizer = wx.BoxSizer(wx.HORIZONTAL)
             tree_ctrl = self.__tree_view.get_ctrl(self.__view.realize())
 
@@ -206,35 +378,67 @@ class MainWindow(wx.Frame, PluginInterface):
         else:
             self.__tree_view.hide()
 
-            self.__view.realize().set_visible(True, recursive=True)
-            left_sizer, right_sizer = self.__view.realize().get_sizers(recursive=True)
+            if self.__show_all:
+                root.set_visible(True, recursive=True)
+                self.__show_all = False
+
+            # Only the sizers of changed views are created again, the sizers of unchanged views are kept in the content panel
+            if root.release_layout() is None:
+                content_panel_sizer.Clear()
+                left_sizer, right_sizer = root.get_layout()
+                content_panel_sizer.Add(left_sizer, flag=wx.ALL | wx.EXPAND, border=5)
+                if right_sizer is not None:
+                    content_panel_sizer.Add(right_sizer, flag=wx.ALL | wx.EXPAND, border=5)
+            right_sizer = root.get_layout()[1]
             sizer = wx.GridSizer(1 if right_sizer is None else 2)
-            content_panel_sizer.Add(left_sizer, flag=wx.ALL | wx.EXPAND, border=5)
-            if right_sizer is not None:
-                content_panel_sizer.Add(right_sizer, flag=wx.ALL | wx.EXPAND, border=5)
 
             self.__content_panel.SetSizer(content_panel_sizer)
 
             sizer.Add(self.__content_panel, flag=wx.ALL | wx.EXPAND)
 
         self.SetSizer(sizer, deleteOld=True)
+        self.__content_panel.Layout()
 
         self.Refresh()
         self.PostSizeEvent()
 
         self.Thaw()
 
+    def clear_spec_cache(self):
+        self.__spec_cache.invalidate()
+        self._status_bar.SetStatusText('Cleared cache of compiled specifications')
+
     def load_data_from_file(self, file_name: str):
-        self.__controller.model_to_view(self.__asn1_handler.load_data_file(file_name))
+        model = self.__asn1_handler.load_data_file(file_name)
+        self.__update_views(lambda: self.__controller.model_to_view(model))
+        self.__remember_used_codecs()
         self._status_bar.SetStatusText(f'Loaded {file_name} for {self.__type_name}')
 
     def save_data_to_file(self, file_name: str):
         self.__asn1_handler.save_data_file(file_name, self.__controller.view_to_model())
+        self.__remember_used_codecs()
 
     def show_data(self, data: bytes, codec: str):
-        self.__controller.model_to_view(self.__asn1_handler.get_model_from_data(data, codec))
+        model = self.__asn1_handler.get_model_from_data(data, codec)
+        self.__update_views(lambda: self.__controller.model_to_view(model))
+        self.__remember_used_codecs()
         self._status_bar.SetStatusText(f'Loaded data for {self.__type_name}')
 
+    def __update_views(self, update: typing.Callable[[], typing.Any]) -> typing.Any:
+        # The layout is updated once after all views were changed
+        try:
+            with self.suspend_layout():
+                return update()
+        finally:
+            self._structure_changed()
+
+    def __remember_used_codecs(self):
+        recent_codecs = Environment.settings.setdefault('recent_codecs', {})
+        file_name = self.__asn1_handler.get_filenames()[0]
+        used_codecs = self.__asn1_handler.get_used_codecs()
+        codecs = used_codecs + [codec for codec in recent_codecs.get(file_name, []) if codec not in used_codecs]
+        recent_codecs[file_name] = codecs[:3]
+
     def file_picker(self, message: str, wildcard: str, open_: bool) -> typing.Optional[str]:
         def dialog_constructor() -> wx.FileDialog:
             return wx.FileDialog(self, message, wildcard=wildcard,
@@ -254,7 +458,9 @@ class MainWindow(wx.Frame, PluginInterface):
         return picker.filename
 
     def encode_data(self, codec: str) -> bytes:
-        return self.__asn1_handler.get_data_from_model(self.__controller.view_to_model(), codec)
+        data = self.__asn1_handler.get_data_from_model(self.__controller.view_to_model(), codec)
+        self.__remember_used_codecs()
+        return data
 
     def get_spec_filename(self) -> str:
         return self.__file_name
@@ -265,6 +471,10 @@ class MainWindow(wx.Frame, PluginInterface):
     def get_spec(self, codec: str):
         return self.__asn1_handler.get_compiled(codec)
 
+    def warm_up_codec(self, codec: str):
+        if self.__asn1_handler is not None:
+            self.__asn1_handler.precompile([codec])
+
     def text_entry(self, message: str, default: typing.Optional[str] = None) -> typing.Optional[str]:
         with wx.TextEntryDialog(self, message) as text_dialog:
             if default is not None:
@@ -339,10 +549,15 @@ class MainWindow(wx.Frame, PluginInterface):
         Environment.settings['tag_info'] = self._menu_handler.view_select.tag_info.value
         Environment.settings['recent'] = self._menu_handler.recent[:10]
         Environment.settings['load_last'] = self._menu_handler.load_last
+        Environment.settings['compile_type_only'] = self._menu_handler.compile_type_only
         Environment.settings['last_loaded'] = [self.__file_name, self.__type_name]
 
         Environment.save()
 
+        self.__reload_timer.Stop()
+        self.__stop_reload()
+        self.__workspace.close()
+
         sys.excepthook = self.__default_excepthook
 
         self.Destroy()
@@ -19,13 +19,15 @@ class MenuHandler:
         self.__save_data_item = None
         self.__load_spec = None
         self.__load_last_spec = None
+        self.__compile_type_only = None
         self.__close_spec_item = None
         self.__recent: typing.Optional[typing.List[typing.List[str]]] = None
         self.__recent_menu: typing.Optional[wx.Menu] = None
         self.__about_box_content = about_box_content
         self.view_select: typing.Optional[ViewSelect] = None
 
-    def build(self, load_spec: typing.Callable, load_data_from_file: typing.Callable, save_data_to_file: typing.Callable, view_changed: typing.Callable):
+    def build(self, load_spec: typing.Callable, load_data_from_file: typing.Callable, save_data_to_file: typing.Callable, view_changed: typing.Callable,
+              clear_spec_cache: typing.Callable):
         self.__load_spec = load_spec
         self.view_select = ViewSelect(self.__frame, view_changed)
 
@@ -41,6 +43,8 @@ class MenuHandler:
         recent_submenu: wx.MenuItem = file_menu.AppendSubMenu(self.__recent_menu, 'Open recent')
         recent_submenu.SetBitmap(Resources.get_bitmap_from_svg('recent'))
         self.__load_last_spec: wx.MenuItem = file_menu.Append(wx.ID_ANY, 'Open last specification on startup', kind=wx.ITEM_CHECK)
+        self.__compile_type_only: wx.MenuItem = file_menu.Append(wx.ID_ANY, 'Compile only the selected type', kind=wx.ITEM_CHECK)
+        clear_cache_item: wx.MenuItem = file_menu.Append(wx.ID_ANY, 'Clear compiled specification cache')
         file_menu.AppendSeparator()
         self.__load_data_item: wx.MenuItem = file_menu.Append(wx.ID_OPEN, 'Load encoded data')
         self.__load_data_item.SetBitmap(Resources.get_bitmap_from_svg('load_encoded'))
@@ -88,6 +92,8 @@ class MenuHandler:
 
         self.__frame.Bind(wx.EVT_MENU, self.__close_spec, self.__close_spec_item)
 
+        self.__frame.Bind(wx.EVT_MENU, lambda _: clear_spec_cache(), clear_cache_item)
+
         picker = FilePickerHandler(schema_dialog_constructor, load_spec)
         self.__frame.Bind(wx.EVT_MENU, picker.on_menu_click, load_spec_item)
 
@@ -200,6 +206,14 @@ class MenuHandler:
     def load_last(self, load_last: bool):
         self.__load_last_spec.Check(load_last)
 
+    @property
+    def compile_type_only(self) -> bool:
+        return self.__compile_type_only.IsChecked()
+
+    @compile_type_only.setter
+    def compile_type_only(self, compile_type_only: bool):
+        self.__compile_type_only.Check(compile_type_only)
+
     # noinspection PyUnusedLocal
     def __about_item_event(self, e: wx.Event):
         del e
@@ -6,17 +6,21 @@ from asn1editor.wxPython import Resources
 from asn1editor.wxPython.Labels import Labels
 from asn1editor.wxPython.views.WxPythonChoiceView import WxPythonChoiceView
 from asn1editor.wxPython.views.WxPythonContainerView import WxPythonContainerView
+from asn1editor.wxPython.views.WxPythonLazyView import WxPythonLazyView
+from asn1editor.wxPython.views.WxPythonOptionalView import WxPythonOptionalView
 from asn1editor.wxPython.views.WxPythonView import WxPythonView
 
 
 class TreeView:
 
-    def __init__(self, window: wx.Window, content_window: wx.ScrolledWindow, root_name: str, labels: Labels):
+    def __init__(self, window: wx.Window, content_window: wx.ScrolledWindow, root_name: str, labels: Labels,
+                 suspend_layout: typing.Callable[[], typing.ContextManager]):
         self.__tree_ctrl = wx.TreeCtrl(window)
         Resources.get_bitmap_from_svg('root')
         root_item = self.__tree_ctrl.AddRoot(root_name, Resources.image_list.get_index('root'))
         self.__tree_ctrl.SetItemBold(root_item, True)
         self.__tree_ctrl.Bind(wx.EVT_TREE_SEL_CHANGED, self.item_selected)
+        self.__tree_ctrl.Bind(wx.EVT_TREE_ITEM_EXPANDING, self.item_expanding)
         self.__tree_ctrl.Bind(wx.EVT_TREE_ITEM_RIGHT_CLICK, self.item_right_clicked)
         self.__tree_ctrl.Bind(wx.EVT_TREE_ITEM_GETTOOLTIP, self.item_tooltip)
         self.__tree_ctrl.SetImageList(Resources.image_list.get_image_list())
@@ -25,13 +29,47 @@ class TreeView:
         self.__tooltip_timer: typing.Optional[wx.CallLater] = None
         self.__tooltip_event_and_tooltip: typing.Tuple[typing.Optional[wx.TreeEvent], typing.Optional[str]] = (None, None)
         self.__labels = labels
+        self.__suspend_layout = suspend_layout
+        # Tree items of the views in the tree, so the tree is synced without searching the items
+        self.__items: typing.Dict[WxPythonView, wx.TreeItemId] = {}
 
     def __sync(self, tree_item: wx.TreeItemId, view: WxPythonView):
-        if isinstance(view, WxPythonContainerView):
-            # First, check if the view is not in the tree yet
-            container_item_for_view = self.__add_if_not_in_tree(tree_item, view)
+        # Only views whose structure changed since the last sync and views that are not in the tree yet are synced again
+        if not self.__has_item(view):
+            return
+        added = view not in self.__items
+        container_item_for_view = self.__add_if_not_in_tree(tree_item, view)
+        if not added and view.is_synced():
+            return
+        view.set_synced()
+
+        self.__tree_ctrl.SetItemBold(container_item_for_view, view.get_has_value())
 
-            # Now check if it was removed from the tree
+        if isinstance(view, WxPythonLazyView):
+            if view.is_built():
+                self.__sync_children(container_item_for_view, view.realize())
+            else:
+                # The children are added when the item is expanded or selected
+                self.__tree_ctrl.SetItemHasChildren(container_item_for_view, True)
+
+        if isinstance(view, WxPythonOptionalView):
+            # The children of the element are shown as children of the optional element
+            if view.get_view() is not None:
+                self.__sync_children(container_item_for_view, view.get_view())
+            else:
+                self.__delete_if_removed(container_item_for_view, [])
+                self.__tree_ctrl.SetItemHasChildren(container_item_for_view, False)
+
+        if isinstance(view, (WxPythonContainerView, WxPythonChoiceView)):
+            self.__sync_children(container_item_for_view, view)
+
+    @staticmethod
+    def __has_item(view: WxPythonView) -> bool:
+        return isinstance(view, (WxPythonLazyView, WxPythonContainerView, WxPythonChoiceView)) or (isinstance(view, WxPythonOptionalView) and view.container)
+
+    def __sync_children(self, container_item_for_view: wx.TreeItemId, view: WxPythonView):
+        if isinstance(view, WxPythonContainerView):
+            # Check if children were removed from the tree
             self.__delete_if_removed(container_item_for_view, view.get_children())
 
             # Finally handle children
@@ -40,45 +78,51 @@ class TreeView:
                     self.__sync(container_item_for_view, child)
 
         if isinstance(view, WxPythonChoiceView):
-            container_item_for_view = self.__add_if_not_in_tree(tree_item, view)
             self.__delete_if_removed(container_item_for_view, [view.get_view()])
 
             if view.get_has_value():
                 self.__sync(container_item_for_view, view.get_view())
 
-    def __add_if_not_in_tree(self, tree_item: wx.TreeItemId, view: typing.Union[WxPythonContainerView, WxPythonChoiceView]) -> typing.Optional[wx.TreeItemId]:
-        # First, check if the view is not in the tree yet
-        found = False
-        container_item_for_view = None
-        tree_child, cookie = self.__tree_ctrl.GetFirstChild(tree_item)
-        while tree_child.IsOk():
-            child_view = self.__tree_ctrl.GetItemData(tree_child)
+        self.__tree_ctrl.SetItemHasChildren(container_item_for_view, self.__tree_ctrl.GetChildrenCount(container_item_for_view, False) > 0)
 
-            if child_view == view:
-                container_item_for_view = tree_child
-                found = True
-            tree_child, cookie = self.__tree_ctrl.GetNextChild(tree_item, cookie)
+    def __build(self, tree_item: wx.TreeItemId, view: typing.Optional[WxPythonView]):
+        if isinstance(view, WxPythonLazyView) and not view.is_built():
+            # The tree item and the shown view are updated by the caller, so building the view does not update the whole layout
+            with self.__suspend_layout():
+                built_view = view.realize()
+            self.__sync_children(tree_item, built_view)
 
-        if not found:
+    def __add_if_not_in_tree(self, tree_item: wx.TreeItemId, view: WxPythonView) -> wx.TreeItemId:
+        container_item_for_view = self.__items.get(view)
+        if container_item_for_view is None:
             image = Resources.image_list.get_index(view.icon)
             container_item_for_view = self.__tree_ctrl.AppendItem(tree_item, self.__labels.get_label(view.get_type_info()), image=image)
             self.__tree_ctrl.SetItemData(container_item_for_view, view)
-
-        self.__tree_ctrl.SetItemBold(container_item_for_view, view.get_has_value())
+            self.__items[view] = container_item_for_view
 
         return container_item_for_view
 
     def __delete_if_removed(self, container_item_for_view: wx.TreeItemId, views: typing.List[WxPythonView]):
-        current_child_views_in_tree = []
+        views = set(views)
+        removed_tree_items = []
         tree_child, cookie = self.__tree_ctrl.GetFirstChild(container_item_for_view)
 
         while tree_child.IsOk():
-            current_child_views_in_tree.append((self.__tree_ctrl.GetItemData(tree_child), tree_child))
+            if self.__tree_ctrl.GetItemData(tree_child) not in views:
+                removed_tree_items.append(tree_child)
             tree_child, cookie = self.__tree_ctrl.GetNextChild(container_item_for_view, cookie)
 
-        for current_child, current_treeitem in current_child_views_in_tree:
-            if current_child not in views:
-                self.__tree_ctrl.Delete(current_treeitem)
+        for tree_item in removed_tree_items:
+            self.__remove_from_index(tree_item)
+            self.__tree_ctrl.Delete(tree_item)
+
+    def __remove_from_index(self, tree_item: wx.TreeItemId):
+        # Deleting an item also deletes its children
+        self.__items.pop(self.__tree_ctrl.GetItemData(tree_item), None)
+        tree_child, cookie = self.__tree_ctrl.GetFirstChild(tree_item)
+        while tree_child.IsOk():
+            self.__remove_from_index(tree_child)
+            tree_child, cookie = self.__tree_ctrl.GetNextChild(tree_item, cookie)
 
     def get_ctrl(self, root_view: WxPythonView) -> wx.TreeCtrl:
         self.__sync(self.__tree_ctrl.GetRootItem(), root_view)
@@ -100,8 +144,12 @@ class TreeView:
 
     def item_selected(self, e: wx.TreeEvent):
         view = self.__tree_ctrl.GetItemData(e.GetItem())
+        self.__build(e.GetItem(), view)
         self.__show_view(view)
 
+    def item_expanding(self, e: wx.TreeEvent):
+        self.__build(e.GetItem(), self.__tree_ctrl.GetItemData(e.GetItem()))
+
     def item_tooltip(self, e: wx.TreeEvent):
         view: WxPythonView = self.__tree_ctrl.GetItemData(e.GetItem())
         if view is not None:
@@ -1,4 +1,5 @@
-from typing import List, Tuple, Optional, Union
+import contextlib
+from typing import Callable, ContextManager, List, Tuple, Optional, Union
 
 import wx
 import wx.adv
@@ -8,9 +9,10 @@ import wx.svg
 from asn1editor.interfaces.BitstringInterface import BitstringInterface
 from asn1editor.interfaces.OptionalInterface import OptionalInterface
 from asn1editor.interfaces.ValueInterface import ValueInterface
-from asn1editor.view.AbstractView import AbstractView, ContainerView, ListView, ChoiceView
+from asn1editor.view.AbstractView import AbstractView, ContainerView, ListView, ChoiceView, OptionalView
 from asn1editor.view.AbstractViewFactory import AbstractViewFactory, TypeInfo, Styles
 from asn1editor.wxPython import Resources
+from asn1editor.wxPython.ControlPool import ControlPool
 from asn1editor.wxPython.Labels import Labels
 from asn1editor.wxPython.views.WxPythonBitstringView import WxPythonBitstringView
 from asn1editor.wxPython.views.WxPythonBooleanView import WxPythonBooleanView
@@ -18,20 +20,38 @@ from asn1editor.wxPython.views.WxPythonChoiceView import WxPythonChoiceView
 from asn1editor.wxPython.views.WxPythonContainerView import WxPythonContainerView
 from asn1editor.wxPython.views.WxPythonDateTimeViews import WxPythonDateView, WxPythonTimeView, WxPythonDateTimeView
 from asn1editor.wxPython.views.WxPythonHexStringView import WxPythonHexStringView
+from asn1editor.wxPython.views.WxPythonLazyView import WxPythonLazyView
 from asn1editor.wxPython.views.WxPythonListView import WxPythonListView
+from asn1editor.wxPython.views.WxPythonOptionalView import WxPythonOptionalView
+from asn1editor.wxPython.views.WxPythonPagedListView import WxPythonPagedListView
 from asn1editor.wxPython.views.WxPythonValueView import WxPythonValueView, WxPythonValueSelectionView
 from asn1editor.wxPython.views.WxPythonView import ControlList
 
 
 class WxPythonViewFactory(AbstractViewFactory):
-    def __init__(self, window: wx.ScrolledWindow, labels: Labels):
+    CONTAINER_ICONS = {'SEQUENCE OF': WxPythonListView.icon, 'SET OF': WxPythonListView.icon, 'CHOICE': WxPythonChoiceView.icon}
+    # Number of list elements shown on one page of lists that may contain more elements
+    LIST_PAGE_SIZE = 100
+
+    def __init__(self, window: wx.ScrolledWindow, labels: Labels, lazy: bool = False, suspend_layout: Optional[Callable[[], ContextManager]] = None):
+        """
+        @param window: Parent window of all controls
+        @param labels: Creates the labels of the controls
+        @param lazy: If set, containers, lists and choices are built when they are shown for the first time, e.g. in the tree view.
+                     References to recursive types are always built on demand.
+        @param suspend_layout: Returns a context in which structure changes do not update the layout, used while the elements of a list are changed
+        """
         self._window = window
         self._labels = labels
+        self._lazy = lazy
+        self._suspend_layout = suspend_layout or contextlib.nullcontext
+        # The controls of destroyed views are reused, because all controls of the views created by this factory have the same parent
+        self._pool = ControlPool()
 
     def get_enumerated_view(self, type_info: TypeInfo, choices: List[str]) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
         controls = self._get_controls(type_info, ':', 'enumerated')
 
-        controls['value'] = wx.ComboBox(self._window, choices=choices, style=wx.CB_READONLY)
+        controls['value'] = self._get_combo_box(choices)
         self._apply_style(controls)
 
         view = WxPythonValueSelectionView(type_info, controls)
@@ -40,7 +60,7 @@ class WxPythonViewFactory(AbstractViewFactory):
     def get_text_view(self, type_info: TypeInfo, text: str) -> AbstractView:
         controls = self._get_controls(type_info)
 
-        controls['value'] = wx.StaticText(self._window, wx.ID_ANY, text)
+        controls['value'] = self._get_static_text(text)
         self._apply_style(controls)
 
         view = WxPythonValueView(type_info, controls)
@@ -54,10 +74,29 @@ class WxPythonViewFactory(AbstractViewFactory):
 
         return view, view if type_info.optional or type_info.additional else None
 
+    def get_lazy_view(self, type_info: TypeInfo, build: Callable[[], AbstractView]) -> AbstractView:
+        if not self._lazy and not type_info.recursive:
+            return build()
+
+        icon = self.CONTAINER_ICONS.get(type_info.typename, WxPythonContainerView.icon)
+        controls = {}
+        if type_info.recursive:
+            # Recursive elements are also built on demand in the groups view, where they are shown with a button to build them
+            controls = self._get_controls(type_info, icon=icon)
+            controls['build'] = wx.Button(self._window, label='Show')
+        return WxPythonLazyView(type_info, icon, build, controls)
+
+    def get_optional_view(self, type_info: TypeInfo, container: bool) -> Tuple[OptionalView, OptionalInterface]:
+        icon = self.CONTAINER_ICONS.get(type_info.typename, WxPythonContainerView.icon) if container else None
+        controls = self._get_controls(type_info, icon=icon)
+
+        view = WxPythonOptionalView(type_info, controls, container, icon)
+        return view, view
+
     def get_list_view(self, type_info: TypeInfo, minimum: int, maximum: int) -> Tuple[ListView, ValueInterface, OptionalInterface]:
         controls = self._get_controls(type_info, icon=WxPythonListView.icon)
 
-        num_elements = wx.SpinCtrl(self._window)
+        num_elements = self._get_spin_ctrl()
         if minimum is not None:
             num_elements.SetMin(minimum)
         else:
@@ -68,10 +107,17 @@ class WxPythonViewFactory(AbstractViewFactory):
             maximum = 'infinite'
         num_elements.SetToolTip(f"Minimum elements: {minimum}, maximum elements: {maximum}")
         controls['value'] = num_elements
-        controls['num_elements'] = wx.StaticText(self._window, wx.ID_ANY, "Elements:")
+        controls['num_elements'] = self._get_static_text("Elements:")
         self._apply_style(controls)
 
-        view = WxPythonListView(type_info, controls, self._window)
+        # Lists that may exceed one page keep the models of their elements, but only show the page controls while they have more than one page
+        if maximum == 'infinite' or maximum > self.LIST_PAGE_SIZE:
+            controls['page_label'] = self._get_static_text("Page:")
+            controls['page'] = self._get_spin_ctrl(1, 1)
+            controls['pages'] = self._get_static_text("of 1")
+            view = WxPythonPagedListView(type_info, controls, self._window, self._suspend_layout, self.LIST_PAGE_SIZE)
+        else:
+            view = WxPythonListView(type_info, controls, self._window, self._suspend_layout)
 
         return view, view, view if type_info.optional or type_info.additional else None
 
@@ -79,7 +125,7 @@ class WxPythonViewFactory(AbstractViewFactory):
                         maximum: Optional[Union[int, float]], float_: bool) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
         controls = self._get_controls(type_info, ':', 'float' if float_ else 'integer')
 
-        edit = wx.lib.masked.numctrl.NumCtrl(self._window)
+        edit = self._get_num_ctrl()
         tool_tip = []
         if isinstance(minimum, int) or isinstance(minimum, float):
             edit.SetAllowNegative(minimum < 0)
@@ -102,7 +148,7 @@ class WxPythonViewFactory(AbstractViewFactory):
     def get_boolean_view(self, type_info: TypeInfo) -> Tuple[AbstractView, ValueInterface, OptionalInterface]:
         controls = self._get_controls(type_info, ':', 'bool')
 
-        controls['value'] = wx.CheckBox(self._window)
+        controls['value'] = self._get_check_box()
         self._apply_style(controls)
 
         view = WxPythonBooleanView(type_info, controls)
@@ -111,7 +157,7 @@ class WxPythonViewFactory(AbstractViewFactory):
     def get_string_view(self, type_info: TypeInfo, minimum: Optional[int], maximum: Optional[int]):
         controls = self._get_controls(type_info, ':', 'string')
 
-        edit = wx.TextCtrl(self._window)
+        edit = self._get_text_ctrl()
         if maximum:
             edit.SetMaxLength(maximum)
         else:
@@ -129,9 +175,9 @@ class WxPythonViewFactory(AbstractViewFactory):
     def get_hex_string_view(self, type_info: TypeInfo, minimum: Optional[int], maximum: Optional[int]):
         controls = self._get_controls(type_info, ':', 'string')
 
-        controls['selector'] = wx.CheckBox(self._window, label='Hex')
+        controls['selector'] = self._get_check_box('Hex')
         controls['selector'].SetValue(True)
-        controls['value'] = wx.TextCtrl(self._window)
+        controls['value'] = self._get_text_ctrl()
         self._apply_style(controls)
 
         view = WxPythonHexStringView(type_info, controls, minimum, maximum)
@@ -140,7 +186,7 @@ class WxPythonViewFactory(AbstractViewFactory):
     def get_choice_view(self, type_info: TypeInfo, choices: List[str]) -> Tuple[ChoiceView, ValueInterface, OptionalInterface]:
         controls = self._get_controls(type_info, icon=WxPythonChoiceView.icon)
 
-        controls['value'] = wx.ComboBox(self._window, choices=choices, style=wx.CB_READONLY)
+        controls['value'] = self._get_combo_box(choices)
         self._apply_style(controls)
 
         view = WxPythonChoiceView(type_info, controls)
@@ -157,13 +203,13 @@ class WxPythonViewFactory(AbstractViewFactory):
 
         if named_bits:
             for name, bit in named_bits:
-                bit_checkbox = wx.CheckBox(self._window, label=f"{bit}: {name}")
+                bit_checkbox = self._get_check_box(f"{bit}: {name}")
                 if style & Styles.READ_ONLY:
                     bit_checkbox.Enable(False)
                 checkboxes.append((bit, bit_checkbox))
         else:
             for bit in range(number_of_bits):
-                bit_checkbox = wx.CheckBox(self._window, label=str(bit))
+                bit_checkbox = self._get_check_box(str(bit))
                 if style & Styles.READ_ONLY:
                     bit_checkbox.Enable(False)
                 checkboxes.append((bit, bit_checkbox))
@@ -209,12 +255,12 @@ class WxPythonViewFactory(AbstractViewFactory):
         tooltip = self._labels.get_tooltip(type_info)
 
         if type_info.optional or type_info.additional:
-            control = wx.CheckBox(self._window, wx.ID_ANY, label)
+            control = self._get_check_box(label)
             if type_info.additional and not type_info.optional:
                 control.Enable(False)
             controls['optional'] = control
         else:
-            control = wx.StaticText(self._window, wx.ID_ANY, label)
+            control = self._get_static_text(label)
 
         controls['name'] = control
         control.SetToolTip(tooltip)
@@ -225,6 +271,7 @@ class WxPythonViewFactory(AbstractViewFactory):
             controls['style'] = type_info.style
         else:
             controls['style'] = 0
+        controls['pool'] = self._pool
 
         return controls
 
@@ -233,11 +280,62 @@ class WxPythonViewFactory(AbstractViewFactory):
         if bitmap is None:
             bitmap = Resources.get_bitmap_from_svg(bitmap_name)
 
-        static_bitmap = wx.StaticBitmap(self._window, bitmap=bitmap)
+        static_bitmap = self._pool.get(wx.StaticBitmap)
+        if static_bitmap is None:
+            static_bitmap = wx.StaticBitmap(self._window, bitmap=bitmap)
+        else:
+            static_bitmap.SetBitmap(bitmap)
 
         static_bitmap.SetToolTip(icon_tooltip)
         return static_bitmap
 
+    def _get_static_text(self, label: str) -> wx.StaticText:
+        control = self._pool.get(wx.StaticText)
+        if control is None:
+            return wx.StaticText(self._window, wx.ID_ANY, label)
+        control.SetLabel(label)
+        return control
+
+    def _get_check_box(self, label: str = '') -> wx.CheckBox:
+        control = self._pool.get(wx.CheckBox)
+        if control is None:
+            return wx.CheckBox(self._window, wx.ID_ANY, label)
+        control.SetLabel(label)
+        control.SetValue(False)
+        return control
+
+    def _get_combo_box(self, choices: List[str]) -> wx.ComboBox:
+        control = self._pool.get(wx.ComboBox)
+        if control is None:
+            return wx.ComboBox(self._window, choices=choices, style=wx.CB_READONLY)
+        control.Set(choices)
+        return control
+
+    def _get_spin_ctrl(self, minimum: int = 0, maximum: int = 100) -> wx.SpinCtrl:
+        control = self._pool.get(wx.SpinCtrl)
+        if control is None:
+            return wx.SpinCtrl(self._window, min=minimum, max=maximum)
+        control.SetRange(minimum, maximum)
+        control.SetValue(minimum)
+        return control
+
+    def _get_text_ctrl(self) -> wx.TextCtrl:
+        control = self._pool.get(wx.TextCtrl)
+        if control is None:
+            return wx.TextCtrl(self._window)
+        control.SetMaxLength(0)
+        control.ChangeValue('')
+        return control
+
+    def _get_num_ctrl(self) -> wx.lib.masked.numctrl.NumCtrl:
+        control = self._pool.get(wx.lib.masked.numctrl.NumCtrl)
+        if control is None:
+            return wx.lib.masked.numctrl.NumCtrl(self._window)
+        # Restore the defaults of a new control before the constraints of the type are applied
+        control.SetValue(0)
+        control.SetParameters(min=None, max=None, allowNegative=True, fractionWidth=0)
+        return control
+
     @staticmethod
     def _apply_style(controls: ControlList):
         if controls.get('style') & Styles.READ_ONLY and 'value' in controls:
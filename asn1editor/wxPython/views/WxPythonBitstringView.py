@@ -42,7 +42,7 @@ class WxPythonBitstringView(WxPythonView, BitstringInterface):
     def destroy(self):
         super(WxPythonBitstringView, self).destroy()
         for _, checkbox in self._controls['checkboxes']:
-            checkbox.Destroy()
+            self._release(checkbox)
 
     def set_visible(self, visible, recursive=True):
         super(WxPythonBitstringView, self).set_visible(visible, recursive)
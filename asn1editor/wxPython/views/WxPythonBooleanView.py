@@ -17,7 +17,7 @@ class WxPythonBooleanView(WxPythonView, ValueInterface):
             del e
             callback()
 
-        self._controls['value'].Bind(wx.EVT_CHECKBOX, event_closure)
+        self._bind(self._controls['value'], wx.EVT_CHECKBOX, event_closure)
 
     def get_value(self) -> bool:
         return self._controls['value'].GetValue()
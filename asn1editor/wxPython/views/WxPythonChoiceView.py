@@ -15,6 +15,8 @@ class WxPythonChoiceView(WxPythonView, ChoiceView, ValueInterface):
     def __init__(self, type_info: TypeInfo, controls: ControlList):
         super(WxPythonChoiceView, self).__init__(type_info, controls, True)
         self._view: Optional[WxPythonView] = None
+        # Hidden views of deselected elements, which are destroyed with the choice unless they are discarded before
+        self._kept_views: typing.List[WxPythonView] = []
 
     def register_change_event(self, callback: Callable):
         # noinspection PyUnusedLocal
@@ -24,7 +26,7 @@ class WxPythonChoiceView(WxPythonView, ChoiceView, ValueInterface):
             callback()
             self._controls['value'].GetTopLevelParent().Thaw()
 
-        self._controls['value'].Bind(wx.EVT_COMBOBOX, event_closure)
+        self._bind(self._controls['value'], wx.EVT_COMBOBOX, event_closure)
 
     def get_value(self) -> str:
         return self._controls['value'].GetStringSelection()
@@ -36,17 +38,32 @@ class WxPythonChoiceView(WxPythonView, ChoiceView, ValueInterface):
         self._controls['value'].Enable(enabled)
         if self._view is not None:
             self._view.set_visible(enabled)
-            self.structure_changed()
+            self._layout_changed()
 
-    def set_view(self, view: WxPythonView):
+    def set_view(self, view: WxPythonView, keep: bool = False):
         if self._view is not None:
-            self._view.destroy()
-
+            if keep:
+                self._view.set_visible(False)
+                self._kept_views.append(self._view)
+            else:
+                self._view.destroy()
+            self._view._forget_layout()
+
+        if view in self._kept_views:
+            self._kept_views.remove(view)
         self._view = view
+        self._set_layout_parent(view)
 
         self._view.set_visible(self.get_has_value())
 
-        self.structure_changed()
+        self._layout_changed()
+
+    def discard_view(self, view: WxPythonView):
+        self._kept_views.remove(view)
+        view.destroy()
+
+    def _get_layout_children(self) -> typing.List[WxPythonView]:
+        return [self._view] if self._view is not None else []
 
     def get_view(self) -> WxPythonView:
         return self._view
@@ -57,7 +74,7 @@ class WxPythonChoiceView(WxPythonView, ChoiceView, ValueInterface):
 
         if recursive or not self._view.container:
             content_sizer = wx.BoxSizer(wx.VERTICAL)
-            left_sizer, right_sizer = self._view.get_sizers(recursive)
+            left_sizer, right_sizer = self._get_child_sizers(self._view, recursive)
             content_sizer.Add(left_sizer, border=5, flag=wx.EXPAND)
             if right_sizer is not None:
                 content_sizer.Add(right_sizer, border=5, flag=wx.EXPAND)
@@ -75,6 +92,9 @@ class WxPythonChoiceView(WxPythonView, ChoiceView, ValueInterface):
         super(WxPythonChoiceView, self).destroy()
         if self._view is not None:
             self._view.destroy()
+        for view in self._kept_views:
+            view.destroy()
+        self._kept_views.clear()
 
     def set_visible(self, visible, recursive=True):
         super(WxPythonChoiceView, self).set_visible(visible, recursive)
@@ -37,6 +37,7 @@ class WxPythonContainerView(WxPythonView, ContainerView):
 
     def add_child(self, view: WxPythonView):
         self._children.append(view)
+        self._set_layout_parent(view)
         view.set_visible(self.get_has_value(), recursive=True)
 
     def enable(self, enabled: bool):
@@ -44,11 +45,14 @@ class WxPythonContainerView(WxPythonView, ContainerView):
             if child.get_has_value():
                 child.enable(enabled)
             child.set_visible(enabled, recursive=True)
-        self.structure_changed()
+        self._layout_changed()
 
     def get_children(self) -> List[WxPythonView]:
         return self._children
 
+    def _get_layout_children(self) -> List[WxPythonView]:
+        return self._children
+
     def destroy(self):
         super(WxPythonContainerView, self).destroy()
         for child in self._children:
@@ -56,8 +56,8 @@ class WxPythonDateTimeView(WxPythonView, ValueInterface):
             del e
             callback()
 
-        self._controls['value'].Bind(wx.EVT_TEXT, event_closure)
-        self._controls['time'].Bind(wx.EVT_TEXT, event_closure)
+        self._bind(self._controls['value'], wx.EVT_TEXT, event_closure)
+        self._bind(self._controls['time'], wx.EVT_TEXT, event_closure)
 
     def get_value(self) -> datetime.datetime:
         dt: wx.DateTime = self._controls['value'].GetValue()
@@ -14,7 +14,7 @@ class WxPythonHexStringView(WxPythonView, ValueInterface):
         super(WxPythonHexStringView, self).__init__(type_info, controls)
 
         self._real_value = b''
-        self._controls['selector'].Bind(wx.EVT_CHECKBOX, self.hex_selector_changed)
+        self._bind(self._controls['selector'], wx.EVT_CHECKBOX, self.hex_selector_changed)
         self._hex = self._is_hex()
         self._minimum = minimum if not self._hex or minimum is None else minimum * self.CHARS_PER_HEX_DIGIT
         if self._minimum is None:
@@ -36,7 +36,7 @@ class WxPythonHexStringView(WxPythonView, ValueInterface):
             self.text_changed()
             callback()
 
-        self._controls['value'].Bind(wx.EVT_TEXT, event_closure)
+        self._bind(self._controls['value'], wx.EVT_TEXT, event_closure)
 
     # noinspection PyUnusedLocal
     def hex_selector_changed(self, e: wx.CommandEvent):
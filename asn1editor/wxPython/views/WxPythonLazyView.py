@@ -0,0 +1,100 @@
+import typing
+from typing import Callable, Optional
+
+import wx
+
+from asn1editor.view.AbstractViewFactory import TypeInfo
+from asn1editor.wxPython.views.WxPythonView import WxPythonView, ControlList
+
+
+class WxPythonLazyView(WxPythonView):
+    """
+    Placeholder for a container, list or choice view, which builds the view and its controller when it is realized for the first time.
+
+    Until then, only the optional controls of the placeholder exist, e.g. a button to build a recursive element in the groups view.
+    Visibility and enabling are remembered and applied to the built view.
+    """
+
+    def __init__(self, type_info: TypeInfo, icon: str, build: Callable[[], WxPythonView], controls: Optional[ControlList] = None):
+        super(WxPythonLazyView, self).__init__(type_info, controls or {}, container=True)
+        self.icon = icon
+        self._build = build
+        self._view: Optional[WxPythonView] = None
+        self._visible = (False, True)
+        self._enabled: Optional[bool] = None
+        if 'build' in self._controls:
+            self._bind(self._controls['build'], wx.EVT_BUTTON, self.__build_clicked)
+
+    def is_built(self) -> bool:
+        return self._view is not None
+
+    def realize(self) -> WxPythonView:
+        if self._view is None:
+            self._view = self._build()
+            # The controls of the placeholder are replaced by the built view
+            super(WxPythonLazyView, self).set_visible(False)
+            # Changes of the built view are passed on to the parents of the placeholder
+            self._set_layout_parent(self._view)
+            self._view._invalidate_layout(structure=True)
+            self._view.set_visible(False, recursive=True)
+            if self._visible[0]:
+                self._view.set_visible(*self._visible)
+            if self._enabled is not None:
+                self._view.enable(self._enabled)
+        return self._view.realize()
+
+    def get_has_value(self) -> bool:
+        if self._view is None:
+            return self.get_default_has_value()
+        return self._view.get_has_value()
+
+    def get_sizers(self, recursive: bool) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
+        if self.__shows_placeholder(recursive):
+            sizer = self._create_sizer()
+            sizer.Add(self._controls['build'], flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+            return sizer, None
+        return self.realize().get_sizers(recursive)
+
+    def get_layout(self) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
+        if self.__shows_placeholder(True):
+            return super(WxPythonLazyView, self).get_layout()
+        return self.realize().get_layout()
+
+    def release_layout(self) -> typing.Optional[typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]]:
+        if self._view is None:
+            return super(WxPythonLazyView, self).release_layout()
+        return self._view.release_layout()
+
+    def _forget_layout(self):
+        super(WxPythonLazyView, self)._forget_layout()
+        if self._view is not None:
+            self._view._forget_layout()
+
+    def enable(self, enabled: bool):
+        self._enabled = enabled
+        if self._view is not None:
+            self._view.enable(enabled)
+        elif 'build' in self._controls:
+            self._controls['build'].Enable(enabled)
+
+    def destroy(self):
+        super(WxPythonLazyView, self).destroy()
+        if self._view is not None:
+            self._view.destroy()
+
+    def set_visible(self, visible, recursive=True):
+        self._visible = (visible, recursive)
+        if self._view is not None:
+            self._view.set_visible(visible, recursive)
+        else:
+            super(WxPythonLazyView, self).set_visible(visible, recursive)
+
+    def __shows_placeholder(self, recursive: bool) -> bool:
+        # Only the tree view builds a recursive element when it is selected, the groups view shows a button instead
+        return self._view is None and recursive and 'build' in self._controls
+
+    # noinspection PyUnusedLocal
+    def __build_clicked(self, e: wx.CommandEvent):
+        del e
+        self.realize()
+        self._layout_changed()
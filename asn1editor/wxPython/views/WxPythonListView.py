@@ -1,5 +1,6 @@
+import contextlib
 import typing
-from typing import Callable
+from typing import Callable, ContextManager
 
 import wx
 
@@ -13,8 +14,13 @@ from asn1editor.wxPython.views.WxPythonView import WxPythonView, ControlList
 class WxPythonListView(WxPythonContainerView, ListView, ValueInterface):
     icon = 'sequence_of'
 
-    def __init__(self, type_info: TypeInfo, controls: ControlList, parent: wx.Window):
+    def __init__(self, type_info: TypeInfo, controls: ControlList, parent: wx.Window, suspend_layout: Callable[[], ContextManager]):
         super(WxPythonListView, self).__init__(type_info, controls, parent)
+        # While the elements are updated, the layout is suspended and only updated once at the end if elements were added or removed
+        self._suspend_layout = suspend_layout
+        self._suspended = contextlib.ExitStack()
+        self._updates = 0
+        self._changed = False
 
     def register_change_event(self, callback: Callable):
         # noinspection PyUnusedLocal
@@ -24,7 +30,7 @@ class WxPythonListView(WxPythonContainerView, ListView, ValueInterface):
             callback()
             self._controls['value'].GetTopLevelParent().Thaw()
 
-        self._controls['value'].Bind(wx.EVT_SPINCTRL, event_closure)
+        self._bind(self._controls['value'], wx.EVT_SPINCTRL, event_closure)
 
     def get_value(self) -> str:
         return self._controls['value'].GetValue()
@@ -38,13 +44,30 @@ class WxPythonListView(WxPythonContainerView, ListView, ValueInterface):
 
     def add(self, view: WxPythonView):
         self._children.append(view)
+        self._set_layout_parent(view)
         view.set_visible(self.get_has_value(), recursive=True)
-        self.structure_changed()
+        self._changed = True
+        self._layout_changed()
 
     def remove(self, view: WxPythonView):
         self._children.remove(view)
         view.destroy()
-        self.structure_changed()
+        view._forget_layout()
+        self._changed = True
+        self._layout_changed()
+
+    def begin_update(self):
+        if self._updates == 0:
+            self._suspended.enter_context(self._suspend_layout())
+            self._changed = False
+        self._updates += 1
+
+    def end_update(self):
+        self._updates -= 1
+        if self._updates == 0:
+            self._suspended.close()
+            if self._changed:
+                self.structure_changed()
 
     def get_sizers(self, recursive: bool) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
         sizer = self._create_sizer(wx.VERTICAL)
@@ -0,0 +1,75 @@
+import typing
+from typing import Optional
+
+import wx
+
+from asn1editor.view.AbstractView import OptionalView
+from asn1editor.view.AbstractViewFactory import TypeInfo, Styles
+from asn1editor.wxPython.views.WxPythonView import WxPythonView, ControlList
+
+
+class WxPythonOptionalView(WxPythonView, OptionalView):
+    """
+    View of an optional element, which only consists of the optional checkbox until the element is enabled and its view is set.
+    """
+
+    def __init__(self, type_info: TypeInfo, controls: ControlList, container: bool, icon: Optional[str]):
+        super(WxPythonOptionalView, self).__init__(type_info, controls, container)
+        self.icon = icon
+        self._view: Optional[WxPythonView] = None
+        self._label = self._controls['optional'].GetLabel()
+
+    def set_view(self, view: Optional[WxPythonView]):
+        if self._view is not None:
+            self._view.destroy()
+            self._view._forget_layout()
+
+        self._view = view
+        if not self.container:
+            # The checkbox is placed in front of the name of a value
+            self._controls['optional'].SetLabel(self._label if view is None else '')
+
+        if self._view is not None:
+            self._set_layout_parent(self._view)
+            self._view.set_visible(self.get_has_value())
+
+        self._layout_changed()
+
+    def get_view(self) -> Optional[WxPythonView]:
+        return self._view
+
+    def enable(self, enabled: bool):
+        if self._view is not None:
+            self._view.enable(enabled)
+
+    def get_sizers(self, recursive: bool) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
+        right_sizer = None
+        if self._view is None:
+            sizer = self._create_sizer()
+        elif self.container:
+            sizer = wx.BoxSizer(wx.VERTICAL)
+            sizer.Add(self._create_sizer())
+            sizer.Add(self._get_child_sizers(self._view, recursive)[0])
+        else:
+            left_sizer, right_sizer = self._get_child_sizers(self._view, recursive)
+            sizer = wx.BoxSizer(wx.HORIZONTAL)
+            sizer.Add(self._controls['optional'], flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+            sizer.Add(left_sizer, flag=wx.ALIGN_CENTER_VERTICAL)
+
+        if self._controls.get('style') & Styles.HIDDEN:
+            sizer.ShowItems(False)
+
+        return sizer, right_sizer
+
+    def _get_layout_children(self) -> typing.List[WxPythonView]:
+        return [self._view] if self._view is not None else []
+
+    def destroy(self):
+        super(WxPythonOptionalView, self).destroy()
+        if self._view is not None:
+            self._view.destroy()
+
+    def set_visible(self, visible, recursive=True):
+        super(WxPythonOptionalView, self).set_visible(visible, recursive)
+        if self._view is not None and (recursive or not self._view.container):
+            self._view.set_visible(visible and self.get_has_value(), recursive)
@@ -0,0 +1,78 @@
+import typing
+from typing import Callable, ContextManager
+
+import wx
+
+from asn1editor.interfaces.PageInterface import PageInterface
+from asn1editor.view.AbstractViewFactory import TypeInfo
+from asn1editor.wxPython.views.WxPythonListView import WxPythonListView
+from asn1editor.wxPython.views.WxPythonView import ControlList
+
+
+class WxPythonPagedListView(WxPythonListView, PageInterface):
+    """
+    List view that only contains the controls of the elements on one page and a control to select the page.
+
+    The page controls are only shown if the list has more elements than fit on one page, otherwise the view looks like a list view without pages.
+    """
+
+    def __init__(self, type_info: TypeInfo, controls: ControlList, parent: wx.Window, suspend_layout: Callable[[], ContextManager], page_size: int):
+        super(WxPythonPagedListView, self).__init__(type_info, controls, parent, suspend_layout)
+        self._page_size = page_size
+        self._pages = 1
+        self.__show_page_controls(False)
+
+    def register_page_event(self, callback: Callable):
+        # noinspection PyUnusedLocal
+        def event_closure(e: wx.Event):
+            del e
+            self._controls['page'].GetTopLevelParent().Freeze()
+            callback()
+            self._controls['page'].GetTopLevelParent().Thaw()
+
+        self._bind(self._controls['page'], wx.EVT_SPINCTRL, event_closure)
+
+    def get_page_size(self) -> int:
+        return self._page_size
+
+    def get_page(self) -> int:
+        return self._controls['page'].GetValue() - 1
+
+    def set_page(self, page: int, pages: int):
+        self._controls['page'].SetRange(1, pages)
+        self._controls['page'].SetValue(page + 1)
+        self._controls['pages'].SetLabel(f'of {pages}')
+        if (pages > 1) != (self._pages > 1):
+            self.__show_page_controls(pages > 1 and self._controls['value'].IsShown())
+            self._invalidate_layout()
+            if self._updates:
+                self._changed = True
+            else:
+                self.structure_changed()
+        self._pages = pages
+
+    def enable(self, enabled: bool):
+        self._controls['page'].Enable(enabled)
+        super(WxPythonPagedListView, self).enable(enabled)
+
+    def set_visible(self, visible, recursive=True):
+        super(WxPythonPagedListView, self).set_visible(visible, recursive)
+        self.__show_page_controls(visible and self._pages > 1)
+
+    def __show_page_controls(self, visible: bool):
+        for name in ['page_label', 'page', 'pages']:
+            self._controls[name].Show(visible)
+
+    def get_sizers(self, recursive: bool) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
+        sizer = self._create_sizer(wx.VERTICAL)
+        sub_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        sub_sizer.Add(self._controls['num_elements'], border=5, flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL)
+        sub_sizer.Add(self._controls['value'], border=5, flag=wx.ALL)
+        sub_sizer.Add(self._controls['page_label'], border=5, flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL)
+        sub_sizer.Add(self._controls['page'], border=5, flag=wx.ALL)
+        sub_sizer.Add(self._controls['pages'], border=5, flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL)
+        sizer.Add(sub_sizer)
+
+        sizer.Add(self._get_container_sizer(recursive, self._children))
+
+        return sizer, None
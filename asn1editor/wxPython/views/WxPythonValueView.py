@@ -29,7 +29,7 @@ class WxPythonValueView(WxPythonView, ValueInterface):
             self.__update_tooltip()
             callback()
 
-        self._controls['value'].Bind(wx.EVT_TEXT, event_closure)
+        self._bind(self._controls['value'], wx.EVT_TEXT, event_closure)
 
     def get_value(self) -> str:
         return self._controls['value'].GetValue()
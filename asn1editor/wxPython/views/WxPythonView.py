@@ -7,12 +7,13 @@ import asn1editor.view
 from asn1editor.interfaces.OptionalInterface import OptionalInterface
 from asn1editor.view.AbstractView import AbstractView
 from asn1editor.view.AbstractViewFactory import TypeInfo
+from asn1editor.wxPython.ControlPool import ControlPool
 
 # @formatter:off
 ControlList = typing.Dict[str,
                           typing.Union[wx.TextCtrl, wx.CheckBox, wx.StaticBitmap, wx.ComboBox, wx.StaticText, wx.SpinCtrl,
                                        typing.List[typing.Tuple[int, wx.CheckBox]], asn1editor.view.AbstractViewFactory.Styles,
-                                       wx.adv.DatePickerCtrl, wx.adv.TimePickerCtrl]]
+                                       wx.adv.DatePickerCtrl, wx.adv.TimePickerCtrl, ControlPool]]
 # @formatter:on
 
 
@@ -23,6 +24,14 @@ class WxPythonView(AbstractView, OptionalInterface):
         self._type_info = type_info
         self._controls = controls
         self.container = container
+        # Sizers of the view and its children, which are kept until the structure or the visibility of the view or one of its children changes
+        self._layout: typing.Optional[typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]] = None
+        self._layout_valid = False
+        self._layout_parent: typing.Optional[WxPythonView] = None
+        # Cleared if the structure of the view or one of its children changed since the tree view was synced
+        self._synced = False
+        # Event handlers bound to the controls, which are unbound when the controls are released
+        self._bindings: typing.List[typing.Tuple[wx.Window, wx.PyEventBinder, typing.Callable]] = []
 
     def register_optional_event(self, callback: typing.Callable):
         # noinspection PyUnusedLocal
@@ -34,7 +43,7 @@ class WxPythonView(AbstractView, OptionalInterface):
             self._controls['optional'].GetTopLevelParent().Thaw()
 
         if 'optional' in self._controls:
-            self._controls.get('optional').Bind(wx.EVT_CHECKBOX, event_closure)
+            self._bind(self._controls.get('optional'), wx.EVT_CHECKBOX, event_closure)
 
     def register_change_event(self, callback: typing.Callable):
         pass
@@ -60,20 +69,120 @@ class WxPythonView(AbstractView, OptionalInterface):
     def get_sizers(self, recursive: bool) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
         raise NotImplementedError()
 
+    def get_layout(self) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
+        """
+        Returns the sizers of the view including all its children.
+
+        The sizers are only created again if the view or one of its children changed, otherwise the kept sizers are returned.
+        release_layout must be called before, so kept sizers can be added to the new sizers of their parents.
+        """
+        if not self._layout_valid:
+            self._layout = self.get_sizers(recursive=True)
+            self._layout_valid = True
+        return self._layout
+
+    def release_layout(self) -> typing.Optional[typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]]:
+        """
+        Detaches the kept sizers of unchanged children from the sizers of the view if the view changed, so the caller can delete them.
+
+        @return: Kept sizers of the view or None if they are created again
+        """
+        if self._layout_valid:
+            return self._layout
+        if self._layout is not None:
+            kept = {}
+            for child in self._get_layout_children():
+                sizers = child.release_layout()
+                if sizers is not None:
+                    kept.update((id(sizer), sizer) for sizer in sizers if sizer is not None)
+            self.__detach_sizers(self._layout, kept)
+        return None
+
+    def _get_layout_children(self) -> typing.List['WxPythonView']:
+        return []
+
+    def _set_layout_parent(self, view: 'WxPythonView'):
+        view._layout_parent = self
+
+    def _forget_layout(self):
+        # The sizers of a removed view are deleted with the sizers of its former parent
+        self._layout = None
+        self._layout_valid = False
+        for child in self._get_layout_children():
+            child._forget_layout()
+
+    def _invalidate_layout(self, structure: bool = False):
+        view = self
+        while view is not None:
+            view._layout_valid = False
+            if structure:
+                view._synced = False
+            view = view._layout_parent
+
+    def _layout_changed(self):
+        self._invalidate_layout(structure=True)
+        self.structure_changed()
+
+    def is_synced(self) -> bool:
+        """
+        Returns if the structure of the view and its children is unchanged since set_synced was called, e.g. by the tree view.
+        """
+        return self._synced
+
+    def set_synced(self):
+        self._synced = True
+
+    @staticmethod
+    def _get_child_sizers(child: 'WxPythonView', recursive: bool) -> typing.Tuple[wx.Sizer, typing.Optional[wx.Sizer]]:
+        # Only the sizers of the whole view tree are kept, the tree view creates the sizers of single views
+        return child.get_layout() if recursive else child.get_sizers(recursive)
+
+    @staticmethod
+    def __detach_sizers(sizers: typing.Iterable[typing.Optional[wx.Sizer]], kept: typing.Dict[int, wx.Sizer]):
+        for sizer in sizers:
+            if sizer is None:
+                continue
+            for item in list(sizer.GetChildren()):
+                if not item.IsSizer():
+                    continue
+                child = item.GetSizer()
+                if id(child) in kept:
+                    sizer.Detach(child)
+                else:
+                    WxPythonView.__detach_sizers([child], kept)
+
     def enable(self, enabled: bool):
         return
 
     def destroy(self):
+        for control, event, handler in self._bindings:
+            control.Unbind(event, handler=handler)
+        self._bindings.clear()
+
         for name, control in self._controls.items():
             if name == 'optional':
                 continue
             if isinstance(control, wx.Object):
-                control.Destroy()
+                self._release(control)
+
+    def _bind(self, control: wx.Window, event: wx.PyEventBinder, handler: typing.Callable):
+        control.Bind(event, handler)
+        self._bindings.append((control, event, handler))
+
+    def _release(self, control: wx.Window):
+        # Controls created by the view factory are reused for new views
+        pool: typing.Optional[ControlPool] = self._controls.get('pool')
+        if pool is not None:
+            pool.release(control)
+        else:
+            control.Destroy()
 
     def get_type_info(self) -> TypeInfo:
         return self._type_info
 
     def set_visible(self, visible, recursive=True):
+        # The sizers hide controls of hidden elements, so they are created again
+        self._invalidate_layout()
         for control in self._controls.values():
             if isinstance(control, wx.Window):
                 control.Show(visible)
@@ -106,7 +215,7 @@ class WxPythonView(AbstractView, OptionalInterface):
             column = 0 if left_column else 2
             row = index if left_column else index - len(children) // 2
 
-            left_column_sizer, right_column_sizer = child.get_sizers(recursive)
+            left_column_sizer, right_column_sizer = WxPythonView._get_child_sizers(child, recursive)
             gb_left_pos = wx.GBPosition(row, column)
             # If no right column present, span over two columns
             if right_column_sizer is None:
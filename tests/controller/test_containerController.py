@@ -2,23 +2,16 @@ from unittest import TestCase
 
 from asn1editor.controller import Controller
 from asn1editor.controller import Converter
+from tests.controller.test_choiceController import TestChoiceInstanceFactory
 from tests.controller.test_listController import TestListInstanceFactory
 from tests.controller.test_valueBoolControllers import TestValueInterface, TestOptionalInterface
 
 
-class TestListInstanceFactoryContainer:
-    def __init__(self):
-        self.values = {}
-        self.instances = {}
-
+class TestListInstanceFactoryContainer(TestListInstanceFactory):
     def create(self, i, p: Controller.ListController):
         self.values[i] = TestValueInterface()
         self.instances[i] = Controller.ContainerController(str(i), p, None)
 
-    def destroy(self, i):
-        del self.values[i]
-        del self.instances[i]
-
 
 class TestContainerController(TestCase):
     def test_add_controller(self):
@@ -152,3 +145,41 @@ class TestContainerController(TestCase):
         Controller.ValueController('test_val', container, value_interface, None, Converter.Str(0, 'default'))
         value_interface.val = 'test'
         self.assertEqual(container.view_to_model(), {'test_list': [1], 'test_val': 'test'})
+
+    def test_restore(self):
+        root = Controller.RootController('root')
+        int_interface = TestValueInterface()
+        str_interface = TestValueInterface()
+        bool_interface = TestValueInterface()
+        list_value_interface = TestValueInterface()
+        choice_value_interface = TestValueInterface()
+        optional_interface = TestOptionalInterface()
+        list_instance_factory = TestListInstanceFactory()
+        choice_instance_factory = TestChoiceInstanceFactory()
+
+        container = Controller.ContainerController('test', root, None)
+        Controller.ValueController('int', container, int_interface, None, Converter.Int(0, None))
+        Controller.ValueController('str', container, str_interface, optional_interface, Converter.Str(0, 'default'))
+        Controller.BoolController('bool', container, bool_interface, None, False)
+        Controller.ListController('list', container, list_value_interface, None, list_instance_factory, 0)
+        Controller.ChoiceController('choice', container, choice_value_interface, None, choice_instance_factory, 'a')
+        Controller.NullController('null', container, None)
+
+        not_restored = root.restore({'test': {'int': 'no int', 'str': 'test', 'bool': True, 'list': ['x', 1], 'choice': ('b', 'value'), 'null': None,
+                                              'removed': 1}})
+        self.assertEqual(['test.int', 'test.list.1', 'test.removed'], not_restored)
+        self.assertEqual(int_interface.val, '0')
+        self.assertEqual(str_interface.val, 'test')
+        self.assertTrue(optional_interface.val)
+        self.assertTrue(bool_interface.val)
+        self.assertEqual(list_value_interface.val, '2')
+        self.assertEqual(list_instance_factory.values[0].val, 'x')
+        self.assertEqual(choice_value_interface.val, 'b')
+        self.assertEqual(choice_instance_factory.value.val, 'value')
+
+        not_restored = root.restore({'test': {'int': 1, 'bool': 1, 'list': 'no list'}})
+        self.assertEqual(['test.bool', 'test.list'], not_restored)
+        self.assertEqual(int_interface.val, '1')
+        self.assertFalse(optional_interface.val)
+
+        self.assertEqual(['test'], root.restore({'test': []}))
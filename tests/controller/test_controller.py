@@ -18,6 +18,9 @@ class TestValueController(TestCase):
         with self.assertRaises(NotImplementedError):
             controller.view_to_model()
 
+        with self.assertRaises(NotImplementedError):
+            controller.restore({})
+
         controller.optional_handler()
 
         self.assertEqual(str(controller), 'Test')
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from asn1editor.controller import Controller, Converter
+from tests.controller.test_valueBoolControllers import TestValueInterface
+
+
+class TestLazyController(TestCase):
+    @staticmethod
+    def create_lazy(name: str, parent: Controller.Controller) -> Controller.LazyController:
+        def create(p: Controller.Controller):
+            container = Controller.ContainerController(name, p, None)
+            Controller.ValueController('value', container, TestValueInterface(), None, Converter.Str(0, 'default'))
+            return 'view'
+
+        lazy = Controller.LazyController(name, parent)
+        lazy.realize = lambda: lazy.build(create)
+        return lazy
+
+    def test_container(self):
+        root = Controller.RootController('root')
+        Controller.ValueController('first', root, TestValueInterface(), None, Converter.Str(0, 'first'))
+        lazy = self.create_lazy('lazy', root)
+        Controller.ValueController('last', root, TestValueInterface(), None, Converter.Str(0, 'last'))
+
+        self.assertIs(lazy, root._controllers['lazy'])
+        self.assertFalse(lazy.is_built())
+        self.assertEqual('lazy', lazy.get_path())
+
+        # Elements that were not built yet provide their default values
+        self.assertEqual({'first': 'first', 'lazy': {'value': 'default'}, 'last': 'last'}, root.view_to_model())
+        self.assertTrue(lazy.is_built())
+        self.assertIsInstance(root._controllers['lazy'], Controller.ContainerController)
+        self.assertEqual(['first', 'lazy', 'last'], list(root._controllers.keys()))
+
+        lazy = self.create_lazy('lazy', root)
+        root.model_to_view({'first': 'first', 'lazy': {'value': 'loaded'}, 'last': 'last'})
+        self.assertEqual({'value': 'loaded'}, root._controllers['lazy'].view_to_model())
+
+        with self.assertRaises(Exception):
+            lazy.add_controller('Test', root)
+
+    def test_list(self):
+        root = Controller.RootController('root')
+        list_controller = Controller.ListController('list', root, TestValueInterface(), None, None, 0)
+        first = self.create_lazy('Element 0', list_controller)
+        second = self.create_lazy('Element 1', list_controller)
+
+        self.assertEqual({'value': 'default'}, second.view_to_model())
+        self.assertIs(first, list_controller._controllers[0])
+        self.assertIsInstance(list_controller._controllers[1], Controller.ContainerController)
+        self.assertEqual(['list.Element 0', 'list.Element 1'], [c.get_path() for c in list_controller._controllers])
+
+    def test_choice(self):
+        class ChoiceInstanceFactory:
+            @staticmethod
+            def create(member: str, parent: Controller.ChoiceController):
+                TestLazyController.create_lazy(member, parent)
+
+        root = Controller.RootController('root')
+        choice_controller = Controller.ChoiceController('choice', root, TestValueInterface(), None, ChoiceInstanceFactory(), 'a')
+        self.assertIsInstance(choice_controller._controller, Controller.LazyController)
+        self.assertEqual(['choice.a.xyz'], choice_controller.restore(('a', {'value': 'restored', 'xyz': 1})))
+        self.assertEqual(('a', {'value': 'restored'}), choice_controller.view_to_model())
@@ -1,3 +1,4 @@
+import contextlib
 from unittest import TestCase
 
 from asn1editor.controller import Controller, Converter
@@ -8,15 +9,53 @@ class TestListInstanceFactory:
     def __init__(self):
         self.values = {}
         self.instances = {}
+        self.updates = 0
+        self.defaults = 0
 
     def create(self, i, p: Controller.ListController):
+        # Elements are only created and destroyed in an update, so the layout is only updated once
+        assert self.updates > 0
         self.values[i] = TestValueInterface()
         self.instances[i] = Controller.ValueController(str(i), p, self.values[i], None, Converter.Str(0, None))
 
     def destroy(self, i):
+        assert self.updates > 0
         del self.values[i]
         del self.instances[i]
 
+    def get_default(self, p: Controller.ListController):
+        assert isinstance(p, Controller.ListController)
+        self.defaults += 1
+        return ''
+
+    @contextlib.contextmanager
+    def update(self):
+        self.updates += 1
+        try:
+            yield
+        finally:
+            self.updates -= 1
+
+
+class TestPageInterface:
+    def __init__(self, page_size: int):
+        self.page_size = page_size
+        self.page = 0
+        self.pages = None
+
+    def register_page_event(self, callback):
+        pass
+
+    def get_page_size(self) -> int:
+        return self.page_size
+
+    def get_page(self) -> int:
+        return self.page
+
+    def set_page(self, page: int, pages: int):
+        self.page = page
+        self.pages = pages
+
 
 class TestListController(TestCase):
     def test_init(self):
@@ -111,3 +150,44 @@ class TestListController(TestCase):
         controller.optional_handler()
         self.assertEqual(len(list_instance_factory.instances), 2)
         self.assertEqual(value_interface.val, 2)
+
+    def test_pages(self):
+        root = Controller.RootController('root')
+        value_interface = TestValueInterface()
+        list_instance_factory = TestListInstanceFactory()
+        page_interface = TestPageInterface(10)
+
+        controller = Controller.ListController('test', root, value_interface, None, list_instance_factory, 0, page_interface)
+        model = [str(i) for i in range(25)]
+        controller.model_to_view({'test': model})
+        self.assertEqual(value_interface.val, '25')
+        self.assertEqual(list(range(10)), list(list_instance_factory.instances))
+        self.assertEqual((0, 3), (page_interface.page, page_interface.pages))
+
+        page_interface.page = 2
+        controller.page_handler()
+        self.assertEqual(list(range(20, 25)), list(list_instance_factory.instances))
+        self.assertEqual(list_instance_factory.values[24].val, '24')
+        list_instance_factory.values[24].val = 'changed'
+        self.assertEqual(model[:24] + ['changed'], controller.view_to_model())
+
+        # New elements get the model of a new element, the page is moved if the shown elements are removed
+        value_interface.val = 27
+        controller.event_handler()
+        self.assertEqual(list(range(20, 27)), list(list_instance_factory.instances))
+        value_interface.val = 12
+        controller.event_handler()
+        self.assertEqual([10, 11], list(list_instance_factory.instances))
+        self.assertEqual((1, 2), (page_interface.page, page_interface.pages))
+        self.assertEqual(model[:12], controller.view_to_model())
+
+        self.assertEqual([], controller.restore(model))
+        self.assertEqual(list(range(10, 20)), list(list_instance_factory.instances))
+        self.assertEqual(model, controller.view_to_model())
+
+        # Elements that were never shown get the default model without creating their controllers
+        value_interface.val = 35
+        controller.event_handler()
+        self.assertEqual(list(range(10, 20)), list(list_instance_factory.instances))
+        self.assertEqual(model + [''] * 10, controller.view_to_model())
+        self.assertEqual(10, list_instance_factory.defaults)
@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from asn1editor.controller import Controller, Converter
+from tests.controller.test_valueBoolControllers import TestValueInterface, TestOptionalInterface
+
+
+class TestOptionalInstanceFactory:
+    def __init__(self):
+        self.value_interface = None
+        self.created = 0
+
+    def create(self, parent: Controller.OptionalController):
+        self.value_interface = TestValueInterface()
+        self.created += 1
+        container = Controller.ContainerController('optional', parent, None)
+        Controller.ValueController('value', container, self.value_interface, None, Converter.Str(0, 'default'))
+
+    def destroy(self):
+        self.value_interface = None
+
+
+class TestOptionalController(TestCase):
+    def test_optional(self):
+        root = Controller.RootController('root')
+        container = Controller.ContainerController('container', root, None)
+        optional_interface = TestOptionalInterface()
+        factory = TestOptionalInstanceFactory()
+        controller = Controller.OptionalController('optional', container, optional_interface, factory)
+
+        # The element is not created before it is enabled
+        self.assertIsNone(factory.value_interface)
+        self.assertFalse(optional_interface.get_has_value())
+        self.assertEqual({}, container.view_to_model())
+        self.assertEqual('container.optional', controller.path)
+
+        optional_interface.set_has_value(True)
+        controller.optional_handler()
+        self.assertEqual({'optional': {'value': 'default'}}, container.view_to_model())
+        self.assertEqual('container.optional', controller._controller.path)
+        self.assertEqual('container.optional.value', controller._controller._controllers['value'].path)
+
+        optional_interface.set_has_value(False)
+        controller.optional_handler()
+        self.assertIsNone(factory.value_interface)
+        self.assertIsNone(controller._controller)
+        self.assertEqual({}, container.view_to_model())
+
+        container.model_to_view({'container': {'optional': {'value': 'loaded'}}})
+        self.assertTrue(optional_interface.get_has_value())
+        self.assertEqual('loaded', factory.value_interface.get_value())
+        self.assertEqual(2, factory.created)
+
+        container.model_to_view({'container': {}})
+        self.assertFalse(optional_interface.get_has_value())
+        self.assertIsNone(controller._controller)
+
+    def test_restore(self):
+        root = Controller.RootController('root')
+        optional_interface = TestOptionalInterface()
+        factory = TestOptionalInstanceFactory()
+        Controller.OptionalController('optional', root, optional_interface, factory)
+
+        self.assertEqual(['optional.unknown'], root.restore({'optional': {'value': 'restored', 'unknown': 1}}))
+        self.assertEqual({'optional': {'value': 'restored'}}, root.view_to_model())
+
+        self.assertEqual([], root.restore({}))
+        self.assertFalse(optional_interface.get_has_value())
+        self.assertIsNone(factory.value_interface)
@@ -1,8 +1,14 @@
 import filecmp
 import os
+import tempfile
 from unittest import TestCase
+from unittest.mock import patch
 
+import asn1tools
+
+from asn1editor import TypeDescription
 from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.SpecCache import SpecCache
 from asn1editor.view.AbstractViewFactory import AbstractViewFactory
 
 
@@ -46,18 +52,183 @@ class TestASN1SpecHandler(TestCase):
 
     def test_save_data_file(self):
         asn1_spec_handler = ASN1SpecHandler(['example/example.asn'])
-        with self.assertRaises(AssertionError):
-            asn1_spec_handler.save_data_file('test.jer', {})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jer_file_name = os.path.join(temp_dir, 'test.jer')
+            xml_file_name = os.path.join(temp_dir, 'test.xml')
+            with self.assertRaises(AssertionError):
+                asn1_spec_handler.save_data_file(jer_file_name, {})
 
-        asn1_spec_handler._type_name = 'Sequence'
+            asn1_spec_handler._type_name = 'Sequence'
 
-        d = asn1_spec_handler.load_data_file('example/example_with_additionals.json')
-        asn1_spec_handler.save_data_file('test.jer', d)
-        self.assertTrue(filecmp.cmp('test.jer', 'example/example_with_additionals.json', False))
+            d = asn1_spec_handler.load_data_file('example/example_with_additionals.json')
+            asn1_spec_handler.save_data_file(jer_file_name, d)
+            self.assertTrue(filecmp.cmp(jer_file_name, 'example/example_with_additionals.json', False))
 
-        asn1_spec_handler.save_data_file('test.xml', d)
-        d2 = asn1_spec_handler.load_data_file('test.xml')
-        self.assertDictEqual(d, d2)
+            asn1_spec_handler.save_data_file(xml_file_name, d)
+            d2 = asn1_spec_handler.load_data_file(xml_file_name)
+            self.assertDictEqual(d, d2)
 
-        with self.assertRaises(Exception):
-            asn1_spec_handler.save_data_file('test.something', d)
+            with self.assertRaises(Exception):
+                asn1_spec_handler.save_data_file(os.path.join(temp_dir, 'test.something'), d)
+
+    def test_parse_once(self):
+        asn1_spec_handler = ASN1SpecHandler(['example/example.asn'])
+        with patch('asn1tools.parse_files', wraps=asn1tools.parse_files) as parse_files_mock:
+            oer = asn1_spec_handler.get_compiled('oer')
+            jer = asn1_spec_handler.get_compiled('jer')
+            uper = asn1_spec_handler.get_compiled('uper')
+            parse_files_mock.assert_called_once()
+
+        self.assertIs(oer, asn1_spec_handler.get_compiled('oer'))
+        self.assertEqual(sorted(oer.types.keys()), sorted(jer.types.keys()))
+        self.assertEqual(sorted(oer.types.keys()), sorted(uper.types.keys()))
+
+    def test_precompile(self):
+        asn1_spec_handler = ASN1SpecHandler(['example/example.asn'])
+        with patch('asn1tools.compile_dict', wraps=asn1tools.compile_dict) as compile_dict_mock:
+            asn1_spec_handler.precompile(['jer', 'uper'])
+            asn1_spec_handler.precompile(['jer'])
+            jer = asn1_spec_handler.get_compiled('jer')
+            uper = asn1_spec_handler.get_compiled('uper')
+            self.assertEqual(compile_dict_mock.call_count, 2)
+
+        self.assertIs(jer, asn1_spec_handler.get_compiled('jer'))
+        self.assertIs(uper, asn1_spec_handler.get_compiled('uper'))
+        asn1_spec_handler.close()
+
+    def test_cancelled_precompile(self):
+        asn1_spec_handler = ASN1SpecHandler(['example/example.asn'])
+        # While the first codec cannot be compiled, the second one waits in the background thread
+        with asn1_spec_handler._ASN1SpecHandler__compile_lock:
+            asn1_spec_handler.precompile(['jer', 'uper'])
+            # The compilation is cancelled like by close or reload after get_compiled took the future
+            self.assertTrue(asn1_spec_handler._ASN1SpecHandler__futures['uper'].cancel())
+
+        self.assertIsInstance(asn1_spec_handler.get_compiled('uper'), asn1tools.compiler.Specification)
+        self.assertIsInstance(asn1_spec_handler.get_compiled('jer'), asn1tools.compiler.Specification)
+        asn1_spec_handler.close()
+
+    def test_used_codecs(self):
+        asn1_spec_handler = ASN1SpecHandler(['example/example.asn'])
+        asn1_spec_handler._type_name = 'Sequence'
+        self.assertEqual(asn1_spec_handler.get_used_codecs(), [])
+
+        model = asn1_spec_handler.load_data_file('example/example_with_additionals.json')
+        asn1_spec_handler.get_data_from_model(model, 'uper')
+        self.assertEqual(asn1_spec_handler.get_used_codecs(), ['uper', 'jer'])
+        asn1_spec_handler.get_data_from_model(model, 'jer')
+        self.assertEqual(asn1_spec_handler.get_used_codecs(), ['jer', 'uper'])
+
+    def test_get_type_names(self):
+        for file_name in ['example/example.asn', 'tests/standards/rfc1157.asn', 'tests/standards/rfc5280.asn']:
+            asn1_spec_handler = ASN1SpecHandler(file_name)
+            self.assertEqual(asn1_spec_handler.get_types(), asn1_spec_handler.get_type_names())
+
+    def test_compile_type_only(self):
+        asn1_spec_handler = ASN1SpecHandler('tests/standards/rfc5280.asn', compile_type_only=True)
+        with self.assertRaises(ValueError):
+            asn1_spec_handler.create_view_controller_for_type('PKIX1Implicit88.Unknown', AbstractViewFactory(), None)
+
+        with patch('asn1editor.TypeDescription.compile_dict', wraps=TypeDescription.compile_dict) as compile_dict_mock:
+            with self.assertRaises(NotImplementedError):
+                asn1_spec_handler.create_view_controller_for_type('PKIX1Implicit88.CertificatePolicies', AbstractViewFactory(), None)
+            closure = compile_dict_mock.call_args[0][0]
+            self.assertCountEqual(closure['PKIX1Implicit88']['types'].keys(), ['CertificatePolicies', 'PolicyInformation', 'CertPolicyId',
+                                                                               'PolicyQualifierInfo', 'PolicyQualifierId'])
+            self.assertEqual(closure['PKIX1Explicit88']['types'], {})
+
+        # The full specification is still available
+        self.assertIn('Certificate', asn1_spec_handler.get_compiled('oer').modules['PKIX1Explicit88'])
+
+    def test_no_codec_for_views(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        with patch('asn1tools.compile_dict', wraps=asn1tools.compile_dict) as compile_dict_mock:
+            with self.assertRaises(NotImplementedError):
+                asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', AbstractViewFactory(), None)
+            compile_dict_mock.assert_not_called()
+
+            asn1_spec_handler.load_data_file('example/example.json')
+            self.assertEqual([call[0][1] for call in compile_dict_mock.call_args_list], ['jer'])
+
+    def test_reload(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            def write(name: str, content: str, mtime: int) -> str:
+                file_name = os.path.join(temp_dir, name)
+                with open(file_name, 'w') as f:
+                    f.write(content)
+                os.utime(file_name, (mtime, mtime))
+                return file_name
+
+            a = write('a.asn', 'A DEFINITIONS ::= BEGIN IMPORTS TypeB FROM B; TypeA ::= SEQUENCE { b TypeB } END', 1000)
+            b = write('b.asn', 'B DEFINITIONS ::= BEGIN TypeB ::= INTEGER END', 1000)
+            c = write('c.asn', 'C DEFINITIONS ::= BEGIN TypeC ::= BOOLEAN END', 1000)
+
+            asn1_spec_handler = ASN1SpecHandler([a, b, c])
+            self.assertEqual(['A.TypeA', 'B.TypeB', 'C.TypeC'], asn1_spec_handler.get_types())
+            self.assertEqual([], asn1_spec_handler.get_changed_files())
+
+            write('b.asn', 'B DEFINITIONS ::= BEGIN TypeB ::= INTEGER TypeB2 ::= NULL END', 2000)
+            self.assertEqual([b], asn1_spec_handler.get_changed_files())
+
+            with patch('asn1tools.parse_files', wraps=asn1tools.parse_files) as parse_files_mock:
+                self.assertEqual(['A', 'B'], asn1_spec_handler.reload())
+                self.assertCountEqual([a, b], [call[0][0] for call in parse_files_mock.call_args_list])
+
+            self.assertEqual([], asn1_spec_handler.get_changed_files())
+            self.assertEqual(['A.TypeA', 'B.TypeB', 'B.TypeB2', 'C.TypeC'], asn1_spec_handler.get_types())
+
+            # Parse errors keep the loaded spec
+            write('c.asn', 'C DEFINITIONS ::= BEGIN TypeC ::= END', 3000)
+            with self.assertRaises(asn1tools.ParseError):
+                asn1_spec_handler.reload()
+            self.assertEqual([], asn1_spec_handler.get_changed_files())
+            self.assertIn('C.TypeC', asn1_spec_handler.get_types())
+
+            # The files are parsed in a child process, failed files are parsed again with the next change
+            write('a.asn', 'A DEFINITIONS ::= BEGIN IMPORTS TypeB FROM B; TypeA ::= SEQUENCE { b TypeB } TypeA2 ::= BOOLEAN END', 4000)
+            process = asn1_spec_handler.start_reload_process()
+            with self.assertRaises(asn1tools.ParseError):
+                process.get_result()
+            write('c.asn', 'C DEFINITIONS ::= BEGIN TypeC ::= OCTET STRING END', 5000)
+            process = asn1_spec_handler.start_reload_process()
+            state = process.get_result()
+            self.assertCountEqual([a, c], state['parsed_files'])
+            with patch('asn1tools.parse_files', wraps=asn1tools.parse_files) as parse_files_mock:
+                self.assertEqual(['A', 'C'], asn1_spec_handler.reload(state))
+                parse_files_mock.assert_not_called()
+            self.assertEqual(['A.TypeA', 'A.TypeA2', 'B.TypeB', 'B.TypeB2', 'C.TypeC'], asn1_spec_handler.get_types())
+            self.assertIsNone(asn1_spec_handler.start_reload_process())
+
+    def test_compile_process(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        process = asn1_spec_handler.start_compile_process([ASN1SpecHandler.DESCRIPTION, 'jer'])
+        state = process.get_result()
+        self.assertEqual(3, process.progress)
+        self.assertEqual(['description', 'jer'], list(state['compiled'].keys()))
+
+        with patch('asn1tools.parse_files') as parse_files_mock:
+            asn1_spec_handler.set_state(state)
+            self.assertIsNone(asn1_spec_handler.start_compile_process([ASN1SpecHandler.DESCRIPTION, 'jer']))
+            self.assertEqual(['EXAMPLE.Sequence'], [t for t in asn1_spec_handler.get_types() if t.endswith('.Sequence')])
+            parse_files_mock.assert_not_called()
+
+        # The child process stores its results in the spec cache
+        with tempfile.TemporaryDirectory() as temp_dir:
+            spec_cache = SpecCache(temp_dir)
+            ASN1SpecHandler('example/example.asn', spec_cache).start_compile_process(['jer']).get_result()
+            self.assertIsNone(ASN1SpecHandler('example/example.asn', spec_cache).start_compile_process(['jer']))
+
+        # Cancelling kills the child process
+        process = ASN1SpecHandler('tests/standards/rrc_14_4_0.asn').start_compile_process([ASN1SpecHandler.DESCRIPTION])
+        process.cancel()
+        self.assertTrue(process.poll())
+        with self.assertRaises(RuntimeError):
+            process.get_result()
+
+        # Errors of the child process are raised
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_name = os.path.join(temp_dir, 'error.asn')
+            with open(file_name, 'w') as f:
+                f.write('E DEFINITIONS ::= BEGIN TypeE ::= END')
+            with self.assertRaises(asn1tools.ParseError):
+                ASN1SpecHandler(file_name).start_compile_process([]).get_result()
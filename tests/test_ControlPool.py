@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+import wx
+
+from asn1editor.wxPython.ControlPool import ControlPool
+from tests import TestHelper
+
+
+class ControlPoolTest(TestCase):
+    def setUp(self) -> None:
+        # noinspection PyUnusedLocal
+        self.app = TestHelper.get_wx_app()
+        self.frame = wx.Frame(None)
+
+    def tearDown(self) -> None:
+        self.frame.Destroy()
+
+    def test_reuse(self):
+        pool = ControlPool()
+        self.assertIsNone(pool.get(wx.TextCtrl))
+
+        text_ctrl = wx.TextCtrl(self.frame)
+        text_ctrl.SetToolTip('Tooltip')
+        text_ctrl.Enable(False)
+        sizer = wx.BoxSizer()
+        sizer.Add(text_ctrl)
+        pool.release(text_ctrl)
+
+        self.assertFalse(text_ctrl.IsShown())
+        self.assertIsNone(text_ctrl.GetContainingSizer())
+        self.assertIsNone(pool.get(wx.CheckBox))
+
+        reused = pool.get(wx.TextCtrl)
+        self.assertIs(reused, text_ctrl)
+        self.assertTrue(reused.IsShown())
+        self.assertTrue(reused.IsEnabled())
+        self.assertIsNone(reused.GetToolTip())
+        self.assertIsNone(pool.get(wx.TextCtrl))
+
+    def test_limit(self):
+        pool = ControlPool()
+        pool.MAX_CONTROLS = 1
+
+        pool.release(wx.StaticText(self.frame))
+        pool.release(wx.StaticText(self.frame))
+        # Controls that cannot be reused are destroyed
+        pool.release(wx.Gauge(self.frame))
+
+        self.assertIsNotNone(pool.get(wx.StaticText))
+        self.assertIsNone(pool.get(wx.StaticText))
+        self.assertIsNone(pool.get(wx.Gauge))
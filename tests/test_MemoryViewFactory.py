@@ -0,0 +1,194 @@
+import datetime
+import subprocess
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+import asn1tools
+
+from asn1editor import MemoryViewFactory, TypeDescription
+from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.ViewControllerFactory import ViewControllerFactory
+from asn1editor.controller.ChoiceInstanceFactory import ChoiceInstanceFactory
+
+RECURSIVE_SPEC = '''
+Recursive DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+Tree ::= SEQUENCE { value INTEGER, children SEQUENCE OF Tree }
+Node ::= SEQUENCE { value INTEGER, next Node }
+END
+'''
+
+
+class MemoryViewFactoryTest(TestCase):
+    def test_encode_decode(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), None)
+
+        model = controller.view_to_model()
+        self.assertEqual(('exampleList', [0, 0, 0, 0]), model['Sequence']['choiceExample'])
+        self.assertNotIn('example2', model['Sequence'])
+        self.assertEqual(0, model['Sequence']['additional'])
+
+        data = asn1_spec_handler.get_data_from_model(model, 'uper')
+        model = asn1_spec_handler.get_model_from_data(data, 'uper')
+        model['Sequence']['example2'] = {'member1': 1, 'member2': 2, 'enumerated': 'enum2'}
+        model['Sequence']['optionalSequenceOf'] = [{'member1': 3, 'member2': 4}]
+
+        controller.model_to_view(model)
+        self.assertEqual(model, controller.view_to_model())
+
+        controller.model_to_view({'Sequence': {k: v for k, v in model['Sequence'].items() if k != 'example2'}})
+        self.assertNotIn('example2', controller.view_to_model()['Sequence'])
+
+    def test_change(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), None)
+        children = {child.type_info.name: child for child in view.children}
+
+        # Optional elements are only created when they are enabled
+        self.assertIsNone(children['optionalSequenceOf'].view)
+        children['optionalSequenceOf'].change_has_value(True)
+        list_view = children['optionalSequenceOf'].view
+        self.assertEqual(1, len(list_view.children))
+
+        list_view.change_value('2')
+        self.assertEqual(2, len(controller.view_to_model()['Sequence']['optionalSequenceOf']))
+
+        children['choiceExample'].change_value('exampleInt')
+        self.assertEqual(('exampleInt', 0), controller.view_to_model()['Sequence']['choiceExample'])
+
+        children['optionalSequenceOf'].change_has_value(False)
+        self.assertIsNone(children['optionalSequenceOf'].view)
+        self.assertNotIn('optionalSequenceOf', controller.view_to_model()['Sequence'])
+
+    def test_grow_list(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), None)
+        list_view = {child.type_info.name: child for child in view.children}['choiceExample'].view
+
+        list_view.change_value('300')
+        list_view.change_value('100')
+        list_view.change_value('200')
+        self.assertEqual(('exampleList', [0] * 200), controller.view_to_model()['Sequence']['choiceExample'])
+        self.assertEqual([f'Element {i}' for i in range(200)], [child.type_info.name for child in list_view.children])
+
+    def test_pages(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(page_size=10), None)
+        model = controller.view_to_model()
+        model['Sequence']['optionalSequenceOf'] = [{'member1': i, 'member2': 0} for i in range(25)]
+        controller.model_to_view(model)
+
+        list_view = {child.type_info.name: child for child in view.children}['optionalSequenceOf'].view
+        self.assertEqual(10, len(list_view.children))
+        self.assertEqual(3, list_view.pages)
+        list_view.change_page(2)
+        self.assertEqual([f'Element {i}' for i in range(20, 25)], [child.type_info.name for child in list_view.children])
+
+        list_view.change_value('30')
+        self.assertEqual(10, len(list_view.children))
+        model['Sequence']['optionalSequenceOf'] += [{'member1': 1000, 'member2': -100}] * 5
+        self.assertEqual(model, controller.view_to_model())
+
+    def test_switch_choice(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), None)
+        choice_view = {child.type_info.name: child for child in view.children}['choiceExample']
+        list_view = choice_view.view
+
+        list_view.children[0].set_value('5')
+        choice_view.change_value('exampleInt')
+        choice_view.view.set_value('7')
+        choice_view.change_value('exampleList')
+        self.assertIs(list_view, choice_view.view)
+        self.assertEqual(('exampleList', [5, 0, 0, 0]), controller.view_to_model()['Sequence']['choiceExample'])
+        choice_view.change_value('exampleInt')
+        self.assertEqual(('exampleInt', 7), controller.view_to_model()['Sequence']['choiceExample'])
+
+        # Elements that are deselected too long ago are created again
+        ChoiceInstanceFactory.MAX_KEPT_MEMBERS = 0
+        try:
+            choice_view.change_value('sequence')
+            choice_view.change_value('exampleList')
+        finally:
+            ChoiceInstanceFactory.MAX_KEPT_MEMBERS = 4
+        self.assertIsNot(list_view, choice_view.view)
+        self.assertEqual(('exampleList', [0, 0, 0, 0]), controller.view_to_model()['Sequence']['choiceExample'])
+
+    def test_recursive(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(RECURSIVE_SPEC))['Recursive']
+
+        tree = {'value': 0, 'children': []}
+        for i in range(1, 100):
+            tree = {'value': i, 'children': [tree, {'value': 0, 'children': []}]}
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Tree'])
+        controller.model_to_view({'Tree': tree})
+        self.assertEqual({'Tree': tree}, controller.view_to_model())
+
+        # The model of elements that were not realized yet is created without building them
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Tree'])
+        children_view = {child.type_info.name: child for child in view.children}['children']
+        children_view.change_value('2')
+        self.assertEqual({'Tree': {'value': 0, 'children': [{'value': 0, 'children': []}] * 2}}, controller.view_to_model())
+        self.assertEqual([[], []], [child.children for child in children_view.children])
+        self.assertEqual([], controller.restore({'Tree': {'value': 0, 'children': [{'value': 0, 'children': []}] * 2}}))
+        self.assertEqual([[], []], [child.children for child in children_view.children])
+
+        # Elements of a recursive type are only created when they are realized
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Node'])
+        next_view = {child.type_info.name: child for child in view.children}['next']
+        self.assertTrue(next_view.type_info.recursive)
+        self.assertEqual([], next_view.children)
+        self.assertEqual(['value', 'next'], [child.type_info.name for child in next_view.realize().children])
+        self.assertIs(next_view.realize(), next_view.realize())
+
+        # A type without an end cannot be converted into a model
+        with self.assertRaisesRegex(Exception, r'next in Node\.next\.next has no end'):
+            controller.view_to_model()
+
+    def test_default_time(self):
+        spec = '''
+        Times DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+        Log ::= SEQUENCE { time GeneralizedTime, entries SEQUENCE OF Log }
+        END
+        '''
+        description = TypeDescription.compile_dict(asn1tools.parse_string(spec))['Times']
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Log'])
+        entries_view = {child.type_info.name: child for child in view.children}['entries']
+        entries_view.change_value('1')
+
+        # The default time of elements that were not built yet is the time at which the model is read
+        with patch('asn1editor.controller.ControllerFactory.datetime') as datetime_mock:
+            for now in [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)]:
+                datetime_mock.datetime.now.return_value = now
+                self.assertEqual([{'time': now, 'entries': []}], controller.view_to_model()['Log']['entries'])
+        self.assertEqual([[]], [child.children for child in entries_view.children])
+
+    def test_maximum_depth(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(RECURSIVE_SPEC))['Recursive']
+
+        tree = {'value': 0, 'children': []}
+        for i in range(1, 1000):
+            tree = {'value': i, 'children': [tree]}
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Tree'])
+        with self.assertRaisesRegex(Exception, r'in Tree(\.children\.Element 0)+\.children exceeds the maximum depth of 300'):
+            controller.model_to_view({'Tree': tree})
+
+        # The maximum depth can be changed
+        tree = {'value': 0, 'children': []}
+        for i in range(1, 10):
+            tree = {'value': i, 'children': [tree]}
+        ViewControllerFactory.MAX_DEPTH = 10
+        try:
+            view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Tree'])
+            with self.assertRaisesRegex(Exception, 'exceeds the maximum depth of 10'):
+                controller.model_to_view({'Tree': tree})
+        finally:
+            ViewControllerFactory.MAX_DEPTH = 300
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description['Tree'])
+        controller.model_to_view({'Tree': tree})
+        self.assertEqual({'Tree': tree}, controller.view_to_model())
+
+    def test_without_wx(self):
+        code = "import sys; import asn1editor; from asn1editor.ASN1SpecHandler import ASN1SpecHandler; assert 'wx' not in sys.modules"
+        subprocess.run([sys.executable, '-c', code], check=True)
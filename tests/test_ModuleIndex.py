@@ -0,0 +1,63 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.ModuleIndex import ModuleIndex
+
+
+class TestModuleIndex(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __write(self, file_name: str, content: str) -> str:
+        file_name = os.path.join(self.temp_dir.name, file_name)
+        with open(file_name, 'w') as f:
+            f.write(content)
+        return file_name
+
+    def test_scan_file(self):
+        modules = ModuleIndex.scan_file('tests/standards/rrc_8_6_0.asn')
+        self.assertEqual(['EUTRA-RRC-Definitions', 'EUTRA-UE-Variables', 'EUTRA-InterNodeDefinitions'], [m.name for m in modules])
+        self.assertEqual([], modules[0].imports)
+        self.assertEqual(['EUTRA-RRC-Definitions'], modules[1].imports)
+        self.assertIn('DL-DCCH-Message', modules[0].types)
+        self.assertIn('VarMeasConfig', modules[1].types)
+
+        modules = ModuleIndex.scan_file('tests/standards/rfc5280.asn')
+        self.assertEqual(['PKIX1Explicit88', 'PKIX1Implicit88'], [m.name for m in modules])
+        self.assertEqual(['PKIX1Explicit88'], modules[1].imports)
+
+    def test_single_line_module(self):
+        # Type assignments do not have to start a line, values and classes are not part of the type assignments
+        file_name = self.__write('compact.asn', 'Compact DEFINITIONS AUTOMATIC TAGS ::= BEGIN A ::= INTEGER maxB INTEGER ::= 5 B ::= SEQUENCE { a A, '
+                                                'b INTEGER (0..maxB) } C ::= SEQUENCE OF B D ::= CHOICE { b B, c C } E ::= BOOLEAN END')
+        self.assertEqual(['A', 'B', 'C', 'D', 'E'], ModuleIndex.scan_file(file_name)[0].types)
+
+        asn1_spec_handler = ASN1SpecHandler(file_name)
+        self.assertEqual(asn1_spec_handler.get_types(), asn1_spec_handler.get_type_names())
+        asn1_spec_handler.close()
+
+    def test_resolve(self):
+        first = self.__write('first.asn', 'First DEFINITIONS ::= BEGIN IMPORTS B FROM Second; A ::= B END')
+        second = self.__write('other_name.asn', 'Second { 1 2 } -- comment ; -- DEFINITIONS ::= BEGIN\n'
+                                                'IMPORTS C FROM Third {1 2 3}; B ::= C END')
+        third = self.__write('third.asn', 'Third DEFINITIONS ::= BEGIN C ::= INTEGER END')
+        self.__write('first_unrelated.asn', 'Unrelated DEFINITIONS ::= BEGIN D ::= INTEGER END')
+
+        index = ModuleIndex.get(self.temp_dir.name)
+        self.assertEqual([first, second, third], index.resolve(first))
+        self.assertEqual([third], index.resolve(third))
+        self.assertEqual(second, index.find_file('Second'))
+        self.assertIsNone(index.find_file('Missing'))
+
+        # Modified files are scanned again
+        time.sleep(0.01)
+        self.__write('third.asn', 'Third DEFINITIONS ::= BEGIN IMPORTS D FROM Unrelated; C ::= D END')
+        os.utime(third, (time.time() + 10, time.time() + 10))
+        index = ModuleIndex.get(self.temp_dir.name)
+        self.assertEqual(4, len(index.resolve(first)))
@@ -0,0 +1,77 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.SpecCache import SpecCache
+
+
+class TestSpecCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_key(self):
+        cache = SpecCache(self.cache_dir)
+        key = cache.get_key(['example/example.asn'], 'oer')
+        self.assertEqual(key, cache.get_key(['example/example.asn'], 'oer'))
+        self.assertNotEqual(key, cache.get_key(['example/example.asn'], 'jer'))
+
+        spec_file = os.path.join(self.temp_dir.name, 'spec.asn')
+        with open(spec_file, 'w') as f:
+            f.write('A')
+        key = cache.get_key([spec_file], 'oer')
+        with open(spec_file, 'w') as f:
+            f.write('B')
+        self.assertNotEqual(key, cache.get_key([spec_file], 'oer'))
+
+    def test_load_store(self):
+        cache = SpecCache(self.cache_dir)
+        key = cache.get_key(['example/example.asn'], 'oer')
+        self.assertIsNone(cache.load(key))
+
+        cache.store(key, {'test': 1})
+        self.assertEqual(cache.load(key), {'test': 1})
+
+        # Corrupt entries are ignored and removed
+        with open(os.path.join(self.cache_dir, key + SpecCache.EXTENSION), 'wb') as f:
+            f.write(b'corrupt')
+        self.assertIsNone(cache.load(key))
+        self.assertEqual(cache.get_size(), 0)
+
+    def test_invalidate(self):
+        cache = SpecCache(self.cache_dir)
+        key = cache.get_key(['example/example.asn'], 'oer')
+        other_key = cache.get_key(['tests/standards/rfc1155.asn'], 'oer')
+        cache.store(key, 1)
+        cache.store(other_key, 2)
+
+        cache.invalidate(['example/example.asn'])
+        self.assertIsNone(cache.load(key))
+        self.assertEqual(cache.load(other_key), 2)
+
+        cache.invalidate()
+        self.assertIsNone(cache.load(other_key))
+
+    def test_eviction(self):
+        cache = SpecCache(self.cache_dir, max_size=1500)
+        cache.store('first', b'1' * 1000)
+        os.utime(os.path.join(self.cache_dir, 'first' + SpecCache.EXTENSION), (0, 0))
+        cache.store('second', b'2' * 1000)
+
+        self.assertIsNone(cache.load('first'))
+        self.assertEqual(cache.load('second'), b'2' * 1000)
+
+    def test_spec_handler(self):
+        cache = SpecCache(self.cache_dir)
+        asn1_spec_handler = ASN1SpecHandler(['example/example.asn'], cache)
+        compiled = asn1_spec_handler.get_compiled('jer')
+        self.assertGreater(cache.get_size(), 0)
+
+        asn1_spec_handler = ASN1SpecHandler(['example/example.asn'], cache)
+        cached = asn1_spec_handler.get_compiled('jer')
+        self.assertIsNot(compiled, cached)
+        self.assertEqual(sorted(compiled.types.keys()), sorted(cached.types.keys()))
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from asn1editor.SpecWorkspace import SpecWorkspace
+
+
+class TestSpecWorkspace(TestCase):
+    def test_get(self):
+        workspace = SpecWorkspace()
+        example = workspace.get('example/example.asn')
+        rfc1157 = workspace.get('tests/standards/rfc1157.asn')
+        self.assertIsNot(example, rfc1157)
+
+        self.assertIs(example, workspace.get('example/example.asn'))
+        self.assertEqual([example, rfc1157], workspace.get_handlers())
+        # Imported files are part of the loaded spec
+        self.assertIs(rfc1157, workspace.get('tests/standards/rfc1155.asn'))
+        self.assertIsNot(rfc1157, workspace.get('tests/standards/rfc1157.asn', compile_type_only=True))
+
+        workspace.close()
+        self.assertEqual([], workspace.get_handlers())
+
+    def test_memory_budget(self):
+        workspace = SpecWorkspace(max_memory=0)
+        example = workspace.get('example/example.asn')
+        example.get_compiled('jer')
+        memory_usage = example.get_memory_usage()
+        self.assertEqual(['parsed', 'jer'], list(memory_usage.keys()))
+        self.assertTrue(all(size > 0 for size in memory_usage.values()))
+        self.assertIs(memory_usage, example.get_memory_usage())
+
+        # The most recently used handler is kept even if it exceeds the budget
+        rfc1157 = workspace.get('tests/standards/rfc1157.asn')
+        self.assertEqual([rfc1157], workspace.get_handlers())
+
+        workspace = SpecWorkspace(max_memory=1024 * 1024 * 1024)
+        example = workspace.get('example/example.asn')
+        example.get_compiled('jer')
+        workspace.get('tests/standards/rfc1157.asn').get_compiled('jer')
+        self.assertGreater(workspace.get_memory_usage(), sum(example.get_memory_usage().values()))
+        self.assertIs(example, workspace.get('example/example.asn'))
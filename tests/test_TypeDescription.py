@@ -0,0 +1,85 @@
+import pickle
+from unittest import TestCase
+
+import asn1tools
+
+from asn1editor import TypeDescription
+
+RECURSIVE_SPEC = '''
+Recursive DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+Node ::= SEQUENCE { value INTEGER, next Node OPTIONAL, children SEQUENCE OF Node }
+Tree ::= CHOICE { a Tree, b SEQUENCE { c Tree }, leaf INTEGER, list SEQUENCE OF Tree }
+END
+'''
+
+STRINGS_SPEC = '''
+Strings DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+Strings ::= SEQUENCE {
+    utf8 UTF8String, visible VisibleString, general GeneralString, ia5 IA5String, teletex TeletexString, numeric NumericString,
+    printable PrintableString, bmp BMPString, graphic GraphicString, universal UniversalString
+}
+END
+'''
+
+
+class TestTypeDescription(TestCase):
+    def test_example(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_files('example/example.asn'))
+        sequence = description['EXAMPLE']['Sequence']
+        self.assertIsInstance(sequence, TypeDescription.Sequence)
+        self.assertEqual(['additional', 'additionalOptional'], [m.name for m in sequence.additions])
+        self.assertTrue(all(m.additional for m in sequence.additions))
+        self.assertFalse(any(m.additional for m in sequence.root_members))
+
+        members = {m.name: m for m in sequence.root_members}
+        self.assertEqual((0, 15), (members['visibleString'].minimum, members['visibleString'].maximum))
+        self.assertEqual((3, 3), (members['stringList'].minimum, members['stringList'].maximum))
+        self.assertEqual(('MIN', 'MAX'), (members['realExample'].minimum, members['realExample'].maximum))
+        self.assertEqual(['enum1', 'enum2'], members['enumerated'].values)
+        self.assertEqual(24, members['bitString'].number_of_bits)
+        self.assertEqual(b'\x8a', members['octetString'].tag)
+        self.assertEqual('abcd', members['octetString'].default)
+        self.assertIsInstance(members['choiceExample'], TypeDescription.Choice)
+        self.assertEqual('exampleInt', members['choiceExample'].initial_member)
+        self.assertEqual('enum1', members['enumerated'].initial_value)
+        self.assertFalse(any(m.additional for m in members['choiceExample'].members))
+
+        sub_sequence = description['EXAMPLE']['SubSequence']
+        self.assertIsInstance(sub_sequence, TypeDescription.Set)
+        self.assertEqual((-100, 300), (sub_sequence.root_members[1].minimum, sub_sequence.root_members[1].maximum))
+
+    def test_recursive(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(RECURSIVE_SPEC))
+        node = description['Recursive']['Node']
+        recursive = node.root_members[1]
+        self.assertIsInstance(recursive, TypeDescription.Recursive)
+        self.assertIs(recursive.inner.root_members[1], recursive)
+
+        resolved = recursive.resolve()
+        self.assertIsInstance(resolved, TypeDescription.Sequence)
+        self.assertEqual('next', resolved.name)
+        self.assertTrue(resolved.optional)
+        self.assertTrue(resolved.recursive)
+        self.assertFalse(node.recursive)
+        self.assertEqual('Node', node.name)
+        self.assertFalse(node.optional)
+
+        # References are resolved once, as long as the properties of the reference are not changed
+        self.assertIs(resolved, recursive.resolve())
+        recursive.optional = False
+        self.assertFalse(recursive.resolve().optional)
+        recursive.optional = True
+
+        # Alternatives that contain the CHOICE itself are not selected for new elements
+        self.assertEqual('leaf', description['Recursive']['Tree'].initial_member)
+
+        unpickled = pickle.loads(pickle.dumps(description))
+        self.assertIs(unpickled['Recursive']['Node'].root_members[2].element_type.inner, unpickled['Recursive']['Node'].root_members[1].inner)
+
+    def test_string_tags(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(STRINGS_SPEC))
+        strings = description['Strings']['Strings']
+        # The universal tags of the string types
+        self.assertEqual({'utf8': 12, 'visible': 26, 'general': 27, 'ia5': 22, 'teletex': 20, 'numeric': 18, 'printable': 19, 'bmp': 30, 'graphic': 25,
+                          'universal': 28}, {m.name: type(m).TAG for m in strings.root_members})
+        self.assertEqual(b'\x19', TypeDescription.GraphicString('graphic', 'GraphicString').tag)
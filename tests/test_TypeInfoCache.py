@@ -0,0 +1,95 @@
+import gc
+import typing
+from unittest import TestCase
+
+import asn1tools
+
+from asn1editor import MemoryViewFactory, TypeAugmenter, TypeDescription
+from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.TypeInfoCache import TypeInfoCache
+from asn1editor.ViewControllerFactory import ViewControllerFactory
+from asn1editor.view.AbstractViewFactory import Styles
+
+LIST_SPEC = '''
+List DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+Items ::= SEQUENCE OF Item
+Item ::= SEQUENCE { value INTEGER, sub SEQUENCE { value INTEGER OPTIONAL, list SEQUENCE OF INTEGER } OPTIONAL }
+END
+'''
+
+
+class CountingAugmenter(TypeAugmenter):
+    def __init__(self):
+        self.paths = []
+
+    def set_spec_filename(self, spec_filename: str):
+        pass
+
+    def get_help(self, path: str) -> typing.Optional[str]:
+        return None
+
+    def get_style(self, path: str) -> Styles:
+        self.paths.append(path)
+        return Styles(0)
+
+
+class TypeInfoCacheTest(TestCase):
+    def test_shared_type_info(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), None)
+        children = {child.type_info.name: child for child in view.children}
+        children['optionalSequenceOf'].change_has_value(True)
+        list_view = children['optionalSequenceOf'].view
+        list_view.change_value('2')
+
+        first, second = list_view.children
+        self.assertEqual(['Element 0', 'Element 1'], [first.type_info.name, second.type_info.name])
+        self.assertEqual(['member1', 'member2', 'enumerated'], [child.type_info.name for child in first.children])
+        for a, b in zip(first.children, second.children):
+            self.assertIs(a.type_info, b.type_info)
+
+        # Recreated elements and views of another controller use the same TypeInfo
+        list_view.change_value('0')
+        list_view.change_value('2')
+        self.assertIs(first.type_info, list_view.children[0].type_info)
+        other_view, _ = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), None)
+        self.assertIs(view.type_info, other_view.type_info)
+
+    def test_augmenter(self):
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        augmenter = CountingAugmenter()
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), augmenter)
+        list_view = {child.type_info.name: child for child in view.children}['choiceExample'].view
+        self.assertIn('Sequence.choiceExample.exampleList.Element 3', augmenter.paths)
+
+        # Every path is only styled once, but elements of different paths are styled separately
+        paths = list(augmenter.paths)
+        list_view.change_value('0')
+        list_view.change_value('4')
+        self.assertEqual(paths, augmenter.paths)
+        self.assertIsNot(list_view.children[0].type_info, list_view.children[1].type_info)
+
+        augmenter = CountingAugmenter()
+        asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', MemoryViewFactory(), augmenter)
+        self.assertEqual(paths, augmenter.paths)
+
+    def test_rebuilt_list(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(LIST_SPEC))['List']
+        cache = TypeInfoCache(None)
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None, cache).create(description['Items'])
+
+        sizes = []
+        for _ in range(3):
+            view.change_value('0')
+            view.change_value('50')
+            for element in view.children:
+                sub = {child.type_info.name: child for child in element.children}['sub']
+                sub.change_has_value(True)
+                {child.type_info.name: child for child in sub.view.children}['value'].change_has_value(True)
+            sizes.append(len(cache))
+        self.assertEqual([sizes[0]] * 3, sizes)
+
+        # Entries of descriptions that no longer exist are removed
+        del description, view, controller, element, sub
+        gc.collect()
+        self.assertEqual(0, len(cache))
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+import asn1tools
+
+from asn1editor import TypeDescription, MemoryViewFactory
+from asn1editor.TypeRegistry import TypeRegistry
+from asn1editor.ViewControllerFactory import ViewControllerFactory
+from asn1editor.controller.ControllerFactory import ControllerFactory
+
+SPEC = '''
+Test DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+Test ::= SEQUENCE { numeric NumericString (SIZE(2..8)), printable PrintableString OPTIONAL }
+END
+'''
+
+
+class TypeRegistryTest(TestCase):
+    def test_registry(self):
+        registry = TypeRegistry({TypeDescription.Type: 'type', TypeDescription.String: 'string'})
+        self.assertEqual('string', registry.get(TypeDescription.UTF8String))
+        self.assertEqual('type', registry.get(TypeDescription.NumericString))
+        self.assertIsNone(TypeRegistry().get(TypeDescription.Integer))
+
+        registry.register(TypeDescription.Unsupported, 'unsupported')
+        self.assertEqual('unsupported', registry.get(TypeDescription.NumericString))
+        registry.register(TypeDescription.NumericString, 'numeric')
+        self.assertEqual('numeric', registry.get(TypeDescription.NumericString))
+        self.assertEqual('unsupported', registry.get(TypeDescription.PrintableString))
+        self.assertEqual('type', registry.get(TypeDescription.Integer))
+
+    def test_plugin_type(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(SPEC))['Test']['Test']
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description)
+        self.assertEqual(['UNSUPPORTED: NumericString(numeric)', 'UNSUPPORTED: PrintableString(printable)'],
+                         [child.type_info.typename for child in view.children])
+        self.assertEqual({'Test': {}}, controller.view_to_model())
+
+        # A plugin edits NumericStrings like other strings
+        ViewControllerFactory.BUILDERS.register(TypeDescription.NumericString, ViewControllerFactory.BUILDERS.get(TypeDescription.VisibleString))
+        ControllerFactory.CONVERTERS.register(TypeDescription.NumericString, ControllerFactory.CONVERTERS.get(TypeDescription.VisibleString))
+        self.addCleanup(ViewControllerFactory.BUILDERS.register, TypeDescription.NumericString, ViewControllerFactory.BUILDERS.get(TypeDescription.Type))
+        self.addCleanup(ControllerFactory.CONVERTERS.register, TypeDescription.NumericString, None)
+
+        view, controller = ViewControllerFactory(MemoryViewFactory(), None).create(description)
+        self.assertEqual('NumericString', view.children[0].type_info.typename)
+        self.assertEqual({'Test': {'numeric': '  '}}, controller.view_to_model())
+        controller.model_to_view({'Test': {'numeric': '1234'}})
+        self.assertEqual({'Test': {'numeric': '1234'}}, controller.view_to_model())
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+import wx
+
+from asn1editor.ASN1SpecHandler import ASN1SpecHandler
+from asn1editor.wxPython.Labels import Labels
+from asn1editor.wxPython.ViewSelect import TagInfo
+from asn1editor.wxPython.WxPythonViewFactory import WxPythonViewFactory
+from asn1editor.wxPython.views.WxPythonChoiceView import WxPythonChoiceView
+from asn1editor.wxPython.views.WxPythonView import WxPythonView
+from tests import TestHelper
+
+
+class ViewSelect:
+    tag_info = TagInfo.TOOLTIPS
+
+
+class WxPythonChoiceViewTest(TestCase):
+    def setUp(self) -> None:
+        # noinspection PyUnusedLocal
+        self.app = TestHelper.get_wx_app()
+        self.frame = wx.Frame(None)
+        self.structure_changed = WxPythonView.structure_changed
+        WxPythonView.structure_changed = lambda view: None
+
+    def tearDown(self) -> None:
+        WxPythonView.structure_changed = self.structure_changed
+        self.frame.Destroy()
+
+    def test_destroy_kept_views(self):
+        window = wx.ScrolledWindow(self.frame)
+        asn1_spec_handler = ASN1SpecHandler('example/example.asn')
+        view, controller = asn1_spec_handler.create_view_controller_for_type('EXAMPLE.Sequence', WxPythonViewFactory(window, Labels(ViewSelect())), None)
+        choice_view = next(child for child in view.realize().get_children() if child.get_type_info().name == 'choiceExample')
+        self.assertIsInstance(choice_view, WxPythonChoiceView)
+
+        selected_views = [choice_view.get_view()]
+        for value in [('exampleInt', 1), ('sequence', {'member1': 1, 'member2': 2})]:
+            model = controller.view_to_model()
+            model['Sequence']['choiceExample'] = value
+            controller.model_to_view(model)
+            selected_views.append(choice_view.get_view())
+        self.assertEqual(3, len(set(selected_views)))
+
+        destroyed = []
+        for selected_view in selected_views:
+            selected_view.destroy = lambda v=selected_view: destroyed.append(v)
+
+        # The views of the deselected elements are destroyed together with the choice
+        choice_view.destroy()
+        self.assertCountEqual(selected_views, destroyed)
@@ -0,0 +1,96 @@
+import contextlib
+from unittest import TestCase
+
+import asn1tools
+import wx
+
+from asn1editor import TypeDescription
+from asn1editor.ViewControllerFactory import ViewControllerFactory
+from asn1editor.wxPython.Labels import Labels
+from asn1editor.wxPython.ViewSelect import TagInfo
+from asn1editor.wxPython.WxPythonViewFactory import WxPythonViewFactory
+from asn1editor.wxPython.views.WxPythonView import WxPythonView
+from tests import TestHelper
+
+LIST_SPEC = '''
+Lists DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+Lists ::= SEQUENCE { numbers SEQUENCE (SIZE(0..50)) OF SEQUENCE { value INTEGER, text UTF8String OPTIONAL } }
+Values ::= SEQUENCE { values SEQUENCE OF INTEGER }
+END
+'''
+
+
+class ViewSelect:
+    tag_info = TagInfo.TOOLTIPS
+
+
+class WxPythonListViewTest(TestCase):
+    def setUp(self) -> None:
+        # noinspection PyUnusedLocal
+        self.app = TestHelper.get_wx_app()
+        self.frame = wx.Frame(None)
+        self.suspended = 0
+        self.layouts = 0
+        self.structure_changed = WxPythonView.structure_changed
+        WxPythonView.structure_changed = lambda view: self.__structure_changed()
+
+    def tearDown(self) -> None:
+        WxPythonView.structure_changed = self.structure_changed
+        self.frame.Destroy()
+
+    def __structure_changed(self):
+        if not self.suspended:
+            self.layouts += 1
+
+    @contextlib.contextmanager
+    def __suspend_layout(self):
+        self.suspended += 1
+        try:
+            yield
+        finally:
+            self.suspended -= 1
+
+    def test_single_layout(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(LIST_SPEC))['Lists']
+        window = wx.ScrolledWindow(self.frame)
+        view_factory = WxPythonViewFactory(window, Labels(ViewSelect()), suspend_layout=self.__suspend_layout)
+        view, controller = ViewControllerFactory(view_factory, None).create(description['Lists'])
+        list_view = view.realize().get_children()[0]
+        self.layouts = 0
+
+        # Growing the list from 0 to 50 elements updates the layout once
+        numbers = [{'value': i} for i in range(50)]
+        controller.model_to_view({'Lists': {'numbers': numbers}})
+        self.assertEqual(50, len(list_view.get_children()))
+        self.assertEqual(1, self.layouts)
+        self.assertEqual({'Lists': {'numbers': numbers}}, controller.view_to_model())
+
+        # Shrinking the list as well
+        controller.model_to_view({'Lists': {'numbers': []}})
+        self.assertEqual(0, len(list_view.get_children()))
+        self.assertEqual(2, self.layouts)
+
+        # Unchanged lists do not update the layout
+        controller.model_to_view({'Lists': {'numbers': []}})
+        self.assertEqual(2, self.layouts)
+        self.assertEqual(0, self.suspended)
+
+    def test_page_controls(self):
+        description = TypeDescription.compile_dict(asn1tools.parse_string(LIST_SPEC))['Lists']
+        window = wx.ScrolledWindow(self.frame)
+        view_factory = WxPythonViewFactory(window, Labels(ViewSelect()), suspend_layout=self.__suspend_layout)
+        view, controller = ViewControllerFactory(view_factory, None).create(description['Values'])
+        list_view = view.realize().get_children()[0]
+
+        # Lists without a size limit only show the page controls if the elements do not fit on one page
+        controller.model_to_view({'Values': {'values': list(range(50))}})
+        self.assertEqual(50, len(list_view.get_children()))
+        self.assertFalse(list_view._controls['page'].IsShown())
+
+        controller.model_to_view({'Values': {'values': list(range(250))}})
+        self.assertEqual(WxPythonViewFactory.LIST_PAGE_SIZE, len(list_view.get_children()))
+        self.assertTrue(list_view._controls['page'].IsShown())
+        self.assertEqual({'Values': {'values': list(range(250))}}, controller.view_to_model())
+
+        controller.model_to_view({'Values': {'values': list(range(50))}})
+        self.assertFalse(list_view._controls['page'].IsShown())